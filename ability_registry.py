@@ -0,0 +1,164 @@
+"""
+Ability Registry
+
+This module compiles each ability's level-scaling lambda into a lookup table
+over the valid level range, so scaled ability power is an array index at run
+time. It also checks mana and cooldown for a whole population in one pass.
+"""
+
+from array import array
+from operator import index
+
+MAX_LEVEL = 50
+
+
+class Ability:
+    """
+    A registered ability with its compiled power table.
+
+    Attributes:
+        name (str): Ability name
+        mana_cost (float): Mana needed to cast
+        cooldown (float): Seconds before the ability can be cast again
+        power_table (array): Scaled power indexed by level; index 0 is unused
+    """
+
+    __slots__ = ("name", "mana_cost", "cooldown", "scaling", "power_table")
+
+    def __init__(self, name, mana_cost, cooldown, scaling, power_table):
+        self.name = name
+        self.mana_cost = mana_cost
+        self.cooldown = cooldown
+        self.scaling = scaling
+        self.power_table = power_table
+
+    def __repr__(self):
+        return f"Ability({self.name!r}, mana_cost={self.mana_cost}, cooldown={self.cooldown})"
+
+
+def _no_cooldown(player, ability_name):
+    """Default readiness check: the player's own cooldowns dict, if any."""
+    cooldowns = player.get("cooldowns")
+    return not cooldowns or cooldowns.get(ability_name, 0) <= 0
+
+
+class AbilityRegistry:
+    """Abilities keyed by name, each with a precomputed level-scaling table."""
+
+    def __init__(self, max_level=MAX_LEVEL):
+        """
+        Create an empty registry.
+
+        Args:
+            max_level (int): Highest level covered by the scaling tables
+        """
+        if not isinstance(max_level, int) or max_level < 1:
+            raise ValueError("max_level must be a positive integer")
+        self.max_level = max_level
+        self._abilities = {}
+
+    def __contains__(self, name):
+        return name in self._abilities
+
+    def __iter__(self):
+        return iter(self._abilities.values())
+
+    def register(self, name, scaling, mana_cost=0, cooldown=0):
+        """
+        Register an ability and compile its scaling lambda.
+
+        Args:
+            name (str): Ability name
+            scaling (callable): Function from level to ability power
+            mana_cost (float): Mana needed to cast
+            cooldown (float): Seconds before the ability can be cast again
+
+        Returns:
+            Ability: The registered ability
+
+        Raises:
+            ValueError: If the name is already registered
+        """
+        if name in self._abilities:
+            raise ValueError(f"ability already registered: {name!r}")
+        power_table = array("d", [0.0])
+        power_table.extend(map(scaling, range(1, self.max_level + 1)))
+        ability = Ability(name, mana_cost, cooldown, scaling, power_table)
+        self._abilities[name] = ability
+        return ability
+
+    def get(self, name):
+        """
+        Return a registered ability.
+
+        Raises:
+            KeyError: If the ability is not registered
+        """
+        return self._abilities[name]
+
+    def _check_level(self, level):
+        """Return level as an int, rejecting non-integers and levels out of range."""
+        try:
+            level = index(level)
+        except TypeError:
+            raise ValueError(f"level must be an integer, got {level!r}") from None
+        if not 1 <= level <= self.max_level:
+            raise ValueError(f"level must be between 1 and {self.max_level}, got {level}")
+        return level
+
+    def power(self, name, level):
+        """
+        Return an ability's scaled power at a level.
+
+        Raises:
+            ValueError: If level is not an integer between 1 and max_level
+        """
+        return self._abilities[name].power_table[self._check_level(level)]
+
+    def power_batch(self, name, levels):
+        """
+        Return an ability's scaled power for many levels.
+
+        Args:
+            name (str): Ability name
+            levels (iterable): Integer levels between 1 and max_level
+
+        Returns:
+            array: Power per level, in input order
+
+        Raises:
+            ValueError: If any level is not an integer between 1 and max_level
+        """
+        table = self._abilities[name].power_table
+        levels = levels if isinstance(levels, (list, tuple, array)) else list(levels)
+        try:
+            if levels:
+                self._check_level(min(levels))
+                self._check_level(max(levels))
+            return array("d", map(table.__getitem__, levels))
+        except TypeError:
+            raise ValueError("levels must be integers") from None
+
+    def usable_mask(self, players, ability, is_ready=None):
+        """
+        Check which players can cast an ability right now.
+
+        Args:
+            players (sequence): Player dictionaries with a mana value
+            ability (str): Ability name
+            is_ready (callable): Optional (player, ability_name) -> bool
+                cooldown check; by default a player's "cooldowns" dict of
+                remaining seconds is consulted
+
+        Returns:
+            int: Bitmask with bit i set when player i can cast the ability
+        """
+        spec = self._abilities[ability]
+        if is_ready is None:
+            is_ready = _no_cooldown
+        cost = spec.mana_cost
+        bits = bytearray((len(players) + 7) // 8)
+        for row, player in enumerate(players):
+            if player["mana"] >= cost and is_ready(player, ability):
+                bits[row >> 3] |= 1 << (row & 7)
+        return int.from_bytes(bits, "little")
@@ -0,0 +1,248 @@
+"""
+Benchmark Suite for the Game Development Utility System
+
+This module times every demonstrate_* operation and its batch or indexed
+counterpart over synthetic data of increasing size, and saves the timings as
+JSON so runs from different releases can be compared.
+
+Usage:
+    python benchmark.py --sizes 100 1000 10000 --output bench.json
+    python benchmark.py --compare bench.json --threshold 1.25
+"""
+
+import argparse
+import json
+import platform
+import random
+import sys
+import time
+from array import array
+from functools import lru_cache, partial
+
+import skeleton
+from ability_registry import AbilityRegistry
+from broad_phase import candidate_pairs
+from data_generators import (
+    iter_players, iter_entities, iter_items, iter_coordinates,
+    entity_table, player_column_buffers, coordinate_buffer,
+)
+from formula_engine import FormulaEngine
+from inventory_index import InventoryIndex
+from path_math import path_lengths
+from player_batch import compute_player_stats
+from progression import ProgressionTable, apply_xp, default_curve
+from reporting import format_report
+from sort_keys import ITEM_SORT_SPECS
+from spatial_index import SpatialGrid
+
+DEFAULT_SIZES = (100, 1000, 10000)
+
+
+def build_cases(size, seed):
+    """
+    Describe the benchmark cases for one data size.
+
+    Fixtures are built on first use and shared between the cases of this
+    size, so running a subset of cases only generates the data it needs.
+
+    Returns:
+        list: (case_name, setup) pairs; setup() builds the case's fixtures and
+            returns the callable to time, which takes no arguments
+    """
+    @lru_cache(maxsize=None)
+    def players():
+        return list(iter_players(size, seed))
+
+    @lru_cache(maxsize=None)
+    def combat_players():
+        # The combat demonstration pairs every player with nearby entities, so
+        # keep its player count small enough for the pair count to stay linear.
+        return players()[:100]
+
+    @lru_cache(maxsize=None)
+    def entities():
+        return list(iter_entities(size, seed + 1))
+
+    @lru_cache(maxsize=None)
+    def inventory():
+        return list(iter_items(size, seed + 2))
+
+    @lru_cache(maxsize=None)
+    def coordinates():
+        return list(iter_coordinates(size, seed + 3))
+
+    @lru_cache(maxsize=None)
+    def columns():
+        return player_column_buffers(size, seed)
+
+    @lru_cache(maxsize=None)
+    def grid():
+        return SpatialGrid.from_entities(entities())
+
+    @lru_cache(maxsize=None)
+    def table():
+        return entity_table(size, seed + 1)
+
+    @lru_cache(maxsize=None)
+    def index():
+        return InventoryIndex(inventory())
+
+    @lru_cache(maxsize=None)
+    def buffer():
+        return coordinate_buffer(size, seed + 3)
+
+    @lru_cache(maxsize=None)
+    def progression():
+        return ProgressionTable.from_players(players(), curve)
+
+    @lru_cache(maxsize=None)
+    def xp_deltas():
+        rng = random.Random(seed + 4)
+        return [rng.randint(0, 5000) for _ in range(size)]
+
+    @lru_cache(maxsize=None)
+    def xp_totals():
+        rng = random.Random(seed + 5)
+        return [rng.uniform(0, curve.thresholds[-1]) for _ in range(size)]
+
+    @lru_cache(maxsize=None)
+    def reports():
+        return [skeleton.demonstrate_player_transformations(players(), quiet=True),
+                skeleton.demonstrate_item_sorting(inventory(), quiet=True)]
+
+    engine = FormulaEngine.with_game_formulas()
+    registry = AbilityRegistry()
+    registry.register("Fireball", lambda level: 20 + level * 4.5, mana_cost=30, cooldown=3)
+    curve = default_curve()
+
+    def fresh_progression(table):
+        # apply_xp works in place; copy the columns so every run grants the same XP.
+        return ProgressionTable(curve, array("H", table.levels), array("d", table.xp),
+                                array("d", table.health), array("d", table.mana))
+
+    def bind(func, *fixtures, **kwargs):
+        # Resolve fixtures when the case is set up, outside the timed call.
+        return lambda: partial(func, *(fixture() for fixture in fixtures), **kwargs)
+
+    def demo(func, *fixtures):
+        # Reports are not rendered here; render.format_report times that.
+        return bind(func, *fixtures, quiet=True)
+
+    return [
+        ("demonstrate_player_transformations", demo(skeleton.demonstrate_player_transformations, players)),
+        ("batch.compute_player_stats", bind(lambda columns: compute_player_stats(
+            columns["level"], columns["health"], columns["mana"], columns["score"]), columns)),
+        ("demonstrate_entity_filtering", demo(skeleton.demonstrate_entity_filtering, entities)),
+        ("indexed.grid_radius_query", bind(lambda grid: grid.query_radius(500, 500, 100), grid)),
+        ("indexed.entity_table_masks", bind(lambda table: table.count(table.type_mask("enemy") & table.active_mask()),
+                                            table)),
+        ("demonstrate_item_sorting", demo(skeleton.demonstrate_item_sorting, inventory)),
+        ("indexed.inventory_top_20", bind(lambda index: index.top("value", 20), index)),
+        ("batch.sort_spec_type_value_desc", bind(ITEM_SORT_SPECS["type_value_desc"].argsort, inventory)),
+        ("demonstrate_game_calculations", demo(skeleton.demonstrate_game_calculations, coordinates, players)),
+        ("batch.path_lengths", bind(path_lengths, buffer)),
+        ("batch.formula_engine", bind(engine.evaluate_all, players)),
+        ("demonstrate_ability_system", demo(skeleton.demonstrate_ability_system)),
+        ("batch.usable_mask", bind(lambda players: registry.usable_mask(players, "Fireball"), players)),
+        ("demonstrate_combat_system", demo(skeleton.demonstrate_combat_system, combat_players, entities)),
+        ("indexed.combat_candidate_pairs", bind(lambda players, entities, grid: candidate_pairs(
+            players, entities, 120, grid=grid), combat_players, entities, grid)),
+        ("demonstrate_level_system", demo(skeleton.demonstrate_level_system, players)),
+        ("batch.levels_for_xp", bind(curve.levels_for_xp, xp_totals)),
+        ("batch.apply_xp", bind(lambda table, deltas: apply_xp(fresh_progression(table), deltas),
+                                progression, xp_deltas)),
+        ("render.format_report", bind(format_report, reports)),
+    ]
+
+
+def time_call(func, repeat):
+    """Return the best wall-clock time of repeat calls, in seconds."""
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def run_benchmarks(sizes=DEFAULT_SIZES, repeat=3, seed=0, cases=None):
+    """
+    Time every benchmark case at every size.
+
+    Args:
+        sizes (iterable): Record counts to generate
+        repeat (int): Runs per case; the fastest is kept
+        seed (int): Seed for the synthetic data
+        cases (iterable): Optional case names to run; all cases by default
+
+    Returns:
+        dict: JSON-serializable report with environment info and results
+    """
+    selected = set(cases) if cases else None
+    results = []
+    for size in sizes:
+        for name, setup in build_cases(size, seed):
+            if selected is not None and name not in selected:
+                continue
+            results.append({"case": name, "size": size, "seconds": time_call(setup(), repeat)})
+    return {
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "timestamp": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime()),
+        "repeat": repeat,
+        "seed": seed,
+        "results": results,
+    }
+
+
+def find_regressions(baseline, current, threshold=1.25):
+    """
+    Compare two reports.
+
+    Returns:
+        list: (case, size, baseline_seconds, current_seconds) for every case
+            that got slower by more than the threshold factor
+    """
+    previous = {(r["case"], r["size"]): r["seconds"] for r in baseline["results"]}
+    regressions = []
+    for result in current["results"]:
+        before = previous.get((result["case"], result["size"]))
+        if before and result["seconds"] > before * threshold:
+            regressions.append((result["case"], result["size"], before, result["seconds"]))
+    return regressions
+
+
+def main(argv=None):
+    """Command-line entry point."""
+    parser = argparse.ArgumentParser(description="Benchmark the game utility system.")
+    parser.add_argument("--sizes", type=int, nargs="+", default=list(DEFAULT_SIZES),
+                        help="record counts to benchmark (e.g. 100 1000 10000)")
+    parser.add_argument("--repeat", type=int, default=3, help="runs per case; the fastest is kept")
+    parser.add_argument("--seed", type=int, default=0, help="seed for the synthetic data")
+    parser.add_argument("--case", action="append", dest="cases", help="only run this case (repeatable)")
+    parser.add_argument("--output", help="write the JSON report to this file")
+    parser.add_argument("--compare", help="baseline JSON report to check for regressions")
+    parser.add_argument("--threshold", type=float, default=1.25,
+                        help="slowdown factor reported as a regression")
+    args = parser.parse_args(argv)
+
+    report = run_benchmarks(args.sizes, args.repeat, args.seed, args.cases)
+    for result in report["results"]:
+        print(f"{result['case']:<40} {result['size']:>9} {result['seconds'] * 1000:>12.3f} ms")
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as handle:
+            json.dump(report, handle, indent=2)
+
+    if args.compare:
+        with open(args.compare, "r", encoding="utf-8") as handle:
+            baseline = json.load(handle)
+        regressions = find_regressions(baseline, report, args.threshold)
+        for case, size, before, after in regressions:
+            print(f"REGRESSION {case} at {size}: {before * 1000:.3f} ms -> {after * 1000:.3f} ms")
+        if regressions:
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
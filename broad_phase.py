@@ -0,0 +1,49 @@
+"""
+Combat Broad Phase
+
+This module narrows player-versus-entity combat checks to the pairs that are
+actually close to each other. Entities are bucketed in a SpatialGrid whose
+cells match the combat range, so each player only inspects nearby cells
+instead of every entity.
+"""
+
+from spatial_index import SpatialGrid
+
+DEFAULT_PLAYER_POSITION = (100, 100)
+
+
+def player_position(player, default=DEFAULT_PLAYER_POSITION):
+    """Return a player's (x, y) position, falling back to a default."""
+    return player.get("position_x", default[0]), player.get("position_y", default[1])
+
+
+def candidate_pairs(players, entities, combat_range, grid=None, default_position=DEFAULT_PLAYER_POSITION):
+    """
+    Find every player-entity pair within combat range.
+
+    Args:
+        players (iterable): Player dictionaries; position_x/position_y are
+            optional and default to default_position
+        entities (sequence): Entity dictionaries with position_x and position_y
+        combat_range (float): Maximum player-entity distance (inclusive)
+        grid (SpatialGrid): Optional up-to-date grid of the entities, keyed by
+            row index so that entity ids need not be unique or hashable; built
+            with cells the size of the combat range when omitted
+        default_position (tuple): Position used for players without one
+
+    Returns:
+        list: (player, entity, distance) tuples, grouped by player in input
+            order and by entity in input order within each player
+    """
+    if combat_range <= 0:
+        return []
+    if grid is None:
+        grid = SpatialGrid.from_entities(entities, cell_size=combat_range)
+    pairs = []
+    for player in players:
+        px, py = player_position(player, default_position)
+        for row in sorted(grid.query_radius(px, py, combat_range)):
+            entity = entities[row]
+            distance = ((entity["position_x"] - px) ** 2 + (entity["position_y"] - py) ** 2) ** 0.5
+            pairs.append((player, entity, distance))
+    return pairs
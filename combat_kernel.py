@@ -0,0 +1,105 @@
+"""
+Batched Combat Kernel
+
+This module resolves many combat encounters at once. Random numbers for the
+whole batch come from one call to the seeded generator, and hit checks,
+damage and rewards are computed column by column over all encounters, one
+attack round at a time. simulate_encounter in combat_simulation remains the
+reference implementation that this kernel is tested against.
+"""
+
+import random
+from array import array
+from operator import add, ge
+
+from combat_simulation import ROUNDS_PER_ENCOUNTER, hit_chance, attack_damage, kill_reward
+
+_BITS_TABLE = bytes.maketrans(b"\x00\x01", b"01")
+_UNIT = 2.0 ** -53
+
+
+def draw_uniform(rng, count):
+    """
+    Draw count uniform [0, 1) floats from one getrandbits call.
+
+    Args:
+        rng (random.Random): Seeded generator
+        count (int): Number of values
+
+    Returns:
+        array: Float array of length count
+    """
+    if count <= 0:
+        return array("d")
+    words = array("Q", rng.getrandbits(64 * count).to_bytes(8 * count, "little"))
+    # Keep the top 53 bits of each word, as random.random() does.
+    return array("d", map(_UNIT.__mul__, map((11).__rrshift__, words)))
+
+
+def _pack_mask(flags):
+    """Pack a sequence of booleans into an integer bitmask (bit i = flags[i])."""
+    if not flags:
+        return 0
+    return int(bytes(flags)[::-1].translate(_BITS_TABLE), 2)
+
+
+def resolve_encounters(attacker_levels, attacker_manas, defender_levels, defender_healths,
+                       rolls=None, rng=None):
+    """
+    Resolve a batch of encounters with the reference combat rules.
+
+    Args:
+        attacker_levels (sequence): Player level per encounter
+        attacker_manas (sequence): Player mana per encounter
+        defender_levels (sequence): Enemy level per encounter
+        defender_healths (sequence): Enemy health per encounter
+        rolls (sequence): Optional uniform draws, ROUNDS_PER_ENCOUNTER per
+            encounter laid out encounter by encounter; drawn from rng if omitted
+        rng (random.Random or int): Generator or seed used when rolls is omitted
+
+    Returns:
+        dict: hit_masks (one bitmask per round), hits, attacks, damage (per
+            encounter arrays), defeated_mask, rewards (per encounter XP) and
+            total_reward
+
+    Raises:
+        ValueError: If the columns or rolls have inconsistent lengths
+    """
+    count = len(attacker_levels)
+    if not len(attacker_manas) == len(defender_levels) == len(defender_healths) == count:
+        raise ValueError("encounter columns must all have the same length")
+    if rolls is None:
+        if not isinstance(rng, random.Random):
+            rng = random.Random(rng)
+        rolls = draw_uniform(rng, count * ROUNDS_PER_ENCOUNTER)
+    if len(rolls) != count * ROUNDS_PER_ENCOUNTER:
+        raise ValueError(f"expected {ROUNDS_PER_ENCOUNTER} rolls per encounter")
+
+    chance = list(map(hit_chance, attacker_levels, defender_levels))
+    per_hit = list(map(attack_damage, attacker_levels, attacker_manas))
+    healths = list(defender_healths)
+    active = [True] * count
+    hits = [0] * count
+    attacks = [0] * count
+    dealt = [0] * count
+    hit_masks = []
+    for round_index in range(ROUNDS_PER_ENCOUNTER):
+        round_rolls = rolls[round_index::ROUNDS_PER_ENCOUNTER]
+        landed = list(map(lambda fighting, roll, c: fighting and roll < c, active, round_rolls, chance))
+        hit_masks.append(_pack_mask(landed))
+        attacks = list(map(add, attacks, active))
+        hits = list(map(add, hits, landed))
+        dealt = list(map(lambda total, hit, damage: total + damage if hit else total, dealt, landed, per_hit))
+        active = list(map(lambda fighting, total, health: fighting and total < health, active, dealt, healths))
+
+    defeated = list(map(ge, dealt, healths))
+    rewards = array("d", map(lambda won, level: kill_reward(level) if won else 0, defeated, defender_levels))
+    return {
+        "hit_masks": hit_masks,
+        "hits": array("B", hits),
+        "attacks": array("B", attacks),
+        "damage": array("d", dealt),
+        "defeated_mask": _pack_mask(defeated),
+        "rewards": rewards,
+        "total_reward": sum(rewards),
+    }
@@ -0,0 +1,212 @@
+"""
+Batch Combat Simulation
+
+This module runs large numbers of simulated player-versus-enemy encounters
+for balance testing. Encounters are split into fixed-size shards, each with
+its own seeded random generator, and shards run on a process pool. Results
+come back as mergeable summary statistics, so the outcome depends only on
+the seed and never on the number of workers.
+"""
+
+import math
+import random
+from concurrent.futures import ProcessPoolExecutor
+
+from game_rules import (ROUNDS_PER_ENCOUNTER, DEFAULT_ENEMY_LEVEL, DEFAULT_ENEMY_HEALTH,
+                        hit_chance, kill_reward, damage as attack_damage)
+from validation import validate_records, PLAYER_STATS_SCHEMA, ENTITY_SCHEMA
+
+
+def simulate_encounter(attacker, defender, rolls):
+    """
+    Simulate one encounter with the combat rules from game_rules.
+
+    Args:
+        attacker (tuple): (level, mana) of the player
+        defender (tuple): (level, health) of the enemy
+        rolls (iterable): Uniform [0, 1) draws, one consumed per attack round
+
+    Returns:
+        tuple: (hits, attacks, damage, defeated, xp)
+    """
+    level, mana = attacker
+    enemy_level, enemy_health = defender
+    chance = hit_chance(level, enemy_level)
+    hits = attacks = 0
+    dealt = 0
+    rolls = iter(rolls)
+    for _ in range(ROUNDS_PER_ENCOUNTER):
+        attacks += 1
+        if next(rolls) < chance:
+            hits += 1
+            dealt += attack_damage(level, mana)
+        if dealt >= enemy_health:
+            break
+    defeated = dealt >= enemy_health
+    return hits, attacks, dealt, defeated, kill_reward(enemy_level) if defeated else 0
+
+
+class CombatSummary:
+    """
+    Streaming summary statistics over simulated encounters.
+
+    Damage mean and variance use Welford's update and Chan's merge, so shard
+    summaries combine without keeping per-encounter values.
+    """
+
+    __slots__ = ("encounters", "attacks", "hits", "kills", "total_xp",
+                 "damage_mean", "_damage_m2", "damage_min", "damage_max")
+
+    def __init__(self):
+        self.encounters = 0
+        self.attacks = 0
+        self.hits = 0
+        self.kills = 0
+        self.total_xp = 0
+        self.damage_mean = 0.0
+        self._damage_m2 = 0.0
+        self.damage_min = math.inf
+        self.damage_max = -math.inf
+
+    def add(self, hits, attacks, damage, defeated, xp):
+        """Record one encounter outcome."""
+        self.encounters += 1
+        self.attacks += attacks
+        self.hits += hits
+        self.kills += defeated
+        self.total_xp += xp
+        delta = damage - self.damage_mean
+        self.damage_mean += delta / self.encounters
+        self._damage_m2 += delta * (damage - self.damage_mean)
+        if damage < self.damage_min:
+            self.damage_min = damage
+        if damage > self.damage_max:
+            self.damage_max = damage
+
+    def merge(self, other):
+        """Fold another summary into this one and return self."""
+        if other.encounters == 0:
+            return self
+        total = self.encounters + other.encounters
+        delta = other.damage_mean - self.damage_mean
+        self._damage_m2 += other._damage_m2 + delta * delta * self.encounters * other.encounters / total
+        self.damage_mean += delta * other.encounters / total
+        self.encounters = total
+        self.attacks += other.attacks
+        self.hits += other.hits
+        self.kills += other.kills
+        self.total_xp += other.total_xp
+        self.damage_min = min(self.damage_min, other.damage_min)
+        self.damage_max = max(self.damage_max, other.damage_max)
+        return self
+
+    @property
+    def damage_variance(self):
+        """Population variance of damage per encounter."""
+        return self._damage_m2 / self.encounters if self.encounters else 0.0
+
+    def as_dict(self):
+        """Return the summary as a plain dictionary."""
+        return {
+            "encounters": self.encounters,
+            "attacks": self.attacks,
+            "hits": self.hits,
+            "hit_rate": self.hits / self.attacks if self.attacks else 0.0,
+            "kills": self.kills,
+            "kill_rate": self.kills / self.encounters if self.encounters else 0.0,
+            "total_xp": self.total_xp,
+            "damage_mean": self.damage_mean,
+            "damage_variance": self.damage_variance,
+            "damage_min": self.damage_min if self.encounters else 0.0,
+            "damage_max": self.damage_max if self.encounters else 0.0,
+        }
+
+
+def combat_rosters(players, entities):
+    """
+    Reduce players and entities to the compact tuples the simulation needs.
+
+    Returns:
+        tuple: (attackers, defenders) lists of (level, mana) and (level, health)
+            for valid players and for valid, active enemy entities
+    """
+    attackers = [(p["level"], p["mana"]) for p in validate_records(players, PLAYER_STATS_SCHEMA).valid]
+    defenders = [(e.get("level", DEFAULT_ENEMY_LEVEL), e.get("health", DEFAULT_ENEMY_HEALTH))
+                 for e in validate_records(entities, ENTITY_SCHEMA).valid if e["type"] == "enemy" and e["active"]]
+    return attackers, defenders
+
+
+def shard_rng(seed, shard_index):
+    """Return the random generator for one shard; depends only on seed and index."""
+    return random.Random(f"combat:{seed}:{shard_index}")
+
+
+_worker_rosters = None
+
+
+def _init_worker(attackers, defenders):
+    global _worker_rosters
+    _worker_rosters = (attackers, defenders)
+
+
+def _run_shard(shard_index, count, seed, rosters=None):
+    attackers, defenders = rosters if rosters is not None else _worker_rosters
+    rng = shard_rng(seed, shard_index)
+    draw = rng.random
+    pick_attacker = len(attackers)
+    pick_defender = len(defenders)
+    summary = CombatSummary()
+    for _ in range(count):
+        attacker = attackers[rng.randrange(pick_attacker)]
+        defender = defenders[rng.randrange(pick_defender)]
+        rolls = [draw() for _ in range(ROUNDS_PER_ENCOUNTER)]
+        summary.add(*simulate_encounter(attacker, defender, rolls))
+    return summary
+
+
+def simulate_battles(players, entities, encounters, seed=0, workers=None, shard_size=10000):
+    """
+    Simulate random player-versus-enemy encounters.
+
+    Each shard of shard_size encounters draws its pairings and dice from its
+    own generator, and summaries are merged in shard order, so the result is
+    identical for any number of workers.
+
+    Args:
+        players (list): Player dictionaries
+        entities (list): Entity dictionaries; active entities of type "enemy"
+            are the opponents, with optional level and health
+        encounters (int): Number of encounters to simulate
+        seed (int): Base seed
+        workers (int): Process count; 1 runs in the calling process and None
+            lets ProcessPoolExecutor choose
+        shard_size (int): Encounters per shard
+
+    Returns:
+        CombatSummary: Aggregated outcome of every encounter
+
+    Raises:
+        ValueError: If there are no valid players or enemies, or sizes are invalid
+    """
+    if encounters < 0 or shard_size <= 0:
+        raise ValueError("encounters must be non-negative and shard_size positive")
+    attackers, defenders = combat_rosters(players, entities)
+    if not attackers or not defenders:
+        raise ValueError("simulation needs at least one valid player and one enemy")
+
+    shards = [(index, min(shard_size, encounters - start))
+              for index, start in enumerate(range(0, encounters, shard_size))]
+    summary = CombatSummary()
+    if workers == 1 or len(shards) <= 1:
+        rosters = (attackers, defenders)
+        for index, count in shards:
+            summary.merge(_run_shard(index, count, seed, rosters))
+        return summary
+
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker,
+                             initargs=(attackers, defenders)) as executor:
+        results = executor.map(_run_shard, [index for index, _ in shards],
+                               [count for _, count in shards], [seed] * len(shards))
+        for shard_summary in results:
+            summary.merge(shard_summary)
+    return summary
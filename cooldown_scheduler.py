@@ -0,0 +1,133 @@
+"""
+Ability Cooldown Scheduler
+
+This module tracks (player, ability) cooldowns on a hashed timing wheel.
+Starting, cancelling and checking a cooldown are O(1), and advancing the
+clock only visits the wheel slots that elapsed, so expiries cost O(1)
+amortized instead of a scan over every player and ability each tick.
+"""
+
+import math
+
+
+class CooldownScheduler:
+    """
+    Hashed timing wheel of ability cooldowns keyed by (player, ability).
+
+    Time is measured in seconds and quantized to `tick` seconds; a cooldown
+    never expires before its full duration has elapsed. Cooldowns longer than
+    one wheel revolution (tick * slots) stay in their slot for extra rounds.
+    """
+
+    def __init__(self, tick=0.1, slots=512, now=0.0):
+        """
+        Create an empty scheduler.
+
+        Args:
+            tick (float): Wheel resolution in seconds
+            slots (int): Number of wheel slots
+            now (float): Starting time in seconds
+        """
+        if tick <= 0 or slots <= 0:
+            raise ValueError("tick and slots must be positive")
+        self.tick = tick
+        self._wheel = [set() for _ in range(slots)]
+        self._expiry = {}
+        self._current = math.floor(now / tick)
+        self.now = now
+
+    def __len__(self):
+        return len(self._expiry)
+
+    def _slot(self, tick_index):
+        return self._wheel[tick_index % len(self._wheel)]
+
+    def start(self, player, ability, duration):
+        """
+        Put an ability on cooldown, replacing any cooldown already running.
+
+        Args:
+            player: Hashable player key, e.g. the player name
+            ability (str): Ability name
+            duration (float): Cooldown length in seconds
+
+        Returns:
+            float: Time at which the cooldown expires
+        """
+        key = (player, ability)
+        self.cancel(player, ability)
+        if duration <= 0:
+            return self.now
+        expiry = max(math.ceil((self.now + duration) / self.tick - 1e-9), self._current + 1)
+        self._expiry[key] = expiry
+        self._slot(expiry).add(key)
+        return expiry * self.tick
+
+    def cancel(self, player, ability):
+        """
+        Clear a cooldown.
+
+        Returns:
+            bool: False if the ability was not on cooldown
+        """
+        key = (player, ability)
+        expiry = self._expiry.pop(key, None)
+        if expiry is None:
+            return False
+        self._slot(expiry).discard(key)
+        return True
+
+    def is_ready(self, player, ability):
+        """Return True when the ability is not on cooldown."""
+        return (player, ability) not in self._expiry
+
+    def remaining(self, player, ability):
+        """Return the seconds left on a cooldown, or 0.0 when it is ready."""
+        expiry = self._expiry.get((player, ability))
+        if expiry is None:
+            return 0.0
+        return max(expiry * self.tick - self.now, 0.0)
+
+    def ready_check(self, player_key=lambda player: player["name"]):
+        """
+        Return an is_ready(player, ability) callable for AbilityRegistry.usable_mask.
+
+        Args:
+            player_key (callable): Maps a player dictionary to its scheduler key
+        """
+        expiry = self._expiry
+        return lambda player, ability: (player_key(player), ability) not in expiry
+
+    def advance(self, now):
+        """
+        Move the clock forward and collect the cooldowns that expired.
+
+        Args:
+            now (float): New time in seconds; must not go backwards
+
+        Returns:
+            list: (player, ability) keys whose cooldowns expired, in expiry order
+        """
+        if now < self.now:
+            raise ValueError("time cannot go backwards")
+        target = math.floor(now / self.tick + 1e-9)
+        expired = []
+        if target - self._current >= len(self._wheel):
+            # Jumped a full revolution or more: one sweep over every slot.
+            due = sorted((tick_index, key) for key, tick_index in self._expiry.items() if tick_index <= target)
+            for tick_index, key in due:
+                del self._expiry[key]
+                self._slot(tick_index).discard(key)
+                expired.append(key)
+        else:
+            for tick_index in range(self._current + 1, target + 1):
+                slot = self._slot(tick_index)
+                if not slot:
+                    continue
+                for key in [k for k in slot if self._expiry[k] == tick_index]:
+                    slot.discard(key)
+                    del self._expiry[key]
+                    expired.append(key)
+        self._current = target
+        self.now = now
+        return expired
@@ -0,0 +1,220 @@
+"""
+Synthetic Game Data Generators
+
+This module generates seeded synthetic players, entities, inventory items and
+coordinates at any scale. Records can be produced lazily one at a time, or
+written straight into columnar buffers (EntityTable, float arrays, packed
+coordinate buffers) without ever building one dictionary per record.
+"""
+
+import random
+from array import array
+from bisect import bisect_right
+from itertools import accumulate
+
+from entity_table import EntityTable
+from inventory_index import RARITY_RANKS
+from player_batch import PLAYER_COLUMNS
+
+DEFAULT_BOUNDS = (0.0, 0.0, 1000.0, 1000.0)
+ENTITY_TYPE_WEIGHTS = {"enemy": 0.45, "item": 0.25, "npc": 0.15, "obstacle": 0.15}
+ITEM_TYPE_WEIGHTS = {"weapon": 0.3, "armor": 0.3, "consumable": 0.3, "accessory": 0.1}
+SPATIAL_DISTRIBUTIONS = ("uniform", "clustered")
+
+
+def _weighted_choice(rng, weights):
+    """Return a zero-argument function drawing keys of weights proportionally."""
+    names = list(weights)
+    cumulative = list(accumulate(weights[name] for name in names))
+    total = cumulative[-1] if cumulative else 0
+    if total <= 0:
+        raise ValueError("weights must contain at least one positive value")
+    draw = rng.random
+    return lambda: names[min(bisect_right(cumulative, draw() * total), len(names) - 1)]
+
+
+def rarity_weights(skew=1.0):
+    """
+    Return rarity weights falling off as 1 / (rank + 1) ** skew.
+
+    A skew of 0 makes every rarity equally likely; larger values make rare
+    items rarer.
+    """
+    return {rarity: 1.0 / (rank + 1) ** skew for rarity, rank in RARITY_RANKS.items()}
+
+
+def _position_sampler(rng, spatial, bounds, clusters, cluster_spread):
+    """Return a zero-argument function drawing (x, y) positions."""
+    if spatial not in SPATIAL_DISTRIBUTIONS:
+        raise ValueError(f"spatial must be one of {SPATIAL_DISTRIBUTIONS}")
+    min_x, min_y, max_x, max_y = bounds
+    if spatial == "uniform":
+        return lambda: (rng.uniform(min_x, max_x), rng.uniform(min_y, max_y))
+    if clusters < 1:
+        raise ValueError("clusters must be at least 1")
+    centers = [(rng.uniform(min_x, max_x), rng.uniform(min_y, max_y)) for _ in range(clusters)]
+    gauss = rng.gauss
+
+    def sample():
+        cx, cy = centers[rng.randrange(clusters)]
+        return (min(max(gauss(cx, cluster_spread), min_x), max_x),
+                min(max(gauss(cy, cluster_spread), min_y), max_y))
+    return sample
+
+
+def iter_players(count, seed=0, level_range=(1, 50), spatial="uniform", bounds=DEFAULT_BOUNDS,
+                 clusters=8, cluster_spread=50.0):
+    """
+    Lazily generate player dictionaries.
+
+    Args:
+        count (int): Number of players
+        seed (int): Random seed
+        level_range (tuple): Inclusive (min, max) level
+        spatial (str): "uniform" or "clustered" placement
+        bounds (tuple): (min_x, min_y, max_x, max_y) world bounds
+        clusters (int): Cluster count for clustered placement
+        cluster_spread (float): Standard deviation around each cluster center
+
+    Yields:
+        dict: Player with name, level, health, mana, score, position_x, position_y
+    """
+    for name, level, health, mana, score, x, y in _player_rows(
+            count, seed, level_range, spatial, bounds, clusters, cluster_spread):
+        yield {"name": name, "level": level, "health": health, "mana": mana, "score": score,
+               "position_x": x, "position_y": y}
+
+
+def _player_rows(count, seed, level_range, spatial, bounds, clusters, cluster_spread):
+    rng = random.Random(seed)
+    position = _position_sampler(rng, spatial, bounds, clusters, cluster_spread)
+    low, high = level_range
+    randint = rng.randint
+    for n in range(count):
+        level = randint(low, high)
+        x, y = position()
+        yield (f"Player{n}", level, 100 + level * 20 + randint(0, 100), 50 + level * 10 + randint(0, 50),
+               level * 400 + randint(0, 2000), x, y)
+
+
+def iter_entities(count, seed=0, type_weights=None, active_ratio=0.8, spatial="uniform",
+                  bounds=DEFAULT_BOUNDS, clusters=8, cluster_spread=50.0):
+    """
+    Lazily generate entity dictionaries.
+
+    Args:
+        count (int): Number of entities
+        seed (int): Random seed
+        type_weights (dict): Entity type -> relative weight
+        active_ratio (float): Probability an entity is active
+        spatial (str): "uniform" or "clustered" placement
+        bounds (tuple): (min_x, min_y, max_x, max_y) world bounds
+        clusters (int): Cluster count for clustered placement
+        cluster_spread (float): Standard deviation around each cluster center
+
+    Yields:
+        dict: Entity with id, type, position_x, position_y, active
+    """
+    for entity_id, entity_type, x, y, active in _entity_rows(
+            count, seed, type_weights, active_ratio, spatial, bounds, clusters, cluster_spread):
+        yield {"id": entity_id, "type": entity_type, "position_x": x, "position_y": y, "active": active}
+
+
+def _entity_rows(count, seed, type_weights, active_ratio, spatial, bounds, clusters, cluster_spread):
+    rng = random.Random(seed)
+    choose_type = _weighted_choice(rng, type_weights or ENTITY_TYPE_WEIGHTS)
+    position = _position_sampler(rng, spatial, bounds, clusters, cluster_spread)
+    draw = rng.random
+    for n in range(count):
+        x, y = position()
+        yield f"E{n}", choose_type(), x, y, draw() < active_ratio
+
+
+def iter_items(count, seed=0, type_weights=None, rarity_skew=1.0, equipped_ratio=0.1, value_range=(1, 5000)):
+    """
+    Lazily generate inventory item dictionaries.
+
+    Args:
+        count (int): Number of items
+        seed (int): Random seed
+        type_weights (dict): Item type -> relative weight
+        rarity_skew (float): Falloff exponent passed to rarity_weights()
+        equipped_ratio (float): Probability an item is equipped
+        value_range (tuple): Inclusive (min, max) base value
+
+    Yields:
+        dict: Item with name, type, value, rarity, equipped
+    """
+    rng = random.Random(seed)
+    choose_type = _weighted_choice(rng, type_weights or ITEM_TYPE_WEIGHTS)
+    choose_rarity = _weighted_choice(rng, rarity_weights(rarity_skew))
+    low, high = value_range
+    for n in range(count):
+        rarity = choose_rarity()
+        yield {
+            "name": f"Item{n}",
+            "type": choose_type(),
+            "value": rng.randint(low, high) * (RARITY_RANKS[rarity] + 1),
+            "rarity": rarity,
+            "equipped": rng.random() < equipped_ratio,
+        }
+
+
+def iter_coordinates(count, seed=0, spatial="uniform", bounds=DEFAULT_BOUNDS, clusters=8, cluster_spread=50.0):
+    """Lazily generate (x, y) coordinate tuples."""
+    rng = random.Random(seed)
+    position = _position_sampler(rng, spatial, bounds, clusters, cluster_spread)
+    for _ in range(count):
+        yield position()
+
+
+def entity_table(count, seed=0, **options):
+    """
+    Generate entities straight into an EntityTable.
+
+    Accepts the same options as iter_entities and produces the same records,
+    without creating a dictionary per entity.
+    """
+    defaults = {"type_weights": None, "active_ratio": 0.8, "spatial": "uniform",
+                "bounds": DEFAULT_BOUNDS, "clusters": 8, "cluster_spread": 50.0}
+    defaults.update(options)
+    table = EntityTable()
+    append = table.append
+    for row in _entity_rows(count, seed, **defaults):
+        append(*row)
+    return table
+
+
+def player_column_buffers(count, seed=0, **options):
+    """
+    Generate players straight into level, health, mana and score float arrays.
+
+    Accepts the same options as iter_players and produces the same values.
+
+    Returns:
+        dict: Column name -> array, ready for compute_player_stats
+    """
+    defaults = {"level_range": (1, 50), "spatial": "uniform", "bounds": DEFAULT_BOUNDS,
+                "clusters": 8, "cluster_spread": 50.0}
+    defaults.update(options)
+    columns = {name: array("d") for name in PLAYER_COLUMNS}
+    levels, healths, manas, scores = (columns[name].append for name in PLAYER_COLUMNS)
+    for _, level, health, mana, score, _, _ in _player_rows(count, seed, **defaults):
+        levels(level)
+        healths(health)
+        manas(mana)
+        scores(score)
+    return columns
+
+
+def coordinate_buffer(count, seed=0, **options):
+    """
+    Generate coordinates straight into an interleaved x, y float array.
+
+    Accepts the same options as iter_coordinates and produces the same values.
+    """
+    buffer = array("d")
+    extend = buffer.extend
+    for point in iter_coordinates(count, seed, **options):
+        extend(point)
+    return buffer
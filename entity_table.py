@@ -0,0 +1,322 @@
+"""
+Columnar Entity Store
+
+This module stores game entities as parallel typed columns instead of one
+dictionary per entity. Entity types are interned to small integer codes and
+the active flag is kept as a packed bitmask, so filters can be expressed as
+integer bitmasks combined with &, | and ~. Spatial filters are evaluated a
+whole column at a time and packed straight into a mask.
+"""
+
+import math
+from array import array
+from collections.abc import MutableMapping, Sequence
+from itertools import compress, repeat
+from operator import gt, le, lt
+
+ENTITY_FIELDS = ("id", "type", "position_x", "position_y", "active")
+MAX_TYPE_CODES = 256
+_BIT_DIGITS = bytes.maketrans(b"\x00\x01", b"01")
+_ROW_FLAGS = bytes.maketrans(b"01", b"\x00\x01")
+
+
+def _set_bit(bits, row, flag):
+    """Set or clear one bit in a packed little-endian bytearray bitmask."""
+    byte, offset = divmod(row, 8)
+    if flag:
+        bits[byte] |= 1 << offset
+    else:
+        bits[byte] &= ~(1 << offset) & 0xFF
+
+
+def _get_bit(bits, row):
+    byte, offset = divmod(row, 8)
+    return bool(bits[byte] >> offset & 1)
+
+
+def _pack_mask(flags):
+    """Pack per-row booleans into an integer mask in which bit i is row i."""
+    digits = bytes(flags).translate(_BIT_DIGITS)[::-1]
+    return int(digits, 2) if digits else 0
+
+
+def _fits_int64(value):
+    return isinstance(value, int) and -(1 << 63) <= value < 1 << 63
+
+
+class EntityRow(MutableMapping):
+    """
+    Dictionary-like view of one row of an EntityTable.
+
+    Reads and writes go straight to the table's columns, so no per-entity
+    dictionary is ever materialized.
+    """
+
+    __slots__ = ("_table", "_row")
+
+    def __init__(self, table, row):
+        self._table = table
+        self._row = row
+
+    @property
+    def row(self):
+        """Index of this row in its table."""
+        return self._row
+
+    def __getitem__(self, key):
+        return self._table.get_field(self._row, key)
+
+    def __setitem__(self, key, value):
+        self._table.set_field(self._row, key, value)
+
+    def __delitem__(self, key):
+        raise TypeError("entity fields cannot be deleted")
+
+    def __iter__(self):
+        return iter(ENTITY_FIELDS)
+
+    def __len__(self):
+        return len(ENTITY_FIELDS)
+
+    def __contains__(self, key):
+        return key in ENTITY_FIELDS
+
+    def __repr__(self):
+        return f"EntityRow({dict(self)!r})"
+
+
+class RowSelection(Sequence):
+    """
+    Read-only sequence of EntityRow views over selected rows of a table.
+
+    Views are created only when an element is accessed, so selecting many
+    rows costs one integer per row until they are actually read.
+    """
+
+    __slots__ = ("_table", "rows")
+
+    def __init__(self, table, rows):
+        self._table = table
+        self.rows = rows
+
+    def __len__(self):
+        return len(self.rows)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return RowSelection(self._table, self.rows[index])
+        return EntityRow(self._table, self.rows[index])
+
+    def __repr__(self):
+        return f"RowSelection(rows={len(self.rows)})"
+
+    def ids(self):
+        """Return the entity ids of the selected rows, in selection order."""
+        return list(map(self._table.ids.__getitem__, self.rows))
+
+
+class EntityTable:
+    """
+    Array-backed table of entities with columns id, type, position_x,
+    position_y and active.
+
+    Masks returned by the filter methods are Python integers in which bit i
+    is set when row i matches, so combining filters runs at C speed.
+
+    Position columns hold int64 values until a non-integer position is
+    stored, at which point the column is widened to float64 once. Rows read
+    back with the same numeric type the caller stored as long as a column
+    is not mixed.
+    """
+
+    def __init__(self):
+        self.ids = []
+        self.type_codes = array("B")
+        self.position_x = array("q")
+        self.position_y = array("q")
+        self._active_bits = bytearray()
+        self._type_bits = []
+        self._type_names = []
+        self._type_lookup = {}
+        self._row_of_id = {}
+
+    @classmethod
+    def from_entities(cls, entities):
+        """
+        Build a table from entity dictionaries.
+
+        Args:
+            entities (iterable): Entity dictionaries with id, type, position_x,
+                position_y and active
+
+        Returns:
+            EntityTable: A table holding every entity
+        """
+        table = cls()
+        for entity in entities:
+            table.append(entity["id"], entity["type"], entity["position_x"],
+                         entity["position_y"], entity["active"])
+        return table
+
+    def __len__(self):
+        return len(self.ids)
+
+    def __iter__(self):
+        return (EntityRow(self, row) for row in range(len(self.ids)))
+
+    def __getitem__(self, row):
+        if not -len(self.ids) <= row < len(self.ids):
+            raise IndexError("entity row out of range")
+        return EntityRow(self, row % len(self.ids))
+
+    def rows(self):
+        """Return a list of row views, usable wherever entity dicts are expected."""
+        return list(self)
+
+    def intern_type(self, type_name):
+        """
+        Return the small integer code for an entity type, assigning one if needed.
+
+        Raises:
+            ValueError: If more than 256 distinct types are interned
+        """
+        code = self._type_lookup.get(type_name)
+        if code is None:
+            if len(self._type_names) >= MAX_TYPE_CODES:
+                raise ValueError(f"at most {MAX_TYPE_CODES} entity types are supported")
+            code = len(self._type_names)
+            self._type_lookup[type_name] = code
+            self._type_names.append(type_name)
+            self._type_bits.append(bytearray(len(self._active_bits)))
+        return code
+
+    def type_name(self, code):
+        """Return the entity type for an interned code."""
+        return self._type_names[code]
+
+    def _position_column(self, name, value):
+        """Return a position column, widened to float64 first if value needs it."""
+        column = getattr(self, name)
+        if column.typecode == "q" and not _fits_int64(value):
+            column = array("d", column)
+            setattr(self, name, column)
+        return column
+
+    def append(self, entity_id, entity_type, position_x, position_y, active=True):
+        """
+        Add an entity and return its row index.
+
+        Raises:
+            ValueError: If the id is already present
+        """
+        if entity_id in self._row_of_id:
+            raise ValueError(f"duplicate entity id: {entity_id!r}")
+        row = len(self.ids)
+        code = self.intern_type(entity_type)
+        if row % 8 == 0:
+            self._active_bits.append(0)
+            for bits in self._type_bits:
+                bits.append(0)
+        self.ids.append(entity_id)
+        self.type_codes.append(code)
+        self._position_column("position_x", position_x).append(position_x)
+        self._position_column("position_y", position_y).append(position_y)
+        _set_bit(self._active_bits, row, active)
+        _set_bit(self._type_bits[code], row, True)
+        self._row_of_id[entity_id] = row
+        return row
+
+    def row_of(self, entity_id):
+        """Return the row index holding an entity id."""
+        return self._row_of_id[entity_id]
+
+    def get_field(self, row, field):
+        """Read one field of one row."""
+        if field == "id":
+            return self.ids[row]
+        if field == "type":
+            return self._type_names[self.type_codes[row]]
+        if field == "position_x":
+            return self.position_x[row]
+        if field == "position_y":
+            return self.position_y[row]
+        if field == "active":
+            return _get_bit(self._active_bits, row)
+        raise KeyError(field)
+
+    def set_field(self, row, field, value):
+        """Write one field of one row."""
+        if field == "id":
+            if value != self.ids[row] and value in self._row_of_id:
+                raise ValueError(f"duplicate entity id: {value!r}")
+            del self._row_of_id[self.ids[row]]
+            self.ids[row] = value
+            self._row_of_id[value] = row
+        elif field == "type":
+            old_code = self.type_codes[row]
+            code = self.intern_type(value)
+            _set_bit(self._type_bits[old_code], row, False)
+            _set_bit(self._type_bits[code], row, True)
+            self.type_codes[row] = code
+        elif field in ("position_x", "position_y"):
+            self._position_column(field, value)[row] = value
+        elif field == "active":
+            _set_bit(self._active_bits, row, value)
+        else:
+            raise KeyError(field)
+
+    def all_mask(self):
+        """Mask with every row set."""
+        return (1 << len(self.ids)) - 1
+
+    def active_mask(self):
+        """Mask of active rows."""
+        return int.from_bytes(self._active_bits, "little")
+
+    def type_mask(self, *type_names):
+        """Mask of rows whose type is any of the given names."""
+        mask = 0
+        for type_name in type_names:
+            code = self._type_lookup.get(type_name)
+            if code is not None:
+                mask |= int.from_bytes(self._type_bits[code], "little")
+        return mask
+
+    def within_mask(self, x, y, radius, candidates=None):
+        """
+        Mask of rows within a distance of a point.
+
+        Args:
+            x (float): Query x position
+            y (float): Query y position
+            radius (float): Maximum distance (inclusive)
+            candidates (int): Optional mask restricting which rows are tested
+
+        Returns:
+            int: Mask of matching rows
+        """
+        distances = map(math.dist, zip(self.position_x, self.position_y), repeat((x, y)))
+        mask = _pack_mask(map(le, distances, repeat(radius)))
+        return mask if candidates is None else mask & candidates
+
+    def quadrant_mask(self, x, y, sign_x, sign_y, candidates=None):
+        """Mask of rows strictly inside the quadrant given by axis signs (+1/-1)."""
+        beyond_x = gt if sign_x > 0 else lt
+        beyond_y = gt if sign_y > 0 else lt
+        mask = (_pack_mask(map(beyond_x, self.position_x, repeat(x)))
+                & _pack_mask(map(beyond_y, self.position_y, repeat(y))))
+        return mask if candidates is None else mask & candidates
+
+    def count(self, mask):
+        """Number of rows selected by a mask."""
+        return (mask & self.all_mask()).bit_count()
+
+    def select(self, mask):
+        """Return the row indices selected by a mask, in ascending order."""
+        mask &= self.all_mask()
+        flags = bin(mask)[:1:-1].encode("ascii").translate(_ROW_FLAGS)
+        return list(compress(range(len(flags)), flags))
+
+    def select_rows(self, mask):
+        """Return a RowSelection of the rows selected by a mask."""
+        return RowSelection(self, self.select(mask))
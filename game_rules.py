@@ -0,0 +1,29 @@
+"""
+Game Rules
+
+This module is the single definition of the formulas behind the
+demonstrations. Each rule is a lambda over plain numbers, so the per-record
+demonstrations in skeleton.py and the column-wise batch paths evaluate the
+same expressions and cannot drift apart.
+"""
+
+# Player transformations
+effective_health = lambda level, health: health + level * 10
+mana_regen = lambda level, mana: mana * 0.1 + level * 0.5
+power_index = lambda level, health, mana: level * 10 + health * 0.5 + mana * 0.3
+normalized_score = lambda score, low, high: (score - low) / (high - low) if high != low else 1.0
+
+# Game calculations
+damage = lambda level, mana: level * 5 + mana * 0.2
+movement_speed = lambda level, health: 5.0 + level * 0.25 + health / 500
+
+# Combat
+ROUNDS_PER_ENCOUNTER = 3
+DEFAULT_ENEMY_LEVEL = 5
+DEFAULT_ENEMY_HEALTH = 100
+hit_chance = lambda attacker_level, defender_level: min(0.95, max(0.05, 0.6 + (attacker_level - defender_level) * 0.03))
+kill_reward = lambda defender_level: defender_level * 20 + 10
+
+# Progression
+xp_for_level = lambda level: int(100 * level ** 1.5)
+stats_at_level = lambda level: {"health": 100 + level * 20, "mana": 50 + level * 10}
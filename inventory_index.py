@@ -0,0 +1,238 @@
+"""
+Inventory Ordering Index
+
+This module answers "first K items by some ordering" queries without fully
+sorting an inventory. top_k selects with a heap, and SortedView keeps one
+ordering sorted as items are added and removed, so repeated inventory
+renders only slice an already ordered list. Bulk loads are sorted once;
+bisect insertion is only used for incremental updates.
+"""
+
+import heapq
+import itertools
+from bisect import bisect_left
+from operator import itemgetter
+
+RARITY_RANKS = {"common": 0, "uncommon": 1, "rare": 2, "epic": 3, "legendary": 4}
+
+INVENTORY_ORDERINGS = {
+    "value": (lambda i: i["value"], False, None),
+    "rarity": (lambda i: RARITY_RANKS.get(i["rarity"], len(RARITY_RANKS)), False, None),
+    "type_value_desc": (lambda i: (i["type"], -i["value"]), False, None),
+    "equipped_value": (lambda i: i["value"], False, lambda i: i["equipped"]),
+}
+
+
+def top_k(items, k, key=None, reverse=False):
+    """
+    Return the first k items of an ordering using a heap.
+
+    The result equals sorted(items, key=key, reverse=reverse)[:k], including
+    the order of ties, but costs O(N log k) instead of O(N log N).
+
+    Args:
+        items (iterable): Items to select from
+        k (int): Number of items to return
+        key (callable): Sort key
+        reverse (bool): Select the largest keys instead of the smallest
+
+    Returns:
+        list: Up to k items in sorted order
+    """
+    if k <= 0:
+        return []
+    if reverse:
+        return heapq.nlargest(k, items, key=key)
+    return heapq.nsmallest(k, items, key=key)
+
+
+class SortedView:
+    """
+    One ordering of a collection, kept sorted under inserts and removals.
+
+    Ties keep insertion order, matching sorted(). An item's key must not
+    change while it is in the view; call update() after editing it.
+    """
+
+    def __init__(self, key, reverse=False, predicate=None):
+        """
+        Create an empty view.
+
+        Args:
+            key (callable): Sort key
+            reverse (bool): Order by descending key
+            predicate (callable): Optional filter; items failing it are not indexed
+        """
+        self.key = key
+        self.reverse = reverse
+        self.predicate = predicate
+        self._entries = []
+        self._items = []
+        self._entry_of = {}
+        self._sequence = itertools.count()
+
+    def __len__(self):
+        return len(self._items)
+
+    def __iter__(self):
+        return iter(self.head(len(self._items)))
+
+    def _entry(self, item):
+        sequence = next(self._sequence)
+        # Descending views are stored ascending and read backwards, so ties
+        # use a negated sequence to come out in insertion order.
+        return (self.key(item), -sequence if self.reverse else sequence)
+
+    def extend(self, items):
+        """
+        Add many items with a single sort instead of one insertion each.
+
+        Returns:
+            int: Number of items the predicate accepted
+
+        Raises:
+            ValueError: If an item is already in the view or repeated in items;
+                the view is left unchanged
+        """
+        added = {}
+        pairs = []
+        for item in items:
+            if id(item) in self._entry_of or id(item) in added:
+                raise ValueError("item is already in this view")
+            if self.predicate is not None and not self.predicate(item):
+                continue
+            entry = self._entry(item)
+            added[id(item)] = entry
+            pairs.append((entry, item))
+        if not pairs:
+            return 0
+        if self._entries:
+            pairs.extend(zip(self._entries, self._items))
+        pairs.sort(key=itemgetter(0))
+        self._entries = list(map(itemgetter(0), pairs))
+        self._items = list(map(itemgetter(1), pairs))
+        self._entry_of.update(added)
+        return len(added)
+
+    def insert(self, item):
+        """
+        Add an item.
+
+        Returns:
+            bool: False if the predicate excluded the item
+
+        Raises:
+            ValueError: If the same item object is already in the view
+        """
+        if id(item) in self._entry_of:
+            raise ValueError("item is already in this view")
+        if self.predicate is not None and not self.predicate(item):
+            return False
+        entry = self._entry(item)
+        position = bisect_left(self._entries, entry)
+        self._entries.insert(position, entry)
+        self._items.insert(position, item)
+        self._entry_of[id(item)] = entry
+        return True
+
+    def remove(self, item):
+        """
+        Remove an item.
+
+        Returns:
+            bool: False if the item was not in the view
+        """
+        entry = self._entry_of.pop(id(item), None)
+        if entry is None:
+            return False
+        position = bisect_left(self._entries, entry)
+        del self._entries[position]
+        del self._items[position]
+        return True
+
+    def update(self, item):
+        """Re-index an item after its fields changed."""
+        self.remove(item)
+        self.insert(item)
+
+    def head(self, k):
+        """Return the first k items of the ordering."""
+        if k <= 0:
+            return []
+        if self.reverse:
+            return self._items[max(len(self._items) - k, 0):][::-1]
+        return self._items[:k]
+
+
+class InventoryIndex:
+    """
+    Inventory with one SortedView per named ordering.
+
+    The default orderings mirror demonstrate_item_sorting: value, rarity,
+    type then value descending, and equipped items by value.
+    """
+
+    def __init__(self, items=(), orderings=None):
+        """
+        Build an index.
+
+        Args:
+            items (iterable): Initial items
+            orderings (dict): Name -> (key, reverse, predicate); defaults to
+                INVENTORY_ORDERINGS
+        """
+        if orderings is None:
+            orderings = INVENTORY_ORDERINGS
+        self.views = {name: SortedView(key, reverse, predicate)
+                      for name, (key, reverse, predicate) in orderings.items()}
+        self._members = {}
+        for item in items:
+            if id(item) in self._members:
+                raise ValueError("item is already in the inventory")
+            self._members[id(item)] = item
+        for view in self.views.values():
+            view.extend(self._members.values())
+
+    def __len__(self):
+        return len(self._members)
+
+    def add(self, item):
+        """
+        Add an item to every view.
+
+        Raises:
+            ValueError: If the same item object is already indexed
+        """
+        if id(item) in self._members:
+            raise ValueError("item is already in the inventory")
+        self._members[id(item)] = item
+        for view in self.views.values():
+            view.insert(item)
+
+    def remove(self, item):
+        """
+        Remove an item from every view.
+
+        Raises:
+            KeyError: If the item is not in the index
+        """
+        if self._members.pop(id(item), None) is None:
+            raise KeyError("item is not in the inventory")
+        for view in self.views.values():
+            view.remove(item)
+
+    def update(self, item):
+        """
+        Re-index an item after its fields changed.
+
+        Raises:
+            KeyError: If the item is not in the index; use add() for new items
+        """
+        if id(item) not in self._members:
+            raise KeyError("item is not in the inventory")
+        for view in self.views.values():
+            view.update(item)
+
+    def top(self, ordering, k):
+        """Return the first k items of a named ordering."""
+        return self.views[ordering].head(k)
@@ -0,0 +1,288 @@
+"""
+Lambda Usage Analyzer
+
+This module parses a source file once and indexes, for every top-level
+function, the calls to map, filter, sorted and reduce and which of their
+arguments are lambdas. A lambda is recognized when it is written inline,
+bound to a local name first, or forwarded through a parameter of a local
+lambda helper (order = lambda items, key: sorted(items, key=key)). Queries
+against the finished index are dictionary lookups.
+
+Usage:
+    python lambda_analyzer.py skeleton.py
+    python lambda_analyzer.py skeleton.py --prefix demonstrate_ --json
+"""
+
+import argparse
+import ast
+import json
+import sys
+
+FUNCTIONAL_CALLS = ("map", "filter", "sorted", "reduce")
+
+
+class CallSite:
+    """
+    One call to a functional builtin.
+
+    Attributes:
+        function (str): Top-level function containing the call
+        callee (str): Name of the builtin called
+        line (int): Line number of the call
+        lambda_arguments (tuple): Positions (int) and keyword names (str) of
+            the arguments that are lambdas
+    """
+
+    __slots__ = ("function", "callee", "line", "lambda_arguments")
+
+    def __init__(self, function, callee, line, lambda_arguments):
+        self.function = function
+        self.callee = callee
+        self.line = line
+        self.lambda_arguments = lambda_arguments
+
+    def __repr__(self):
+        return f"CallSite({self.function!r}, {self.callee!r}, line={self.line}, lambdas={self.lambda_arguments!r})"
+
+    @property
+    def has_lambda(self):
+        return bool(self.lambda_arguments)
+
+
+class FunctionInfo:
+    """
+    Static facts about one top-level function.
+
+    Attributes:
+        name (str): Function name
+        line (int): Line of the def statement
+        line_count (int): Number of source lines, decorators excluded
+        lambda_count (int): Lambda expressions in the body
+        has_pass (bool): Whether the body contains a pass statement
+        call_sites (tuple): CallSite objects in source order
+    """
+
+    __slots__ = ("name", "line", "line_count", "lambda_count", "has_pass", "call_sites")
+
+    def __init__(self, name, line, line_count, lambda_count, has_pass, call_sites):
+        self.name = name
+        self.line = line
+        self.line_count = line_count
+        self.lambda_count = lambda_count
+        self.has_pass = has_pass
+        self.call_sites = call_sites
+
+    def __repr__(self):
+        return f"FunctionInfo({self.name!r}, lambdas={self.lambda_count}, calls={len(self.call_sites)})"
+
+    @property
+    def is_implemented(self):
+        """True when the function has no pass statement and more than three lines."""
+        return not self.has_pass and self.line_count > 3
+
+
+def _callee_name(call):
+    """
+    Return the called name for f(...) and functools.reduce(...), else None.
+
+    Other attribute calls such as executor.map(...) are methods, not the
+    builtins, so they are not reported.
+    """
+    func = call.func
+    if isinstance(func, ast.Name):
+        return func.id
+    if (isinstance(func, ast.Attribute) and func.attr == "reduce"
+            and isinstance(func.value, ast.Name) and func.value.id == "functools"):
+        return func.attr
+    return None
+
+
+def _lambda_bindings(function_node):
+    """Map each local name assigned a lambda to the lambda nodes bound to it."""
+    bindings = {}
+    for node in ast.walk(function_node):
+        if isinstance(node, ast.Assign) and isinstance(node.value, ast.Lambda):
+            targets = [target.id for target in node.targets if isinstance(target, ast.Name)]
+        elif isinstance(node, ast.AnnAssign) and isinstance(node.value, ast.Lambda) \
+                and isinstance(node.target, ast.Name):
+            targets = [node.target.id]
+        else:
+            continue
+        for name in targets:
+            bindings.setdefault(name, []).append(node.value)
+    return bindings
+
+
+def _arguments(call):
+    """Yield (position or keyword, value) for each argument of a call."""
+    for position, value in enumerate(call.args):
+        yield position, value
+    for keyword in call.keywords:
+        if keyword.arg is not None:
+            yield keyword.arg, keyword.value
+
+
+def _parameter_names(lambda_node):
+    args = lambda_node.args
+    return [arg.arg for arg in args.posonlyargs + args.args]
+
+
+class _FunctionScanner:
+    """Finds functional call sites in one top-level function."""
+
+    def __init__(self, function_node):
+        self.function_node = function_node
+        self.bindings = _lambda_bindings(function_node)
+        self.helper_of = {id(node): name for name, nodes in self.bindings.items() for node in nodes}
+        self.lambda_parameters = self._lambda_parameters()
+
+    def _is_lambda(self, value, enclosing=()):
+        if isinstance(value, ast.Lambda):
+            return True
+        if not isinstance(value, ast.Name):
+            return False
+        if value.id in self.bindings:
+            return True
+        # A parameter of an enclosing lambda helper that callers fill with lambdas.
+        for lambda_node in reversed(enclosing):
+            if value.id in _parameter_names(lambda_node):
+                helper = self.helper_of.get(id(lambda_node))
+                return helper is not None and value.id in self.lambda_parameters.get(helper, ())
+        return False
+
+    def _lambda_parameters(self):
+        """Map each lambda helper name to the parameters its callers fill with lambdas."""
+        parameters = {}
+        for node in ast.walk(self.function_node):
+            if not isinstance(node, ast.Call) or not isinstance(node.func, ast.Name):
+                continue
+            helper = node.func.id
+            if helper not in self.bindings:
+                continue
+            names = [_parameter_names(lambda_node) for lambda_node in self.bindings[helper]]
+            for slot, value in _arguments(node):
+                if not self._is_lambda(value):
+                    continue
+                for params in names:
+                    if isinstance(slot, int):
+                        if slot < len(params):
+                            parameters.setdefault(helper, set()).add(params[slot])
+                    elif slot in params:
+                        parameters.setdefault(helper, set()).add(slot)
+        return parameters
+
+    def scan(self, name):
+        call_sites = []
+        counts = {"lambda": 0, "pass": False}
+
+        def visit(node, enclosing):
+            if isinstance(node, ast.Lambda):
+                counts["lambda"] += 1
+                enclosing = enclosing + (node,)
+            elif isinstance(node, ast.Pass):
+                counts["pass"] = True
+            elif isinstance(node, ast.Call):
+                callee = _callee_name(node)
+                if callee in FUNCTIONAL_CALLS:
+                    lambda_arguments = tuple(slot for slot, value in _arguments(node)
+                                             if self._is_lambda(value, enclosing))
+                    call_sites.append(CallSite(name, callee, node.lineno, lambda_arguments))
+            for child in ast.iter_child_nodes(node):
+                visit(child, enclosing)
+
+        for statement in self.function_node.body:
+            visit(statement, ())
+        call_sites.sort(key=lambda site: site.line)
+        node = self.function_node
+        line_count = node.end_lineno - node.lineno + 1
+        return FunctionInfo(name, node.lineno, line_count, counts["lambda"], counts["pass"], tuple(call_sites))
+
+
+class LambdaIndex:
+    """
+    Index of functional call sites for every top-level function of a module.
+
+    Build it once with from_file or from_source; every query afterwards is a
+    dictionary lookup.
+    """
+
+    def __init__(self, tree):
+        self.functions = {}
+        self._sites = {}
+        self._lambda_calls = set()
+        for node in tree.body:
+            if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)):
+                info = _FunctionScanner(node).scan(node.name)
+                self.functions[node.name] = info
+                for site in info.call_sites:
+                    self._sites.setdefault((node.name, site.callee), []).append(site)
+                    if site.has_lambda:
+                        self._lambda_calls.add((node.name, site.callee))
+        self._sites = {key: tuple(sites) for key, sites in self._sites.items()}
+
+    @classmethod
+    def from_source(cls, source, filename="<string>"):
+        """Parse source text and index it."""
+        return cls(ast.parse(source, filename))
+
+    @classmethod
+    def from_file(cls, path):
+        """Parse a source file and index it."""
+        with open(path, "r", encoding="utf-8") as handle:
+            return cls.from_source(handle.read(), path)
+
+    def function(self, name):
+        """Return the FunctionInfo of a function, or None if it is not defined."""
+        return self.functions.get(name)
+
+    def sites(self, function, callee):
+        """Return the calls to callee inside function."""
+        return self._sites.get((function, callee), ())
+
+    def uses_lambda_with(self, function, callee):
+        """True when function calls callee with at least one lambda argument."""
+        return (function, callee) in self._lambda_calls
+
+    def report(self, prefix=""):
+        """
+        Summarize the functions whose names start with prefix.
+
+        Returns:
+            dict: Function name -> lambda count, implementation flag and,
+                per builtin, the number of calls and of calls with a lambda
+        """
+        summary = {}
+        for name, info in self.functions.items():
+            if not name.startswith(prefix):
+                continue
+            calls = {}
+            for callee in FUNCTIONAL_CALLS:
+                sites = self.sites(name, callee)
+                if sites:
+                    calls[callee] = {"calls": len(sites), "with_lambda": sum(site.has_lambda for site in sites)}
+            summary[name] = {"line": info.line, "lambdas": info.lambda_count,
+                             "implemented": info.is_implemented, "calls": calls}
+        return summary
+
+
+def main(argv=None):
+    """Command-line entry point."""
+    parser = argparse.ArgumentParser(description="Report lambda use with map, filter, sorted and reduce.")
+    parser.add_argument("path", nargs="?", default="skeleton.py", help="source file to analyze")
+    parser.add_argument("--prefix", default="demonstrate_", help="only report functions with this prefix")
+    parser.add_argument("--json", action="store_true", help="print the report as JSON")
+    args = parser.parse_args(argv)
+
+    report = LambdaIndex.from_file(args.path).report(args.prefix)
+    if args.json:
+        print(json.dumps(report, indent=2))
+        return 0
+    for name, entry in report.items():
+        calls = ", ".join(f"{callee} {counts['with_lambda']}/{counts['calls']}"
+                          for callee, counts in entry["calls"].items()) or "-"
+        print(f"{name:<40} lambdas {entry['lambdas']:>3}  {calls}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
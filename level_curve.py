@@ -0,0 +1,111 @@
+"""
+Level Curve
+
+This module precomputes an XP progression curve. The per-level XP lambda is
+summed once into a sorted cumulative threshold array, so converting total XP
+to a level is a bisect instead of a loop over levels, and the stats lambda is
+evaluated once per level into lookup columns.
+"""
+
+from array import array
+from bisect import bisect_right
+from operator import index
+
+MAX_LEVEL = 50
+
+
+class LevelCurve:
+    """
+    Cumulative XP thresholds and per-level stats for levels 1..max_level.
+
+    thresholds[level - 1] is the total XP needed to reach that level, so
+    level 1 starts at 0 XP.
+    """
+
+    def __init__(self, xp_for_level, stats_at_level, max_level=MAX_LEVEL):
+        """
+        Build the curve.
+
+        Args:
+            xp_for_level (callable): XP needed to advance from a level to the next
+            stats_at_level (callable): Level -> dict of stat values
+            max_level (int): Highest reachable level
+        """
+        if not isinstance(max_level, int) or max_level < 1:
+            raise ValueError("max_level must be a positive integer")
+        self.max_level = max_level
+        self.xp_for_level = xp_for_level
+        self.stats_at_level = stats_at_level
+
+        thresholds = array("d", [0])
+        total = 0
+        for level in range(1, max_level):
+            step = xp_for_level(level)
+            if step <= 0:
+                raise ValueError(f"XP requirement must be positive, got {step} at level {level}")
+            total += step
+            thresholds.append(total)
+        self.thresholds = thresholds
+
+        per_level = [stats_at_level(level) for level in range(1, max_level + 1)]
+        self.stat_names = tuple(per_level[0])
+        self.stat_table = {name: array("d", (stats[name] for stats in per_level)) for name in self.stat_names}
+
+    def _check_level(self, level):
+        """Return level as an int, rejecting non-integers and levels out of range."""
+        try:
+            level = index(level)
+        except TypeError:
+            raise ValueError(f"level must be an integer, got {level!r}") from None
+        if not 1 <= level <= self.max_level:
+            raise ValueError(f"level must be between 1 and {self.max_level}, got {level}")
+        return level
+
+    def total_xp_for(self, level):
+        """Return the total XP needed to reach a level."""
+        return self.thresholds[self._check_level(level) - 1]
+
+    def level_for_xp(self, xp):
+        """Return the level reached with a total amount of XP."""
+        if xp < 0:
+            raise ValueError("XP cannot be negative")
+        return bisect_right(self.thresholds, xp)
+
+    def levels_for_xp(self, xp_values):
+        """
+        Convert many XP totals to levels.
+
+        Args:
+            xp_values (iterable): Non-negative XP totals, e.g. a leaderboard
+
+        Returns:
+            array: Level per input value, in input order
+        """
+        thresholds = self.thresholds
+        levels = array("H", map(lambda xp: bisect_right(thresholds, xp), xp_values))
+        if levels and min(levels) == 0:
+            raise ValueError("XP cannot be negative")
+        return levels
+
+    def xp_to_next(self, xp):
+        """Return the XP still needed for the next level, or 0 at max level."""
+        level = self.level_for_xp(xp)
+        if level >= self.max_level:
+            return 0
+        return self.thresholds[level] - xp
+
+    def stats(self, level):
+        """Return the precomputed stats for a level as a dict."""
+        level = self._check_level(level)
+        return {name: column[level - 1] for name, column in self.stat_table.items()}
+
+    def stat_column(self, name, levels):
+        """
+        Return one stat for many levels as a float array.
+
+        Raises:
+            ValueError: If any level is not an integer between 1 and max_level
+        """
+        column = self.stat_table[name]
+        check = self._check_level
+        return array("d", map(lambda level: column[check(level) - 1], levels))
@@ -0,0 +1,109 @@
+"""
+Path and Distance Calculations
+
+This module computes path segment lengths and pairwise distances over
+coordinates packed into one contiguous float buffer laid out as
+x0, y0, x1, y1, ... Work is expressed as map() chains over array slices so
+the per-point loop runs in C, and results are returned as float arrays.
+"""
+
+import math
+from array import array
+from itertools import accumulate
+from operator import sub
+
+
+def pack_coordinates(coordinates):
+    """
+    Pack (x, y) pairs into an interleaved float buffer.
+
+    Args:
+        coordinates (iterable): (x, y) tuples or lists
+
+    Returns:
+        array: Float array of length 2 * N
+    """
+    buffer = array("d")
+    for x, y in coordinates:
+        buffer.append(x)
+        buffer.append(y)
+    return buffer
+
+
+def _split(buffer):
+    if len(buffer) % 2:
+        raise ValueError("coordinate buffer must hold an even number of values")
+    return buffer[0::2], buffer[1::2]
+
+
+def path_lengths(buffer):
+    """
+    Compute segment lengths, cumulative length and total length of a path.
+
+    Args:
+        buffer (array): Interleaved x, y float buffer
+
+    Returns:
+        tuple: (segments, cumulative, total) where segments and cumulative are
+            float arrays of length N - 1 and total is a float
+    """
+    xs, ys = _split(buffer)
+    if len(xs) < 2:
+        return array("d"), array("d"), 0.0
+    segments = array("d", map(math.hypot, map(sub, xs[1:], xs[:-1]), map(sub, ys[1:], ys[:-1])))
+    cumulative = array("d", accumulate(segments))
+    return segments, cumulative, cumulative[-1]
+
+
+def distance_matrix_blocks(buffer, block_size=256):
+    """
+    Yield the all-pairs distance matrix one square block at a time.
+
+    Only one block_size x block_size block of distances exists at once, so
+    large point sets never hold the full N x N matrix.
+
+    Args:
+        buffer (array): Interleaved x, y float buffer
+        block_size (int): Rows and columns per block
+
+    Yields:
+        tuple: (row_start, col_start, block) where block is a row-major float
+            array of shape rows x cols
+    """
+    if block_size <= 0:
+        raise ValueError("block_size must be positive")
+    xs, ys = _split(buffer)
+    count = len(xs)
+    for row_start in range(0, count, block_size):
+        row_stop = min(row_start + block_size, count)
+        for col_start in range(0, count, block_size):
+            col_xs = xs[col_start:col_start + block_size]
+            col_ys = ys[col_start:col_start + block_size]
+            block = array("d")
+            for row in range(row_start, row_stop):
+                x, y = xs[row], ys[row]
+                block.extend(map(math.hypot,
+                                 map(x.__rsub__, col_xs),
+                                 map(y.__rsub__, col_ys)))
+            yield row_start, col_start, block
+
+
+def distance_matrix(buffer, block_size=256):
+    """
+    Compute the full all-pairs distance matrix into one float array.
+
+    Args:
+        buffer (array): Interleaved x, y float buffer
+        block_size (int): Rows and columns per computed block
+
+    Returns:
+        array: Row-major float array of length N * N
+    """
+    count = len(buffer) // 2
+    matrix = array("d", bytes(8 * count * count))
+    for row_start, col_start, block in distance_matrix_blocks(buffer, block_size):
+        cols = min(block_size, count - col_start)
+        for offset in range(len(block) // cols):
+            start = (row_start + offset) * count + col_start
+            matrix[start:start + cols] = block[offset * cols:(offset + 1) * cols]
+    return matrix
@@ -0,0 +1,82 @@
+"""
+Batch Player Statistics
+
+This module computes the derived player statistics shown by
+demonstrate_player_transformations over whole columns of player data at once.
+Inputs are parallel sequences (lists or arrays) of level, health, mana and
+score, and every derived statistic is returned as an array of floats. The
+formulas come from game_rules, the same ones the demonstration applies.
+"""
+
+from array import array
+from itertools import repeat
+
+from game_rules import effective_health, mana_regen, normalized_score, power_index
+
+PLAYER_COLUMNS = ("level", "health", "mana", "score")
+
+
+def player_columns(players):
+    """
+    Split player dictionaries into parallel float arrays.
+
+    Args:
+        players (iterable): Player dictionaries with level, health, mana and score
+
+    Returns:
+        dict: Mapping of column name to array of floats
+    """
+    columns = {name: array("d") for name in PLAYER_COLUMNS}
+    levels, healths, manas, scores = (columns[name] for name in PLAYER_COLUMNS)
+    for player in players:
+        levels.append(player["level"])
+        healths.append(player["health"])
+        manas.append(player["mana"])
+        scores.append(player["score"])
+    return columns
+
+
+def compute_player_stats(levels, healths, manas, scores):
+    """
+    Compute effective health, mana regeneration, normalized score and power
+    index for every player.
+
+    One pass over the columns applies the per-player formulas and tracks
+    the score range; normalization then maps over the score column.
+
+    Args:
+        levels (sequence): Player levels
+        healths (sequence): Player health values
+        manas (sequence): Player mana values
+        scores (sequence): Player scores
+
+    Returns:
+        dict: Arrays keyed by effective_health, mana_regen, normalized_score
+            and power_index, in input order
+
+    Raises:
+        ValueError: If the columns have different lengths
+    """
+    count = len(levels)
+    if not len(healths) == len(manas) == len(scores) == count:
+        raise ValueError("player columns must all have the same length")
+
+    effective = array("d")
+    regen = array("d")
+    power = array("d")
+    add_effective, add_regen, add_power = effective.append, regen.append, power.append
+    low = high = scores[0] if count else 0
+    for level, health, mana, score in zip(levels, healths, manas, scores):
+        add_effective(effective_health(level, health))
+        add_regen(mana_regen(level, mana))
+        add_power(power_index(level, health, mana))
+        if score < low:
+            low = score
+        elif score > high:
+            high = score
+    return {
+        "effective_health": effective,
+        "mana_regen": regen,
+        "normalized_score": array("d", map(normalized_score, scores, repeat(low), repeat(high))),
+        "power_index": power,
+    }
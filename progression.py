@@ -0,0 +1,123 @@
+"""
+Bulk Player Progression
+
+This module applies XP grants to a whole player population at once. Player
+level, XP, health and mana live in array columns; apply_xp updates XP in
+place, re-evaluates level and stats only for the players that crossed a
+level threshold, and returns a compact list of level-up events.
+"""
+
+from array import array
+from bisect import bisect_right
+from collections.abc import Mapping
+
+from game_rules import xp_for_level, stats_at_level
+from level_curve import LevelCurve
+
+
+def default_curve(max_level=50):
+    """Return a LevelCurve built from the shared XP and stat rules in game_rules."""
+    return LevelCurve(xp_for_level, stats_at_level, max_level)
+
+
+class ProgressionTable:
+    """
+    Columnar level, xp, health and mana for a player population.
+
+    Row i corresponds to the i-th player the table was built from.
+    """
+
+    def __init__(self, curve, levels, xp, health, mana):
+        self.curve = curve
+        self.levels = levels
+        self.xp = xp
+        self.health = health
+        self.mana = mana
+
+    @classmethod
+    def from_players(cls, players, curve=None):
+        """
+        Build a table from player dictionaries.
+
+        Players without an "xp" value start at the threshold of their level.
+
+        Args:
+            players (iterable): Player dictionaries with level, health and mana
+            curve (LevelCurve): Progression curve; defaults to default_curve()
+
+        Returns:
+            ProgressionTable: One row per player
+        """
+        if curve is None:
+            curve = default_curve()
+        levels, xp, health, mana = array("H"), array("d"), array("d"), array("d")
+        for player in players:
+            level = min(max(int(player["level"]), 1), curve.max_level)
+            levels.append(level)
+            xp.append(player.get("xp", curve.thresholds[level - 1]))
+            health.append(player["health"])
+            mana.append(player["mana"])
+        return cls(curve, levels, xp, health, mana)
+
+    def __len__(self):
+        return len(self.levels)
+
+
+def apply_xp(table, xp_deltas):
+    """
+    Grant XP to many players in place.
+
+    Args:
+        table (ProgressionTable): Player columns to update
+        xp_deltas (sequence or Mapping): One XP grant per row, or a mapping
+            of row -> XP grant for sparse updates
+
+    Returns:
+        list: (row, old_level, new_level) tuples for players who levelled up,
+            in row order
+    """
+    if isinstance(xp_deltas, Mapping):
+        grants = sorted(xp_deltas.items())
+    else:
+        if len(xp_deltas) != len(table):
+            raise ValueError("xp_deltas must have one entry per player")
+        grants = enumerate(xp_deltas)
+
+    curve = table.curve
+    thresholds = curve.thresholds
+    max_level = curve.max_level
+    levels, xp = table.levels, table.xp
+    health_column = curve.stat_table["health"]
+    mana_column = curve.stat_table["mana"]
+    events = []
+    for row, delta in grants:
+        if not delta:
+            continue
+        total = xp[row] + delta
+        xp[row] = total
+        level = levels[row]
+        if level < max_level and total >= thresholds[level]:
+            new_level = bisect_right(thresholds, total)
+            levels[row] = new_level
+            table.health[row] = health_column[new_level - 1]
+            table.mana[row] = mana_column[new_level - 1]
+            events.append((row, level, new_level))
+    return events
+
+
+def sync_players(table, players, events):
+    """
+    Copy level, health and mana back into player dictionaries for the rows
+    that levelled up.
+
+    Args:
+        table (ProgressionTable): Updated columns
+        players (list): The dictionaries the table was built from
+        events (list): Events returned by apply_xp
+    """
+    for row, _, new_level in events:
+        player = players[row]
+        player["level"] = new_level
+        player["xp"] = table.xp[row]
+        player["health"] = table.health[row]
+        player["mana"] = table.mana[row]
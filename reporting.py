@@ -0,0 +1,126 @@
+"""
+Demonstration Results and Rendering
+
+This module separates what the demonstrate_* functions compute from how it is
+shown. Each demonstration returns a DemoResult holding its computed values and
+a list of report sections; the sections keep raw rows plus a line template, so
+no text is formatted until the result is rendered. Rendering joins every line
+into one string and writes it with a single call.
+"""
+
+import sys
+from collections.abc import Mapping
+
+
+class Section:
+    """
+    One headed block of a demonstration report.
+
+    Attributes:
+        heading (str): First line of the block
+        rows (list): Raw row values, one per output line
+        template: str.format template applied to each row (positional fields
+            for tuples, named fields for mappings), or a callable returning
+            the line for a row
+    """
+
+    __slots__ = ("heading", "rows", "template")
+
+    def __init__(self, heading, rows=(), template=None):
+        self.heading = heading
+        self.rows = rows
+        self.template = template
+
+    def __repr__(self):
+        return f"Section({self.heading!r}, rows={len(self.rows)})"
+
+    def lines(self):
+        """Yield the heading followed by one formatted line per row."""
+        yield self.heading
+        template = self.template
+        if template is None:
+            return
+        if callable(template):
+            yield from map(template, self.rows)
+            return
+        for row in self.rows:
+            yield template.format_map(row) if isinstance(row, Mapping) else template.format(*row)
+
+
+class DemoResult:
+    """
+    Structured outcome of one demonstrate_* call.
+
+    Computed values are available by name (result["effective_health"]), and
+    the report can be rendered at any time, or never.
+
+    Attributes:
+        title (str): Demonstration title
+        sections (list): Section objects in report order
+        data (dict): Computed values keyed by name
+    """
+
+    __slots__ = ("title", "sections", "data")
+
+    def __init__(self, title, sections=None, data=None):
+        self.title = title
+        self.sections = sections if sections is not None else []
+        self.data = data if data is not None else {}
+
+    def __repr__(self):
+        return f"DemoResult({self.title!r}, {sorted(self.data)!r})"
+
+    def __getitem__(self, name):
+        return self.data[name]
+
+    def __contains__(self, name):
+        return name in self.data
+
+    def add(self, heading, rows=(), template=None):
+        """Append a report section and return it."""
+        section = Section(heading, rows, template)
+        self.sections.append(section)
+        return section
+
+    def lines(self):
+        """Yield every report line, with a blank line between sections."""
+        yield ""
+        yield f"===== {self.title} ====="
+        for position, section in enumerate(self.sections):
+            if position:
+                yield ""
+            yield from section.lines()
+
+    def render(self, stream=None):
+        """Write the report; see render()."""
+        return render([self], stream)
+
+
+def format_report(results):
+    """Return the reports of several results as one string, without a trailing newline."""
+    return "\n".join(line for result in results for line in result.lines())
+
+
+def render(results, stream=None, header=None, footer=None):
+    """
+    Write the reports of one or more results with a single write call.
+
+    Args:
+        results: A DemoResult or an iterable of them
+        stream: File-like object to write to; the current sys.stdout by default
+        header (str): Optional line written before the reports
+        footer (str): Optional line written after the reports
+
+    Returns:
+        str: The text that was written
+    """
+    if isinstance(results, DemoResult):
+        results = [results]
+    parts = [format_report(results)]
+    if header is not None:
+        parts.insert(0, header)
+    if footer is not None:
+        parts.append(footer)
+    text = "\n".join(parts) + "\n"
+    (stream if stream is not None else sys.stdout).write(text)
+    return text
@@ -5,312 +5,635 @@ This module demonstrates the use of lambda functions for game development tasks
 including player statistics, entity filtering, and game calculations.
 """
 
-def prepare_player_data():
+import math
+import random
+from array import array
+
+from ability_registry import AbilityRegistry
+from broad_phase import candidate_pairs
+from data_generators import iter_players, iter_entities, iter_items, iter_coordinates
+from entity_table import EntityTable, RowSelection
+import game_rules
+from inventory_index import RARITY_RANKS, top_k
+from level_curve import LevelCurve
+from reporting import DemoResult, render
+from sort_keys import ITEM_SORT_SPECS
+from spatial_index import QUADRANTS, SpatialGrid
+from streaming import read_jsonl, read_coordinates_jsonl
+from validation import (
+    validate_records, PLAYER_SCHEMA, PLAYER_STATS_SCHEMA, ENTITY_SCHEMA, ITEM_SCHEMA
+)
+
+def prepare_player_data(source=None, count=None, seed=0, lazy=False):
     """
     Prepare player data for processing with lambda functions.
     
+    Args:
+        source (str): Optional path to a JSONL dump to read the records from
+        count (int): Optional number of synthetic records to generate from a
+            generator seeded with seed
+        seed (int): Seed for synthetic records
+        lazy (bool): Return an iterator over the file or generator instead
+            of a list; the demonstrate functions only accept lists
+    
     Returns:
-        list: A list of player dictionaries for demonstration
+        list: A list of player dictionaries for demonstration, or an iterator
+            over them when lazy is set
     """
-    # TODO: Create and return a list of at least 5 player dictionaries
-    # Each player should have: name, level, health, mana, score
-    pass
+    if source is not None or count is not None:
+        records = read_jsonl(source) if source is not None else iter_players(count, seed)
+        return records if lazy else list(records)
+    return [
+        {"name": "Aria", "level": 12, "health": 340, "mana": 120, "score": 4200, "position_x": 120, "position_y": 110},
+        {"name": "Borin", "level": 7, "health": 260, "mana": 40, "score": 1800, "position_x": 60, "position_y": 150},
+        {"name": "Cyra", "level": 20, "health": 410, "mana": 300, "score": 9100, "position_x": 210, "position_y": 230},
+        {"name": "Dax", "level": 3, "health": 150, "mana": 60, "score": 600, "position_x": 20, "position_y": 30},
+        {"name": "Elowen", "level": 15, "health": 300, "mana": 220, "score": 5600, "position_x": 160, "position_y": 90},
+        {"name": "Fenn", "level": 9, "health": 280, "mana": 90, "score": 2700, "position_x": 100, "position_y": 100},
+    ]
 
-def prepare_entity_data():
+def prepare_entity_data(source=None, count=None, seed=0, lazy=False):
     """
     Prepare game entity data for processing with lambda functions.
     
+    Args:
+        source (str): Optional path to a JSONL dump to read the records from
+        count (int): Optional number of synthetic records to generate from a
+            generator seeded with seed
+        seed (int): Seed for synthetic records
+        lazy (bool): Return an iterator over the file or generator instead
+            of a list; the demonstrate functions only accept lists
+    
     Returns:
-        list: A list of entity dictionaries for demonstration
+        list: A list of entity dictionaries for demonstration, or an iterator
+            over them when lazy is set
     """
-    # TODO: Create and return a list of at least 8 game entity dictionaries
-    # Each entity should have: id, type, position_x, position_y, active
-    pass
+    if source is not None or count is not None:
+        records = read_jsonl(source) if source is not None else iter_entities(count, seed)
+        return records if lazy else list(records)
+    return [
+        {"id": "E1", "type": "enemy", "position_x": 150, "position_y": 120, "active": True},
+        {"id": "E2", "type": "item", "position_x": 90, "position_y": 95, "active": True},
+        {"id": "E3", "type": "enemy", "position_x": 300, "position_y": 50, "active": False},
+        {"id": "E4", "type": "enemy", "position_x": 130, "position_y": 190, "active": True},
+        {"id": "E5", "type": "npc", "position_x": 10, "position_y": 10, "active": True},
+        {"id": "E6", "type": "item", "position_x": 400, "position_y": 400, "active": False},
+        {"id": "E7", "type": "enemy", "position_x": 60, "position_y": 140, "active": True},
+        {"id": "E8", "type": "obstacle", "position_x": 220, "position_y": 210, "active": True},
+        {"id": "E9", "type": "item", "position_x": 170, "position_y": 60, "active": True},
+        {"id": "E10", "type": "enemy", "position_x": 250, "position_y": 260, "active": True},
+    ]
 
-def prepare_inventory_data():
+def prepare_inventory_data(source=None, count=None, seed=0, lazy=False):
     """
     Prepare inventory data for processing with lambda functions.
     
+    Args:
+        source (str): Optional path to a JSONL dump to read the records from
+        count (int): Optional number of synthetic records to generate from a
+            generator seeded with seed
+        seed (int): Seed for synthetic records
+        lazy (bool): Return an iterator over the file or generator instead
+            of a list; the demonstrate functions only accept lists
+    
     Returns:
-        list: A list of item dictionaries for demonstration
+        list: A list of item dictionaries for demonstration, or an iterator
+            over them when lazy is set
     """
-    # TODO: Create and return a list of at least 6 item dictionaries
-    # Each item should have: name, type, value, rarity, equipped
-    pass
+    if source is not None or count is not None:
+        records = read_jsonl(source) if source is not None else iter_items(count, seed)
+        return records if lazy else list(records)
+    return [
+        {"name": "Iron Sword", "type": "weapon", "value": 150, "rarity": "common", "equipped": True},
+        {"name": "Dragon Scale Armor", "type": "armor", "value": 2400, "rarity": "legendary", "equipped": False},
+        {"name": "Health Potion", "type": "consumable", "value": 25, "rarity": "common", "equipped": False},
+        {"name": "Elven Bow", "type": "weapon", "value": 820, "rarity": "rare", "equipped": False},
+        {"name": "Leather Boots", "type": "armor", "value": 90, "rarity": "uncommon", "equipped": True},
+        {"name": "Mana Crystal", "type": "consumable", "value": 300, "rarity": "rare", "equipped": False},
+        {"name": "Shadow Dagger", "type": "weapon", "value": 1350, "rarity": "epic", "equipped": False},
+        {"name": "Knight Helm", "type": "armor", "value": 410, "rarity": "uncommon", "equipped": True},
+    ]
 
-def prepare_coordinate_data():
+def prepare_coordinate_data(source=None, count=None, seed=0, lazy=False):
     """
     Prepare coordinate data for processing with lambda functions.
     
+    Args:
+        source (str): Optional path to a JSONL dump of [x, y] arrays to read
+            the coordinates from
+        count (int): Optional number of synthetic records to generate from a
+            generator seeded with seed
+        seed (int): Seed for synthetic records
+        lazy (bool): Return an iterator over the file or generator instead
+            of a list; the demonstrate functions only accept lists
+    
     Returns:
-        list: A list of coordinate tuples for demonstration
+        list: A list of coordinate tuples for demonstration, or an iterator
+            over them when lazy is set
     """
-    # TODO: Create and return a list of at least 5 coordinate tuples
-    pass
+    if source is not None or count is not None:
+        records = read_coordinates_jsonl(source) if source is not None else iter_coordinates(count, seed)
+        return records if lazy else list(records)
+    return [(0, 0), (30, 40), (60, 80), (120, 80), (150, 120), (150, 200)]
 
-def demonstrate_player_transformations(players):
+def demonstrate_player_transformations(players, quiet=False, use_cache=False):
     """
     Demonstrate using lambda functions with map() to transform player data.
     
     Args:
         players (list): List of player dictionaries
-    """
-    print("\n===== PLAYER TRANSFORMATIONS WITH LAMBDA FUNCTIONS =====")
+        quiet (bool): Skip rendering the report; only the result is returned
+        use_cache (bool): Reuse validation results for lists that were already
+            checked; see validate_records
     
+    Returns:
+        DemoResult: names (list) of the valid players, and effective_health,
+            mana_regen, normalized_score and power_index as float arrays
+            aligned with names
+    """
     # Validate input type
     if not isinstance(players, list):
         raise TypeError("players must be a list")
-        
-    # Handle empty list gracefully
-    if not players:
-        print("Player effective health:")
-        print("\nPlayer mana regeneration:")
-        print("\nPlayer normalized scores:")
-        print("\nPlayer power index:")
-        return
-    
-    # Check for required attributes in players
-    required_keys = ["name", "level", "health", "mana", "score"]
-    valid_players = [p for p in players if isinstance(p, dict) and all(key in p for key in required_keys)]
-    
-    if not valid_players:
-        print("Player effective health:")
-        print("\nPlayer mana regeneration:")
-        print("\nPlayer normalized scores:")
-        print("\nPlayer power index:")
-        return
-    
-    # TODO: Demonstrate at least 3 different transformations on player data using map() with lambda functions
-    # 1. Calculate some derived player statistic (e.g., effective health)
-    # 2. Transform player attributes using a formula
-    # 3. Create a new player attribute based on existing attributes
     
-    pass
+    result = DemoResult("PLAYER TRANSFORMATIONS WITH LAMBDA FUNCTIONS")
+    
+    # Check for required attributes in players; an empty list yields empty sections
+    valid_players = validate_records(players, PLAYER_SCHEMA, use_cache).valid if players else []
+    names = list(map(lambda p: p["name"], valid_players))
+    
+    # 1. Calculate a derived player statistic
+    effective_health = array("d", map(lambda p: game_rules.effective_health(p["level"], p["health"]), valid_players))
+    result.add("Player effective health:", list(zip(names, effective_health)), "  {0}: {1:.15g}")
+    
+    # 2. Transform player attributes using a formula
+    mana_regen = array("d", map(lambda p: game_rules.mana_regen(p["level"], p["mana"]), valid_players))
+    result.add("Player mana regeneration:", list(zip(names, mana_regen)), "  {0}: {1:.1f} per second")
+    
+    # 3. Create new player attributes based on existing attributes
+    scores = array("d", map(lambda p: p["score"], valid_players))
+    low, high = (min(scores), max(scores)) if scores else (0, 0)
+    normalized = array("d", map(lambda score: game_rules.normalized_score(score, low, high), scores))
+    result.add("Player normalized scores:", list(zip(names, normalized)), "  {0}: {1:.2f}")
+    
+    power_index = array("d", map(lambda p: game_rules.power_index(p["level"], p["health"], p["mana"]), valid_players))
+    result.add("Player power index:", list(zip(names, power_index)), "  {0}: {1:.1f}")
+    
+    result.data.update(names=names, effective_health=effective_health, mana_regen=mana_regen,
+                       normalized_score=normalized, power_index=power_index)
+    if not quiet:
+        result.render()
+    return result
 
-def demonstrate_entity_filtering(entities, player_position=(100, 100)):
+def demonstrate_entity_filtering(entities, player_position=(100, 100), spatial_index=None, quiet=False,
+                                 use_cache=False):
     """
     Demonstrate using lambda functions with filter() to select game entities.
     
     Args:
-        entities (list): List of entity dictionaries
+        entities (list): List of entity dictionaries, or an EntityTable
         player_position (tuple): Player's x,y position for distance calculations
+        spatial_index (SpatialGrid): Optional grid of the entities, keyed by
+            their row index in entities, that callers keep up to date between
+            frames instead of rebuilding; an EntityTable is filtered with its
+            own masks instead
+        quiet (bool): Skip rendering the report; only the result is returned
+        use_cache (bool): Reuse validation results for lists that were already
+            checked; see validate_records
+    
+    Returns:
+        DemoResult: active_enemy_ids, collectible_ids, nearby_ids (nearest
+            first) and northeast_target_ids as lists of entity ids, and
+            nearby_distances as a float array aligned with nearby_ids
     """
-    print("\n===== ENTITY FILTERING WITH LAMBDA FUNCTIONS =====")
+    table = entities if isinstance(entities, EntityTable) else None
     
     # Validate input type
-    if not isinstance(entities, list):
+    if table is None and not isinstance(entities, list):
         raise TypeError("entities must be a list")
     
     if not isinstance(player_position, tuple) or len(player_position) != 2:
-        try:
-            player_position = (100, 100)  # Default to prevent crashing
-        except:
-            raise TypeError("player_position must be a tuple of (x, y) coordinates")
-    
-    # Handle empty list gracefully
-    if not entities:
-        print(f"Active enemies: 0")
-        print(f"\nCollectible items: 0")
-        print(f"\nEntities within 100 units of player: 0")
-        print(f"\nEnemy targets in northeast quadrant: 0")
-        return
-    
-    # Check for required attributes in entities
-    required_keys = ["id", "type", "position_x", "position_y", "active"]
-    valid_entities = [e for e in entities if isinstance(e, dict) and all(key in e for key in required_keys)]
-    
-    if not valid_entities:
-        print(f"Active enemies: 0")
-        print(f"\nCollectible items: 0")
-        print(f"\nEntities within 100 units of player: 0")
-        print(f"\nEnemy targets in northeast quadrant: 0")
-        return
-    
-    # TODO: Demonstrate at least 3 different filtering operations using filter() with lambda functions
-    # 1. Filter entities by type and active status
-    # 2. Filter entities by distance from player
-    # 3. Filter entities based on multiple criteria
-    
-    pass
+        player_position = (100, 100)  # Default to prevent crashing
+    
+    result = DemoResult("ENTITY FILTERING WITH LAMBDA FUNCTIONS")
+    location = "  {id} at ({position_x}, {position_y})"
+    ids = lambda group: list(map(lambda e: e["id"], group))
+    px, py = player_position
+    
+    if table is not None:
+        # Table rows are always complete, so each filter is a bitmask built a
+        # whole column at a time; selections hold row indices and ids are read
+        # straight from the id column
+        ids = lambda group: group.ids()
+        
+        # 1. Filter entities by type and active status
+        enemy_mask = table.type_mask("enemy") & table.active_mask()
+        active_enemies = table.select_rows(enemy_mask)
+        collectibles = table.select_rows(table.type_mask("item") & table.active_mask())
+        
+        # 2. Filter entities by distance from player
+        distance_sq = lambda row: (table.position_x[row] - px) ** 2 + (table.position_y[row] - py) ** 2
+        nearby = RowSelection(table, sorted(table.select(table.within_mask(px, py, 100)), key=distance_sq))
+        
+        # 3. Filter entities based on multiple criteria within the northeast quadrant
+        sign_x, sign_y = QUADRANTS["northeast"]
+        northeast_targets = table.select_rows(table.quadrant_mask(px, py, sign_x, sign_y, enemy_mask))
+    else:
+        # Check for required attributes in entities; an empty list yields empty sections
+        validation = validate_records(entities, ENTITY_SCHEMA, use_cache) if entities else None
+        valid_entities = validation.valid if validation else []
+        
+        # 1. Filter entities by type and active status
+        active_enemies = list(filter(lambda e: e["type"] == "enemy" and e["active"], valid_entities))
+        collectibles = list(filter(lambda e: e["type"] == "item" and e["active"], valid_entities))
+        
+        # 2. Filter entities by distance from player, using the grid to narrow candidates
+        nearby = []
+        northeast_targets = []
+        if valid_entities:
+            # The grid is keyed by row, so duplicate or missing ids cannot collide
+            rejected_rows = {index for index, _ in validation.rejected}
+            if spatial_index is None:
+                spatial_index = SpatialGrid.from_entities(
+                    entities, rows=filter(lambda row: row not in rejected_rows, range(len(entities))))
+            nearby = [entities[row] for row in spatial_index.query_radius(px, py, 100) if row not in rejected_rows]
+            nearby = sorted(nearby, key=lambda e: (e["position_x"] - px) ** 2 + (e["position_y"] - py) ** 2)
+            
+            # 3. Filter entities based on multiple criteria within the northeast quadrant
+            quadrant_rows = sorted(row for row in spatial_index.query_quadrant(px, py, "northeast")
+                                   if row not in rejected_rows)
+            quadrant_entities = [entities[row] for row in quadrant_rows]
+            northeast_targets = list(filter(lambda e: e["type"] == "enemy" and e["active"], quadrant_entities))
+    
+    result.add(f"Active enemies: {len(active_enemies)}", active_enemies, location)
+    result.add(f"Collectible items: {len(collectibles)}", collectibles, location)
+    
+    nearby_distances = array("d", map(lambda e: math.hypot(e["position_x"] - px, e["position_y"] - py), nearby))
+    result.add(f"Entities within 100 units of player: {len(nearby)}",
+               [(e["id"], e["type"], distance) for e, distance in zip(nearby, nearby_distances)],
+               "  {0} ({1}) - {2:.2f} units")
+    result.add(f"Enemy targets in northeast quadrant: {len(northeast_targets)}", northeast_targets, location)
+    
+    result.data.update(active_enemy_ids=ids(active_enemies), collectible_ids=ids(collectibles),
+                       nearby_ids=ids(nearby), nearby_distances=nearby_distances,
+                       northeast_target_ids=ids(northeast_targets))
+    if not quiet:
+        result.render()
+    return result
 
-def demonstrate_item_sorting(inventory):
+def demonstrate_item_sorting(inventory, limit=None, quiet=False, use_cache=False):
     """
     Demonstrate using lambda functions with sorted() to order items.
     
     Args:
         inventory (list): List of item dictionaries
-    """
-    print("\n===== INVENTORY SORTING WITH LAMBDA FUNCTIONS =====")
+        limit (int): Optional number of items to show per ordering; the
+            leading items are then selected with a heap instead of a full sort
+        quiet (bool): Skip rendering the report; only the result is returned
+        use_cache (bool): Reuse validation results for lists that were already
+            checked; see validate_records
     
+    Returns:
+        DemoResult: items (list of the valid items), and by_value, by_rarity,
+            by_type_value and equipped as arrays of indices into items, in
+            sorted order
+    """
     # Validate input type
     if not isinstance(inventory, list):
         raise TypeError("inventory must be a list")
     
-    # Handle empty list gracefully
-    if not inventory:
-        print("Items sorted by value (ascending):")
-        print("\nItems sorted by rarity:")
-        print("\nItems sorted by type then value (descending):")
-        print("\nEquipped items sorted by value:")
-        return
-    
-    # Check for required attributes in items
-    required_keys = ["name", "type", "value", "rarity", "equipped"]
-    valid_inventory = [i for i in inventory if isinstance(i, dict) and all(key in i for key in required_keys)]
-    
-    if not valid_inventory:
-        print("Items sorted by value (ascending):")
-        print("\nItems sorted by rarity:")
-        print("\nItems sorted by type then value (descending):")
-        print("\nEquipped items sorted by value:")
-        return
-    
-    # TODO: Demonstrate at least 3 different sorting operations using sorted() with lambda functions
+    result = DemoResult("INVENTORY SORTING WITH LAMBDA FUNCTIONS")
+    
+    # Check for required attributes in items; an empty list yields empty sections
+    items = validate_records(inventory, ITEM_SCHEMA, use_cache).valid if inventory else []
+    positions = range(len(items))
+    
+    # Orderings are index permutations, so consumers can reuse them without
+    # copying or re-sorting the items
+    if limit is None:
+        order = lambda indices, key: array("L", sorted(indices, key=key))
+    else:
+        order = lambda indices, key: array("L", top_k(indices, limit, key=key))
+    pick = lambda permutation: [items[k] for k in permutation]
+    
     # 1. Sort items by a single property
-    # 2. Sort items by custom ordering logic
-    # 3. Sort items by multiple properties
+    by_value = order(positions, lambda k: items[k]["value"])
+    result.add("Items sorted by value (ascending):", pick(by_value), "  {name}: {value} gold")
     
-    pass
+    # 2. Sort items by custom ordering logic
+    by_rarity = order(positions, lambda k: RARITY_RANKS.get(items[k]["rarity"], len(RARITY_RANKS)))
+    result.add("Items sorted by rarity:", pick(by_rarity), "  {name} ({rarity})")
+    
+    # 3. Sort items by multiple properties; (type, -value) is packed into one
+    # integer per item so the sort compares ints instead of tuples
+    type_value_keys = ITEM_SORT_SPECS["type_value_desc"].key_column(items)
+    by_type_value = order(positions, type_value_keys.__getitem__)
+    result.add("Items sorted by type then value (descending):", pick(by_type_value), "  {type}: {name} - {value} gold")
+    
+    equipped = order(filter(lambda k: items[k]["equipped"], positions), lambda k: items[k]["value"])
+    result.add("Equipped items sorted by value:", pick(equipped), "  {name}: {value} gold")
+    
+    result.data.update(items=items, by_value=by_value, by_rarity=by_rarity,
+                       by_type_value=by_type_value, equipped=equipped)
+    if not quiet:
+        result.render()
+    return result
 
-def demonstrate_game_calculations(coordinates, player_data):
+def demonstrate_game_calculations(coordinates, player_data, quiet=False, use_cache=False):
     """
     Demonstrate using lambda functions for game mechanic calculations.
     
     Args:
         coordinates (list): List of coordinate tuples
         player_data (list): List of player dictionaries
-    """
-    print("\n===== GAME CALCULATIONS WITH LAMBDA FUNCTIONS =====")
+        quiet (bool): Skip rendering the report; only the result is returned
+        use_cache (bool): Reuse validation results for lists that were already
+            checked; see validate_records
     
+    Returns:
+        DemoResult: segments (float array of segment lengths), total_length,
+            names (list) of the valid players, and damage and speed as float
+            arrays aligned with names
+    """
     # Validate input types
     if not isinstance(coordinates, list) or not isinstance(player_data, list):
         raise TypeError("coordinates and player_data must be lists")
     
-    # Handle empty lists or insufficient data
-    if not coordinates or len(coordinates) < 2 or not player_data:
-        print("Distances between consecutive coordinates:")
-        print(f"\nTotal path length: 0.00 units")
-        print("\nDamage calculations:")
-        print("\nMovement speeds:")
-        return
+    result = DemoResult("GAME CALCULATIONS WITH LAMBDA FUNCTIONS")
     
-    # Check for valid coordinates
+    # Check for valid coordinates and player data; with too little of either
+    # every section is reported empty
     valid_coordinates = [c for c in coordinates if isinstance(c, (list, tuple)) and len(c) == 2]
-    if len(valid_coordinates) < 2:
-        print("Distances between consecutive coordinates:")
-        print(f"\nTotal path length: 0.00 units")
-        print("\nDamage calculations:")
-        print("\nMovement speeds:")
-        return
-    
-    # Check for valid player data
-    required_keys = ["name", "level", "health", "mana"]
-    valid_players = [p for p in player_data if isinstance(p, dict) and all(key in p for key in required_keys)]
-    if not valid_players:
-        print("Distances between consecutive coordinates:")
-        print(f"\nTotal path length: 0.00 units")
-        print("\nDamage calculations:")
-        print("\nMovement speeds:")
-        return
-    
-    # TODO: Demonstrate at least 3 different game calculations using lambda functions
+    valid_players = validate_records(player_data, PLAYER_STATS_SCHEMA, use_cache).valid if player_data else []
+    if len(valid_coordinates) < 2 or not valid_players:
+        valid_coordinates = []
+        valid_players = []
+    
     # 1. Calculate distances between points
+    distance = lambda a, b: math.hypot(b[0] - a[0], b[1] - a[1])
+    legs = list(zip(valid_coordinates, valid_coordinates[1:]))
+    segments = array("d", map(lambda pair: distance(*pair), legs))
+    total_length = sum(segments)
+    result.add("Distances between consecutive coordinates:",
+               [(tuple(start), tuple(end), length) for (start, end), length in zip(legs, segments)],
+               "  {0} -> {1}: {2:.2f} units")
+    result.add(f"Total path length: {total_length:.2f} units")
+    
     # 2. Create a damage calculation lambda and use it
-    # 3. Create another game mechanic calculation
+    names = list(map(lambda p: p["name"], valid_players))
+    calc_damage = lambda p: game_rules.damage(p["level"], p["mana"])
+    damage = array("d", map(calc_damage, valid_players))
+    result.add("Damage calculations:", list(zip(names, damage)), "  {0}: {1:.1f} damage")
     
-    pass
+    # 3. Create another game mechanic calculation
+    calc_speed = lambda p: game_rules.movement_speed(p["level"], p["health"])
+    speed = array("d", map(calc_speed, valid_players))
+    result.add("Movement speeds:", list(zip(names, speed)), "  {0}: {1:.2f} units/s")
+    
+    result.data.update(segments=segments, total_length=total_length, names=names, damage=damage, speed=speed)
+    if not quiet:
+        result.render()
+    return result
 
-def demonstrate_ability_system():
+def demonstrate_ability_system(quiet=False):
     """
     Demonstrate lambda functions for a game ability system.
+    
+    Args:
+        quiet (bool): Skip rendering the report; only the result is returned
+    
+    Returns:
+        DemoResult: registry (AbilityRegistry), ability_names (list),
+            scaling (level -> float array of power aligned with ability_names),
+            scenarios as (mana, ability, cooldown_left) tuples and usable_mask,
+            an integer with bit i set when scenario i can cast
     """
-    print("\n===== ABILITY SYSTEM WITH LAMBDA FUNCTIONS =====")
+    result = DemoResult("ABILITY SYSTEM WITH LAMBDA FUNCTIONS")
     
-    # TODO: Create a system of game abilities using lambda functions
     # 1. Define different abilities using lambda functions
-    # 2. Show ability scaling with levels
-    # 3. Create a lambda function to determine if an ability can be used
+    abilities = {
+        "Fireball": {"mana_cost": 30, "cooldown": 3, "scaling": lambda level: 20 + level * 4.5},
+        "Heal": {"mana_cost": 25, "cooldown": 5, "scaling": lambda level: 15 + level * 3},
+        "Lightning Strike": {"mana_cost": 45, "cooldown": 8, "scaling": lambda level: 35 + level ** 1.5},
+        "Stone Shield": {"mana_cost": 20, "cooldown": 10, "scaling": lambda level: 10 + level * 2},
+    }
+    registry = AbilityRegistry()
+    for name, ability in abilities.items():
+        registry.register(name, ability["scaling"], ability["mana_cost"], ability["cooldown"])
+    ability_names = [ability.name for ability in registry]
+    result.add("Available abilities:", [(a.name, a.mana_cost, a.cooldown) for a in registry],
+               "  {0}: {1} mana, {2}s cooldown")
+    
+    # 2. Show ability scaling with levels, read from the precomputed tables
+    scaling = {level: array("d", map(lambda name: registry.power(name, level), ability_names))
+               for level in (1, 10, 25)}
+    result.add("Ability scaling by level:", list(zip(ability_names, *scaling.values())),
+               "  {0} - L1: {1:.1f}, L10: {2:.1f}, L25: {3:.1f}")
     
-    pass
+    # 3. Create a lambda function to determine if an ability can be used
+    can_use = lambda mana, ability, cooldown_left: mana >= registry.get(ability).mana_cost and cooldown_left <= 0
+    scenarios = [(100, "Fireball", 0), (20, "Heal", 0), (80, "Lightning Strike", 2.5), (20, "Stone Shield", 0)]
+    usable = list(map(lambda scenario: can_use(*scenario), scenarios))
+    result.add("Ability usability checks:",
+               [(ability, mana, cooldown_left, ok) for (mana, ability, cooldown_left), ok in zip(scenarios, usable)],
+               lambda row: f"  {row[0]} with {row[1]} mana and {row[2]}s cooldown: "
+                           + ("can cast" if row[3] else "cannot cast"))
+    
+    result.data.update(registry=registry, ability_names=ability_names, scaling=scaling, scenarios=scenarios,
+                       usable_mask=sum(1 << n for n, ok in enumerate(usable) if ok))
+    if not quiet:
+        result.render()
+    return result
 
-def demonstrate_combat_system(players, entities):
+def demonstrate_combat_system(players, entities, combat_range=120, seed=42, quiet=False, use_cache=False):
     """
     Demonstrate lambda functions for a game combat system.
     
     Args:
-        players (list): List of player dictionaries
-        entities (list): List of entity dictionaries
-    """
-    print("\n===== COMBAT SYSTEM WITH LAMBDA FUNCTIONS =====")
-    
-    # Validate input types
-    if not isinstance(players, list) or not isinstance(entities, list):
-        print("Invalid input types. Players and entities must be lists.")
-        return
-    
-    # Handle empty lists
-    if not players or not entities:
-        print("Not enough data to simulate combat.")
-        return
-    
-    # Check for valid players and entities
-    required_player_keys = ["name", "level", "health", "mana"]
-    required_entity_keys = ["id", "type", "position_x", "position_y", "active"]
-    
-    valid_players = [p for p in players if isinstance(p, dict) and all(key in p for key in required_player_keys)]
-    valid_entities = [e for e in entities if isinstance(e, dict) and all(key in e for key in required_entity_keys)]
+        players (list): List of player dictionaries; optional position_x and
+            position_y place them in the world
+        entities (list): List of entity dictionaries, or an EntityTable
+        combat_range (float): Distance within which players can attack
+        seed (int): Seed for the combat dice, for repeatable output
+        quiet (bool): Skip rendering the report; only the result is returned
+        use_cache (bool): Reuse validation results for lists that were already
+            checked; see validate_records
     
-    if not valid_players or not valid_entities:
-        print("Not enough valid data to simulate combat.")
-        return
+    Returns:
+        DemoResult: one entry per encounter in attackers (player names) and
+            target_ids (lists), distances, damage and rewards (float arrays),
+            hits and defeated (byte arrays of counts and 0/1 flags), plus
+            total_rewards mapping player names to XP; all empty when there
+            is nothing to simulate
+    """
+    result = DemoResult("COMBAT SYSTEM WITH LAMBDA FUNCTIONS", data={
+        "attackers": [], "target_ids": [], "distances": array("d"), "hits": array("B"),
+        "damage": array("d"), "defeated": array("B"), "rewards": array("d"), "total_rewards": {},
+    })
+    
+    # Validate input types, then check for valid players and entities
+    if not isinstance(players, list) or not isinstance(entities, (list, EntityTable)):
+        message = "Invalid input types. Players and entities must be lists."
+    elif not players or not entities:
+        message = "Not enough data to simulate combat."
+    else:
+        valid_players = validate_records(players, PLAYER_STATS_SCHEMA, use_cache).valid
+        if isinstance(entities, EntityTable):
+            # Table rows are always complete; only active enemies can become targets
+            valid_entities = entities.select_rows(entities.type_mask("enemy") & entities.active_mask())
+            message = None if valid_players else "Not enough valid data to simulate combat."
+        else:
+            valid_entities = validate_records(entities, ENTITY_SCHEMA, use_cache).valid
+            message = None if valid_players and valid_entities else "Not enough valid data to simulate combat."
+    if message is not None:
+        result.add(message)
+        if not quiet:
+            result.render()
+        return result
+    
+    # 1. Use lambda with filter to find entities in combat range; the broad
+    # phase only yields pairs that are already close enough
+    nearby_pairs = candidate_pairs(valid_players, valid_entities, combat_range)
+    targets = list(filter(lambda pair: pair[1]["type"] == "enemy" and pair[1]["active"], nearby_pairs))
+    attackers = [player["name"] for player, _, _ in targets]
+    target_ids = [enemy["id"] for _, enemy, _ in targets]
+    distances = array("d", (distance for _, _, distance in targets))
+    result.add(f"Enemies in combat range: {len(targets)}", list(zip(attackers, target_ids, distances)),
+               "  {0} -> {1} ({2:.1f} units)")
     
-    # TODO: Create a simple combat system using lambda functions
-    # 1. Use lambda with filter to find entities in combat range
     # 2. Create lambdas for hit chance, damage, and rewards
-    # 3. Simulate combat using these lambda functions
+    hit_chance = lambda attacker, defender: game_rules.hit_chance(
+        attacker["level"], defender.get("level", game_rules.DEFAULT_ENEMY_LEVEL))
+    damage = lambda attacker: game_rules.damage(attacker["level"], attacker["mana"])
+    reward = lambda defender: game_rules.kill_reward(defender.get("level", game_rules.DEFAULT_ENEMY_LEVEL))
     
-    pass
+    # 3. Simulate combat using these lambda functions
+    rng = random.Random(seed)
+    hits_by_encounter = array("B")
+    damage_by_encounter = array("d")
+    defeated_by_encounter = array("B")
+    rewards = array("d")
+    total_rewards = {}
+    for player, enemy, _ in targets:
+        enemy_health = enemy.get("health", game_rules.DEFAULT_ENEMY_HEALTH)
+        dealt = 0
+        hits = 0
+        for _ in range(game_rules.ROUNDS_PER_ENCOUNTER):
+            if rng.random() < hit_chance(player, enemy):
+                hits += 1
+                dealt += damage(player)
+            if dealt >= enemy_health:
+                break
+        defeated = dealt >= enemy_health
+        xp = reward(enemy) if defeated else 0
+        total_rewards[player["name"]] = total_rewards.get(player["name"], 0) + xp
+        hits_by_encounter.append(hits)
+        damage_by_encounter.append(dealt)
+        defeated_by_encounter.append(defeated)
+        rewards.append(xp)
+    if targets:
+        result.add("Combat results:",
+                   list(zip(attackers, target_ids, hits_by_encounter, damage_by_encounter, defeated_by_encounter, rewards)),
+                   lambda row: f"  {row[0]} vs {row[1]}: {row[2]} hits, {row[3]:.1f} damage, "
+                               f"{'defeated' if row[4] else 'survived'}, +{row[5]:.15g} XP")
+    else:
+        result.add("Combat results:", [("No enemies in range.",)], "  {0}")
+    result.add("Total rewards:", list(total_rewards.items()), "  {0}: {1} XP")
+    
+    result.data.update(attackers=attackers, target_ids=target_ids, distances=distances, hits=hits_by_encounter,
+                       damage=damage_by_encounter, defeated=defeated_by_encounter, rewards=rewards,
+                       total_rewards=total_rewards)
+    if not quiet:
+        result.render()
+    return result
 
-def demonstrate_level_system(players):
+def demonstrate_level_system(players, quiet=False, use_cache=False):
     """
     Demonstrate lambda functions for a game leveling system.
     
     Args:
         players (list): List of player dictionaries
+        quiet (bool): Skip rendering the report; only the result is returned
+        use_cache (bool): Reuse validation results for lists that were already
+            checked; see validate_records
+    
+    Returns:
+        DemoResult: curve (LevelCurve, or None without valid players),
+            xp_levels and xp_required, stat_levels and stats (stat name ->
+            float array), and per player, ordered by level: names (list),
+            levels (array), xp_to_next (0 at max level), next_total_xp,
+            next_health and next_mana (arrays for the following level, or the
+            current one at max level)
     """
-    print("\n===== LEVEL SYSTEM WITH LAMBDA FUNCTIONS =====")
+    result = DemoResult("LEVEL SYSTEM WITH LAMBDA FUNCTIONS", data={
+        "curve": None, "xp_levels": (), "xp_required": array("q"), "stat_levels": (), "stats": {},
+        "names": [], "levels": array("H"), "xp_to_next": array("q"), "next_total_xp": array("d"),
+        "next_health": array("d"), "next_mana": array("d"),
+    })
     
-    # Validate input type
+    # Validate input type, then check for valid players
     if not isinstance(players, list):
-        print("Invalid input type. Players must be a list.")
-        return
-    
-    # Handle empty list
-    if not players:
-        print("No player data available for level system demonstration.")
-        return
-    
-    # Check for valid players
-    required_keys = ["name", "level", "health", "mana"]
-    valid_players = [p for p in players if isinstance(p, dict) and all(key in p for key in required_keys)]
+        message = "Invalid input type. Players must be a list."
+    elif not players:
+        message = "No player data available for level system demonstration."
+    else:
+        valid_players = validate_records(players, PLAYER_STATS_SCHEMA, use_cache).valid
+        message = None if valid_players else "No valid player data available for level system demonstration."
+    if message is not None:
+        result.add(message)
+        if not quiet:
+            result.render()
+        return result
+    
+    # 1. Use the shared lambda for calculating XP requirements
+    xp_for_level = game_rules.xp_for_level
+    xp_levels = (1, 5, 10, 20)
+    xp_required = array("q", map(xp_for_level, xp_levels))
+    result.add("XP required for next level:", [(level, level + 1, xp) for level, xp in zip(xp_levels, xp_required)],
+               "  Level {0} -> {1}: {2} XP")
+    
+    # 2. Use the shared lambda for calculating stats at different levels
+    curve = LevelCurve(xp_for_level, game_rules.stats_at_level)
+    stat_levels = (1, 10, 25, 50)
+    stats = {name: curve.stat_column(name, stat_levels) for name in curve.stat_table}
+    result.add("Stats at different levels:", list(zip(stat_levels, stats["health"], stats["mana"])),
+               "  Level {0}: health {1:.0f}, mana {2:.0f}")
     
-    if not valid_players:
-        print("No valid player data available for level system demonstration.")
-        return
-    
-    # TODO: Create a level progression system using lambda functions
-    # 1. Define a lambda for calculating XP requirements
-    # 2. Define a lambda for calculating stats at different levels
     # 3. Show progression for players at different levels
-    
-    pass
+    ranked = sorted(valid_players, key=lambda p: p["level"])
+    names = list(map(lambda p: p["name"], ranked))
+    max_level = curve.max_level
+    levels = array("H", map(lambda p: min(max(int(p["level"]), 1), max_level), ranked))
+    next_levels = array("H", map(lambda level: min(level + 1, max_level), levels))
+    xp_to_next = array("q", map(lambda level: 0 if level >= max_level else xp_for_level(level), levels))
+    next_total_xp = array("d", map(curve.total_xp_for, next_levels))
+    next_health = curve.stat_column("health", next_levels)
+    next_mana = curve.stat_column("mana", next_levels)
+    result.add("Player progression:", list(zip(names, levels, xp_to_next, next_total_xp, next_health, next_mana)),
+               lambda row: f"  {row[0]} (level {row[1]}): max level reached" if row[1] >= max_level else
+                           f"  {row[0]} (level {row[1]}): {row[2]} XP to level {row[1] + 1} "
+                           f"({row[3]:.0f} total), then health {row[4]:.0f}, mana {row[5]:.0f}")
+    
+    result.data.update(curve=curve, xp_levels=xp_levels, xp_required=xp_required, stat_levels=stat_levels,
+                       stats=stats, names=names, levels=levels, xp_to_next=xp_to_next,
+                       next_total_xp=next_total_xp, next_health=next_health, next_mana=next_mana)
+    if not quiet:
+        result.render()
+    return result
 
-def main():
+def main(quiet=False):
     """
     Main function demonstrating lambda functions for game development.
-    """
-    print("===== GAME DEVELOPMENT UTILITY SYSTEM =====")
     
+    Every demonstration runs quietly and the combined report is written once
+    at the end. The prepared lists are shared by several demonstrations, so
+    each one is validated once per schema through the validation cache.
+    
+    Args:
+        quiet (bool): Skip rendering the report
+    
+    Returns:
+        list: DemoResult of each demonstration, in order
+    """
     # Prepare game data
     players = prepare_player_data()
     entities = prepare_entity_data()
@@ -318,15 +641,20 @@ def main():
     coordinates = prepare_coordinate_data()
     
     # Demonstrate various lambda function applications
-    demonstrate_player_transformations(players)
-    demonstrate_entity_filtering(entities)
-    demonstrate_item_sorting(inventory)
-    demonstrate_game_calculations(coordinates, players)
-    demonstrate_ability_system()
-    demonstrate_combat_system(players, entities)
-    demonstrate_level_system(players)
-    
-    print("\n===== DEMONSTRATION COMPLETED =====")
+    results = [
+        demonstrate_player_transformations(players, quiet=True, use_cache=True),
+        demonstrate_entity_filtering(entities, quiet=True, use_cache=True),
+        demonstrate_item_sorting(inventory, quiet=True, use_cache=True),
+        demonstrate_game_calculations(coordinates, players, quiet=True, use_cache=True),
+        demonstrate_ability_system(quiet=True),
+        demonstrate_combat_system(players, entities, quiet=True, use_cache=True),
+        demonstrate_level_system(players, quiet=True, use_cache=True),
+    ]
+    
+    if not quiet:
+        render(results, header="===== GAME DEVELOPMENT UTILITY SYSTEM =====",
+               footer="\n===== DEMONSTRATION COMPLETED =====")
+    return results
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main()
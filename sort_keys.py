@@ -0,0 +1,109 @@
+"""
+Compiled Sort Keys
+
+This module turns declarative multi-field orderings such as
+[("type", ASC), ("value", DESC)] into one packed integer per item. Each field
+is replaced by its dense rank (or by a rank table such as rarity), the ranks
+are bit-packed most significant field first, and sorting then compares plain
+integers instead of tuples of strings. Rank columns are built with map() over
+whole columns, so no Python code runs per item.
+"""
+
+from array import array
+from itertools import repeat
+from operator import itemgetter, lshift, or_, sub
+
+from inventory_index import RARITY_RANKS
+
+ASC = "asc"
+DESC = "desc"
+
+
+class SortSpec:
+    """
+    A compiled multi-field ordering.
+
+    Ties on every field keep input order, as with sorted().
+    """
+
+    def __init__(self, fields, rank_tables=None):
+        """
+        Compile an ordering.
+
+        Args:
+            fields (list): (field_name, ASC or DESC) pairs, most significant first
+            rank_tables (dict): Optional field_name -> {value: rank} tables
+                of comparable ranks, which need not be dense; values missing
+                from a table rank after every listed value
+
+        Raises:
+            ValueError: If no fields are given or a direction is unknown
+        """
+        if not fields:
+            raise ValueError("a sort spec needs at least one field")
+        for _, direction in fields:
+            if direction not in (ASC, DESC):
+                raise ValueError(f"sort direction must be {ASC!r} or {DESC!r}")
+        self.fields = tuple(fields)
+        self.rank_tables = {field: self._compact(table) for field, table in (rank_tables or {}).items()}
+
+    @staticmethod
+    def _compact(table):
+        """Map a rank table onto dense ranks 0..n-1, keeping equal ranks equal."""
+        try:
+            ranks = sorted(set(table.values()))
+        except TypeError:
+            raise ValueError("rank table values must be mutually comparable") from None
+        dense = dict(zip(ranks, range(len(ranks))))
+        return {value: dense[rank] for value, rank in table.items()}
+
+    def _field_ranks(self, items, field):
+        """Return (dense rank of every item, number of ranks) for one field."""
+        values = list(map(itemgetter(field), items))
+        table = self.rank_tables.get(field)
+        if table is not None:
+            unlisted = max(table.values(), default=-1) + 1
+            return list(map(table.get, values, repeat(unlisted))), unlisted + 1
+        distinct = sorted(set(values))
+        lookup = dict(zip(distinct, range(len(distinct))))
+        return list(map(lookup.__getitem__, values)), len(distinct)
+
+    def key_column(self, items):
+        """
+        Compute the packed integer key of every item.
+
+        Args:
+            items (sequence): Item dictionaries
+
+        Returns:
+            array or list: One key per item; an unsigned 64-bit array when the
+                packed keys fit, a list of ints otherwise
+        """
+        keys = repeat(0, len(items))
+        total_bits = 0
+        for field, direction in reversed(self.fields):
+            ranks, rank_count = self._field_ranks(items, field)
+            top = rank_count - 1
+            if direction == DESC:
+                ranks = map(sub, repeat(top), ranks)
+            keys = list(map(or_, keys, map(lshift, ranks, repeat(total_bits))))
+            total_bits += max(top, 0).bit_length()
+        if total_bits <= 64:
+            return array("Q", keys)
+        return list(keys)
+
+    def argsort(self, items):
+        """Return the item indices in sorted order."""
+        keys = self.key_column(items)
+        return sorted(range(len(items)), key=keys.__getitem__)
+
+    def sort(self, items):
+        """Return a new list of the items in sorted order."""
+        return [items[i] for i in self.argsort(items)]
+
+
+ITEM_SORT_SPECS = {
+    "value": SortSpec([("value", ASC)]),
+    "rarity": SortSpec([("rarity", ASC)], {"rarity": RARITY_RANKS}),
+    "type_value_desc": SortSpec([("type", ASC), ("value", DESC)]),
+}
@@ -0,0 +1,199 @@
+"""
+Spatial Index for Game Entities
+
+This module provides a uniform-grid spatial index over entity positions so that
+distance and quadrant queries only inspect the grid cells that can contain a
+match instead of scanning every entity.
+"""
+
+import math
+
+QUADRANTS = {
+    "northeast": (1, 1),
+    "northwest": (-1, 1),
+    "southeast": (1, -1),
+    "southwest": (-1, -1),
+}
+
+
+class SpatialGrid:
+    """
+    Uniform grid that buckets entity keys by the cell containing their position.
+
+    Keys are any hashable value, such as entity ids or row indices. Moving an
+    entity only touches the grid when it crosses a cell boundary, so the index
+    can be kept up to date every frame without rebuilding it.
+    """
+
+    def __init__(self, cell_size=100.0):
+        """
+        Create an empty grid.
+
+        Args:
+            cell_size (float): Width and height of each grid cell
+        """
+        if not isinstance(cell_size, (int, float)) or cell_size <= 0:
+            raise ValueError("cell_size must be a positive number")
+        self.cell_size = float(cell_size)
+        self._cells = {}
+        self._positions = {}
+
+    @classmethod
+    def from_entities(cls, entities, cell_size=100.0, rows=None):
+        """
+        Build a grid from entity dictionaries, keyed by their row index.
+
+        Keying by row rather than by entity id keeps entities with duplicate,
+        missing or unhashable ids apart; queries return rows into entities.
+
+        Args:
+            entities (sequence): Entity dictionaries with position_x and position_y
+            cell_size (float): Width and height of each grid cell
+            rows (iterable): Row indices to index; every row when omitted
+
+        Returns:
+            SpatialGrid: A grid containing the selected rows
+        """
+        grid = cls(cell_size)
+        for row in range(len(entities)) if rows is None else rows:
+            entity = entities[row]
+            grid.insert(row, entity["position_x"], entity["position_y"])
+        return grid
+
+    def __len__(self):
+        return len(self._positions)
+
+    def __contains__(self, entity_id):
+        return entity_id in self._positions
+
+    def _cell_of(self, x, y):
+        return (math.floor(x / self.cell_size), math.floor(y / self.cell_size))
+
+    def position(self, entity_id):
+        """Return the (x, y) position stored for an entity."""
+        return self._positions[entity_id]
+
+    def insert(self, entity_id, x, y):
+        """
+        Add an entity to the grid, or move it if it is already indexed.
+
+        Args:
+            entity_id: Hashable entity identifier
+            x (float): Entity x position
+            y (float): Entity y position
+        """
+        if entity_id in self._positions:
+            self.move(entity_id, x, y)
+            return
+        self._positions[entity_id] = (x, y)
+        self._cells.setdefault(self._cell_of(x, y), set()).add(entity_id)
+
+    def remove(self, entity_id):
+        """
+        Remove an entity from the grid.
+
+        Args:
+            entity_id: Identifier of an indexed entity
+
+        Raises:
+            KeyError: If the entity is not indexed
+        """
+        x, y = self._positions.pop(entity_id)
+        cell = self._cell_of(x, y)
+        bucket = self._cells[cell]
+        bucket.discard(entity_id)
+        if not bucket:
+            del self._cells[cell]
+
+    def move(self, entity_id, x, y):
+        """
+        Update the position of an indexed entity.
+
+        Args:
+            entity_id: Identifier of an indexed entity
+            x (float): New x position
+            y (float): New y position
+
+        Raises:
+            KeyError: If the entity is not indexed
+        """
+        old_x, old_y = self._positions[entity_id]
+        old_cell = self._cell_of(old_x, old_y)
+        new_cell = self._cell_of(x, y)
+        self._positions[entity_id] = (x, y)
+        if old_cell == new_cell:
+            return
+        bucket = self._cells[old_cell]
+        bucket.discard(entity_id)
+        if not bucket:
+            del self._cells[old_cell]
+        self._cells.setdefault(new_cell, set()).add(entity_id)
+
+    def _cells_in_box(self, min_x, min_y, max_x, max_y):
+        """Yield the occupied cells overlapping an axis-aligned box."""
+        min_cx, min_cy = self._cell_of(min_x, min_y)
+        max_cx, max_cy = self._cell_of(max_x, max_y)
+        box_cells = (max_cx - min_cx + 1) * (max_cy - min_cy + 1)
+        if box_cells > len(self._cells):
+            # Fewer occupied cells than cells in the box: walk the occupied ones.
+            for (cx, cy), bucket in self._cells.items():
+                if min_cx <= cx <= max_cx and min_cy <= cy <= max_cy:
+                    yield bucket
+            return
+        for cx in range(min_cx, max_cx + 1):
+            for cy in range(min_cy, max_cy + 1):
+                bucket = self._cells.get((cx, cy))
+                if bucket:
+                    yield bucket
+
+    def query_radius(self, x, y, radius):
+        """
+        Find entities within a distance of a point.
+
+        Args:
+            x (float): Query x position
+            y (float): Query y position
+            radius (float): Maximum distance (inclusive)
+
+        Returns:
+            list: Keys of entities within the radius
+        """
+        if radius < 0:
+            return []
+        radius_sq = radius * radius
+        positions = self._positions
+        found = []
+        for bucket in self._cells_in_box(x - radius, y - radius, x + radius, y + radius):
+            for entity_id in bucket:
+                ex, ey = positions[entity_id]
+                if (ex - x) ** 2 + (ey - y) ** 2 <= radius_sq:
+                    found.append(entity_id)
+        return found
+
+    def query_quadrant(self, x, y, quadrant):
+        """
+        Find entities strictly inside a quadrant relative to a point.
+
+        Args:
+            x (float): Origin x position
+            y (float): Origin y position
+            quadrant (str): One of "northeast", "northwest", "southeast", "southwest"
+
+        Returns:
+            list: Keys of entities in the quadrant
+        """
+        if quadrant not in QUADRANTS:
+            raise ValueError(f"quadrant must be one of {sorted(QUADRANTS)}")
+        sign_x, sign_y = QUADRANTS[quadrant]
+        origin_cx, origin_cy = self._cell_of(x, y)
+        positions = self._positions
+        found = []
+        for (cx, cy), bucket in self._cells.items():
+            # Skip cells lying entirely on the wrong side of either axis.
+            if (cx - origin_cx) * sign_x < 0 or (cy - origin_cy) * sign_y < 0:
+                continue
+            for entity_id in bucket:
+                ex, ey = positions[entity_id]
+                if (ex - x) * sign_x > 0 and (ey - y) * sign_y > 0:
+                    found.append(entity_id)
+        return found
@@ -0,0 +1,184 @@
+"""
+Streaming Pipeline Stages
+
+This module provides lazy, generator-based versions of the validation,
+transformation and filtering steps used by the demonstrate_* functions, so
+records can be read from JSONL dumps of any size with bounded memory. Only
+the sorting stage materializes data.
+"""
+
+import heapq
+import json
+
+import game_rules
+from validation import PLAYER_SCHEMA, ENTITY_SCHEMA
+
+
+def read_jsonl(path):
+    """
+    Yield one record per non-blank line of a JSONL file.
+
+    Args:
+        path (str): Path to the JSONL file
+
+    Yields:
+        object: Decoded JSON value for each line
+    """
+    with open(path, "r", encoding="utf-8") as handle:
+        for line in handle:
+            if line.strip():
+                yield json.loads(line)
+
+
+def read_coordinates_jsonl(path):
+    """Yield (x, y) tuples from a JSONL file of two-element arrays."""
+    return map(lambda c: tuple(c) if isinstance(c, list) else c, read_jsonl(path))
+
+
+class RejectionLog:
+    """
+    Bounded record of validation failures seen by iter_valid.
+
+    Only the first `limit` rejections are kept; `count` covers all of them.
+    """
+
+    def __init__(self, limit=100):
+        self.limit = limit
+        self.count = 0
+        self.samples = []
+
+    def add(self, index, reason):
+        self.count += 1
+        if len(self.samples) < self.limit:
+            self.samples.append((index, reason))
+
+
+def iter_valid(records, schema, rejections=None):
+    """
+    Lazily yield the records that satisfy a schema.
+
+    Args:
+        records (iterable): Records to validate
+        schema (Schema): Schema to check each record against
+        rejections (RejectionLog): Optional log that receives failures
+
+    Yields:
+        dict: Each valid record, in input order
+    """
+    check = schema.check
+    for index, record in enumerate(records):
+        reason = check(record)
+        if reason is None:
+            yield record
+        elif rejections is not None:
+            rejections.add(index, reason)
+
+
+def player_transformation_stream(players, rejections=None):
+    """
+    Lazily compute per-player derived statistics.
+
+    Args:
+        players (iterable): Player records
+        rejections (RejectionLog): Optional log that receives invalid records
+
+    Yields:
+        tuple: (name, effective_health, mana_regen, power_index)
+    """
+    return map(
+        lambda p: (
+            p["name"],
+            game_rules.effective_health(p["level"], p["health"]),
+            game_rules.mana_regen(p["level"], p["mana"]),
+            game_rules.power_index(p["level"], p["health"], p["mana"]),
+        ),
+        iter_valid(players, PLAYER_SCHEMA, rejections),
+    )
+
+
+def score_range(players):
+    """
+    Reduce a player stream to its (min, max) score without storing it.
+
+    Returns:
+        tuple: (low, high), or (None, None) for an empty stream
+    """
+    low = high = None
+    for player in iter_valid(players, PLAYER_SCHEMA):
+        score = player["score"]
+        if low is None or score < low:
+            low = score
+        if high is None or score > high:
+            high = score
+    return low, high
+
+
+def normalized_score_stream(players, low, high):
+    """
+    Lazily yield (name, normalized_score) given a score range from score_range().
+
+    Normalization needs the global range, so a stream read from a file is
+    consumed twice: once by score_range() and once here.
+    """
+    if low is None or high is None:
+        low = high = 0
+    return map(
+        lambda p: (p["name"], game_rules.normalized_score(p["score"], low, high)),
+        iter_valid(players, PLAYER_SCHEMA),
+    )
+
+
+def entity_filter_stream(entities, player_position=(100, 100), radius=100, rejections=None):
+    """
+    Lazily classify entities with the filters used by demonstrate_entity_filtering.
+
+    Every category is evaluated in a single pass over the stream, so no
+    category needs the stream to be buffered for another.
+
+    Args:
+        entities (iterable): Entity records
+        player_position (tuple): Player's x,y position
+        radius (float): Distance for the "nearby" category
+        rejections (RejectionLog): Optional log that receives invalid records
+
+    Yields:
+        tuple: (category, entity) where category is one of "active_enemy",
+            "collectible", "nearby" or "northeast_target"; an entity may be
+            yielded once per category it matches
+    """
+    px, py = player_position
+    radius_sq = radius * radius
+    for entity in iter_valid(entities, ENTITY_SCHEMA, rejections):
+        active_enemy = entity["type"] == "enemy" and entity["active"]
+        if active_enemy:
+            yield "active_enemy", entity
+        if entity["type"] == "item" and entity["active"]:
+            yield "collectible", entity
+        dx = entity["position_x"] - px
+        dy = entity["position_y"] - py
+        if dx * dx + dy * dy <= radius_sq:
+            yield "nearby", entity
+        if active_enemy and dx > 0 and dy > 0:
+            yield "northeast_target", entity
+
+
+def sorted_stage(records, key, reverse=False, limit=None):
+    """
+    Materializing sort stage.
+
+    With a limit only the best `limit` records are held in memory at once.
+
+    Args:
+        records (iterable): Records to sort
+        key (callable): Sort key
+        reverse (bool): Sort descending
+        limit (int): Optional number of leading records to keep
+
+    Returns:
+        list: Sorted records
+    """
+    if limit is None:
+        return sorted(records, key=key, reverse=reverse)
+    if reverse:
+        return heapq.nlargest(limit, records, key=key)
+    return heapq.nsmallest(limit, records, key=key)
@@ -0,0 +1,157 @@
+"""
+Parallel runner for the graded test suites.
+
+Test cases are spread over worker processes. Inside a worker, yakshaAssert
+records TestCaseResultDto objects in memory and each test's stdout is
+captured; the parent merges everything into one report and submits the
+results once, through the usual collector (or spool).
+
+Usage:
+    python -m test.ParallelRunner --workers 4
+    python -m test.ParallelRunner --no-submit --report results.json --show-output
+"""
+
+from test.TestCaseResultDto import TestCaseResultDto
+from test.TestUtils import TestUtils
+from concurrent.futures import ProcessPoolExecutor
+import argparse
+import contextlib
+import io
+import json
+import os
+import sys
+import unittest
+
+DEFAULT_MODULES = ("test.test_functional", "test.test_boundary", "test.test_exceptional")
+
+
+class LocalResults:
+    """Stands in for ResultCollector inside a worker and keeps results in memory."""
+
+    def __init__(self):
+        self.results = []
+
+    def add(self, test_name, result, test_type):
+        result_status = "Passed" if result else "Failed"
+        result_score = 1 if result else 0
+        self.results.append(TestCaseResultDto(test_name, test_type, 1, result_score, result_status, True, ""))
+
+    def flush(self):
+        return None
+
+    def close(self):
+        return None
+
+
+def collect_test_ids(modules=DEFAULT_MODULES):
+    """Return the ids of every test case in the given modules, in load order."""
+    test_ids = []
+    pending = [unittest.defaultTestLoader.loadTestsFromNames(modules)]
+    while pending:
+        suite = pending.pop()
+        children = list(suite) if isinstance(suite, unittest.TestSuite) else None
+        if children is None:
+            test_ids.append(suite.id())
+        else:
+            pending.extend(reversed(children))
+    return test_ids
+
+
+def _init_worker():
+    TestUtils.collector = LocalResults()
+
+
+def run_test(test_id):
+    """
+    Run one test case in the current process with stdout captured.
+
+    Returns:
+        dict: test id, worker pid, captured stdout, the unittest runner's own
+            report, unittest success flag and the TestCaseResultDto
+            dictionaries recorded by the test
+    """
+    if not isinstance(TestUtils.collector, LocalResults):
+        _init_worker()
+    collector = TestUtils.collector
+    start = len(collector.results)
+    stream = io.StringIO()
+    report = io.StringIO()
+    with contextlib.redirect_stdout(stream):
+        suite = unittest.defaultTestLoader.loadTestsFromName(test_id)
+        outcome = unittest.TextTestRunner(stream=report, verbosity=0).run(suite)
+    return {
+        "test": test_id,
+        "worker": os.getpid(),
+        "stdout": stream.getvalue(),
+        "report": report.getvalue(),
+        "ok": outcome.wasSuccessful(),
+        "results": [dict(dto) for dto in collector.results[start:]],
+    }
+
+
+def run_parallel(test_ids, workers=None):
+    """Run test cases across worker processes; outcomes keep the order of test_ids."""
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker) as executor:
+        return list(executor.map(run_test, test_ids))
+
+
+def merge_results(outcomes):
+    """Return every TestCaseResultDto recorded across outcomes, in test order."""
+    return [TestCaseResultDto(**result) for outcome in outcomes for result in outcome["results"]]
+
+
+def worker_output(outcomes):
+    """Return captured stdout joined per worker pid."""
+    output = {}
+    for outcome in outcomes:
+        output[outcome["worker"]] = output.get(outcome["worker"], "") + outcome["stdout"]
+    return output
+
+
+def main(argv=None):
+    """Command-line entry point."""
+    parser = argparse.ArgumentParser(description="Run the graded test suites in parallel.")
+    parser.add_argument("--workers", type=int, default=os.cpu_count(), help="worker processes")
+    parser.add_argument("--module", action="append", dest="modules",
+                        help="test module to run (repeatable); the three graded suites by default")
+    parser.add_argument("--report", help="write the merged results as JSON to this file")
+    parser.add_argument("--no-submit", action="store_true", help="do not send the merged results")
+    parser.add_argument("--show-output", action="store_true", help="print each worker's captured stdout")
+    args = parser.parse_args(argv)
+
+    outcomes = run_parallel(collect_test_ids(args.modules or DEFAULT_MODULES), args.workers)
+    test_case_results = merge_results(outcomes)
+    output = worker_output(outcomes)
+
+    if args.show_output:
+        for worker, text in output.items():
+            print(f"----- worker {worker} -----")
+            print(text, end="")
+    for outcome in outcomes:
+        if not outcome["ok"]:
+            print(f"----- {outcome['test']} -----")
+            print(outcome["report"], end="")
+    for dto in test_case_results:
+        print(f"{dto['methodName']} ({dto['methodType']}) = {dto['status']}")
+    if args.report:
+        with open(args.report, "w", encoding="utf-8") as handle:
+            json.dump({"testCaseResults": test_case_results,
+                       "tests": [{key: outcome[key] for key in ("test", "worker", "ok", "report")}
+                                 for outcome in outcomes],
+                       "stdout": {str(worker): text for worker, text in output.items()}}, handle, indent=2)
+
+    if not args.no_submit:
+        try:
+            for dto in test_case_results:
+                TestUtils.yakshaAssert(dto["methodName"], dto["earnedScore"] > 0, dto["methodType"])
+        except FileNotFoundError as error:
+            print(f"Results not submitted: {error}")
+            return 1
+        TestUtils.flush()
+
+    succeeded = all(outcome["ok"] for outcome in outcomes)
+    return 0 if succeeded and all(dto["status"] == "Passed" for dto in test_case_results) else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
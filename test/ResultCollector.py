@@ -0,0 +1,130 @@
+from test.TestResults import TestResults
+from test.TestCaseResultDto import TestCaseResultDto
+import json
+import os
+import queue
+import threading
+import time
+import requests
+
+
+class ResultCollector:
+    """
+    Queues assertion results and posts them from one background thread.
+
+    custom.ih and the host environment are read once, on the first result,
+    and every post goes through the same HTTP session so the connection is
+    reused. Assertions return as soon as their result is queued; call
+    flush() or close() at suite teardown to wait for delivery.
+
+    With a ResultSpool, results that could not be posted are appended to it
+    for a later replay; with offline=True every result goes straight to the
+    spool and nothing is sent.
+    """
+
+    def __init__(self, url, guid, custom_path="../custom.ih", session=None, timeout=30, spool=None,
+                 offline=False):
+        if offline and spool is None:
+            raise ValueError("offline mode needs a spool")
+        self.url = url
+        self.guid = guid
+        self.custom_path = custom_path
+        self.session = session
+        self.timeout = timeout
+        self.spool = spool
+        self.offline = offline
+        self.sent = 0
+        self.failed = []
+        self._context = None
+        self._queue = queue.Queue()
+        self._thread = None
+        self._lock = threading.Lock()
+
+    def _load_context(self):
+        if self._context is None:
+            with open(self.custom_path, "r") as ref:
+                custom_data = ref.read()
+            self._context = (custom_data, os.environ.get('HOSTNAME'), os.environ.get('ATTEMPT_ID'))
+        return self._context
+
+    def payload(self, test_name, result, test_type):
+        """Build the JSON body posted for one assertion."""
+        custom_data, host_name, attempt_id = self._load_context()
+        result_status = "Passed" if result else "Failed"
+        result_score = 1 if result else 0
+        test_case_result_dto = TestCaseResultDto(test_name, test_type, 1, result_score, result_status, True, "")
+        test_case_results = {self.guid: test_case_result_dto}
+        return json.dumps(TestResults(json.dumps(test_case_results), custom_data, host_name, attempt_id))
+
+    def add(self, test_name, result, test_type):
+        """Queue one assertion result for sending, or spool it when offline."""
+        final_result = self.payload(test_name, result, test_type)
+        if self.offline:
+            self.spool.append(final_result)
+            return
+        self._queue.put(final_result)
+        with self._lock:
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._send_loop, name="result-collector", daemon=True)
+                self._thread.start()
+
+    def _send_loop(self):
+        session = self.session if self.session is not None else requests.Session()
+        while True:
+            final_result = self._queue.get()
+            try:
+                if final_result is None:
+                    return
+                self._deliver(session, final_result)
+            except Exception as error:
+                # Keep the sender alive so later results and flush() are not stranded.
+                print(f'⚠️ Unable to record a test case result: {error!r}')
+            finally:
+                self._queue.task_done()
+
+    def _deliver(self, session, final_result):
+        try:
+            response = session.post(self.url, final_result, headers={"Content-Type": "application/json"},
+                                    timeout=self.timeout)
+            delivered = response.status_code in [200, 201]
+        except Exception:
+            delivered = False
+        if delivered:
+            self.sent += 1
+            return
+        self.failed.append(final_result)
+        if self.spool is not None:
+            self.spool.append(final_result)
+            return
+        custom_data, host_name, _ = self._context
+        print(f'⚠️ Unable to push test cases from {host_name}, please try again![{len(custom_data)}]')
+
+    def flush(self, timeout=None):
+        """
+        Block until every queued result has been handled.
+
+        Args:
+            timeout (float): Seconds to wait at most; None waits until the
+                queue is empty
+
+        Returns:
+            bool: True if the queue drained, False if the timeout expired first
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        with self._queue.all_tasks_done:
+            while self._queue.unfinished_tasks:
+                remaining = None if deadline is None else deadline - time.monotonic()
+                if remaining is not None and remaining <= 0:
+                    return False
+                self._queue.all_tasks_done.wait(remaining)
+        return True
+
+    def close(self):
+        """Post every queued result, stop the sender thread and close the spool."""
+        with self._lock:
+            thread, self._thread = self._thread, None
+        if thread is not None:
+            self._queue.put(None)
+            thread.join()
+        if self.spool is not None:
+            self.spool.close()
@@ -0,0 +1,190 @@
+"""
+Offline spool for test results.
+
+yakshaAssert can append each TestResults payload to a local JSONL file
+instead of posting it; the replay command pushes the spooled payloads later.
+
+Usage:
+    YAKSHA_RESULT_SPOOL=results.jsonl python -m unittest discover test
+    python -m test.ResultSpool results.jsonl --retries 5
+"""
+
+import argparse
+import hashlib
+import json
+import sys
+import threading
+import time
+import requests
+
+
+class ResultSpool:
+    """Append-only JSONL file of TestResults payloads, one per line."""
+
+    def __init__(self, path):
+        self.path = path
+        self._handle = None
+        self._lock = threading.Lock()
+
+    def append(self, final_result):
+        """Append one JSON payload string."""
+        with self._lock:
+            if self._handle is None:
+                self._handle = open(self.path, "a", encoding="utf-8")
+            self._handle.write(final_result + "\n")
+            self._handle.flush()
+
+    def close(self):
+        with self._lock:
+            if self._handle is not None:
+                self._handle.close()
+                self._handle = None
+
+
+def read_spool(path):
+    """Return the payload strings in a spool file, skipping blank and truncated lines."""
+    payloads = []
+    with open(path, "r", encoding="utf-8") as handle:
+        for line in handle:
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                json.loads(line)
+            except ValueError:
+                continue
+            payloads.append(line)
+    return payloads
+
+
+def result_key(final_result, position=None):
+    """
+    Return the key identifying a payload.
+
+    Payloads with an attempt id are keyed by (attempt id, test name), so a
+    later result for the same test in the same attempt supersedes an earlier
+    one. Without an attempt id separate runs cannot be told apart, so the
+    payload's position in the spool is added and it is never superseded.
+
+    Args:
+        final_result (str): JSON payload string
+        position (int): Index of the payload in the spool
+
+    Returns:
+        tuple: (attempt id, test name) or (None, test name, position)
+    """
+    test_results = json.loads(final_result)
+    test_case_results = json.loads(test_results["testCaseResults"])
+    method_names = ",".join(sorted(dto["methodName"] for dto in test_case_results.values()))
+    attempt_id = test_results.get("attemptId")
+    if attempt_id is None:
+        return None, method_names, position
+    return attempt_id, method_names
+
+
+def _ledger_path(spool_path):
+    return spool_path + ".sent"
+
+
+def _digest(final_result):
+    return hashlib.sha256(final_result.encode("utf-8")).hexdigest()
+
+
+def _read_ledger(spool_path):
+    """Return the digest of the payload last delivered for each key."""
+    delivered = {}
+    try:
+        with open(_ledger_path(spool_path), "r", encoding="utf-8") as handle:
+            for line in handle:
+                if line.strip():
+                    entry = json.loads(line)
+                    delivered[tuple(entry["key"])] = entry["digest"]
+    except FileNotFoundError:
+        pass
+    return delivered
+
+
+def _post_with_retries(session, url, final_result, retries, backoff, timeout, sleep):
+    """Post one payload, retrying transient failures; return whether it was accepted."""
+    for attempt in range(retries + 1):
+        if attempt:
+            sleep(backoff * 2 ** (attempt - 1))
+        try:
+            response = session.post(url, final_result, headers={"Content-Type": "application/json"},
+                                    timeout=timeout)
+        except requests.RequestException:
+            continue
+        if response.status_code in [200, 201]:
+            return True
+        if response.status_code != 429 and response.status_code < 500:
+            return False
+    return False
+
+
+def replay(spool_path, url, session=None, retries=3, backoff=0.5, timeout=30, sleep=time.sleep):
+    """
+    Push spooled payloads, keeping only the latest one per attempt and test.
+
+    Payloads without an attempt id are all pushed, see result_key. Each
+    delivery is recorded in "<spool>.sent" with a digest of the payload, so
+    running replay again only sends keys whose latest payload has not been
+    delivered yet, including a newer result for a key that was sent before.
+    Connection errors, 429 and 5xx responses are retried with exponential
+    backoff.
+
+    Args:
+        spool_path (str): Spool file written by ResultSpool
+        url (str): Endpoint to post each payload to
+        session (requests.Session): Optional session; one is created otherwise
+        retries (int): Extra attempts per payload after the first
+        backoff (float): Delay before the first retry, doubled each time
+        timeout (float): Per-request timeout in seconds
+        sleep (callable): Used to wait between retries
+
+    Returns:
+        dict: Counts of sent, skipped (already delivered or superseded) and
+            failed payloads
+    """
+    payloads = read_spool(spool_path)
+    latest = {}
+    for position, final_result in enumerate(payloads):
+        key = result_key(final_result, position)
+        latest.pop(key, None)
+        latest[key] = final_result
+    delivered = _read_ledger(spool_path)
+    session = session if session is not None else requests.Session()
+    summary = {"sent": 0, "skipped": len(payloads) - len(latest), "failed": 0}
+
+    with open(_ledger_path(spool_path), "a", encoding="utf-8") as ledger:
+        for key, final_result in latest.items():
+            digest = _digest(final_result)
+            if delivered.get(key) == digest:
+                summary["skipped"] += 1
+                continue
+            if _post_with_retries(session, url, final_result, retries, backoff, timeout, sleep):
+                ledger.write(json.dumps({"key": list(key), "digest": digest}) + "\n")
+                ledger.flush()
+                summary["sent"] += 1
+            else:
+                summary["failed"] += 1
+    return summary
+
+
+def main(argv=None):
+    """Command-line entry point for replaying a spool."""
+    from test.TestUtils import TestUtils
+
+    parser = argparse.ArgumentParser(description="Push spooled test results.")
+    parser.add_argument("spool", help="JSONL spool file to replay")
+    parser.add_argument("--url", default=TestUtils.URL, help="endpoint to post results to")
+    parser.add_argument("--retries", type=int, default=3, help="extra attempts per result")
+    parser.add_argument("--backoff", type=float, default=0.5, help="initial delay between attempts, in seconds")
+    args = parser.parse_args(argv)
+
+    summary = replay(args.spool, args.url, retries=args.retries, backoff=args.backoff)
+    print(f"sent {summary['sent']}, skipped {summary['skipped']}, failed {summary['failed']}")
+    return 1 if summary["failed"] else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,99 @@
+from lambda_analyzer import LambdaIndex
+import importlib
+import inspect
+
+
+class SourceCache:
+    """
+    Session-wide cache of the module under test and of its parsed source.
+
+    The module is imported once for all suites, its source file is parsed
+    once into a LambdaIndex, and function sources are read once each; later
+    checks are dictionary lookups.
+    """
+
+    MODULE_NAMES = ("skeleton", "solution")
+    _module = None
+    _module_loaded = False
+    _indexes = {}
+    _sources = {}
+
+    @classmethod
+    def module(cls):
+        """Return the first importable module in MODULE_NAMES, or None."""
+        if not cls._module_loaded:
+            for module_name in cls.MODULE_NAMES:
+                try:
+                    cls._module = importlib.import_module(module_name)
+                    break
+                except ImportError:
+                    continue
+            cls._module_loaded = True
+        return cls._module
+
+    @classmethod
+    def index(cls, module):
+        """Return the cached LambdaIndex of a module, or None if its source cannot be read."""
+        key = getattr(module, "__name__", None)
+        if key not in cls._indexes:
+            try:
+                cls._indexes[key] = LambdaIndex.from_file(inspect.getsourcefile(module))
+            except Exception:
+                cls._indexes[key] = None
+        return cls._indexes[key]
+
+    @classmethod
+    def source(cls, module, function_name):
+        """Return the cached source of a module function, or "" if it cannot be read."""
+        key = (getattr(module, "__name__", None), function_name)
+        if key not in cls._sources:
+            try:
+                cls._sources[key] = inspect.getsource(getattr(module, function_name))
+            except Exception:
+                cls._sources[key] = ""
+        return cls._sources[key]
+
+    @classmethod
+    def function(cls, module, function_name):
+        """Return the FunctionInfo of a module function, or None."""
+        index = cls.index(module)
+        return index.function(function_name) if index is not None else None
+
+    @classmethod
+    def is_implemented(cls, module, function_name):
+        """
+        True when the function has no pass statement and more than three lines.
+
+        Functions not defined at the top level of the module's source file,
+        such as imported or assigned ones, are checked on their own source.
+        """
+        info = cls.function(module, function_name)
+        if info is None:
+            source = cls.source(module, function_name).strip()
+            return bool(source) and "pass" not in source and len(source.split("\n")) > 3
+        return info.is_implemented
+
+    @classmethod
+    def uses_lambda_with(cls, module, function_name, *callees):
+        """
+        True when the function has a lambda and calls each callee with a lambda argument.
+
+        Functions missing from the module's index only need their source to
+        mention "lambda" and each callee.
+        """
+        info = cls.function(module, function_name)
+        if info is None:
+            source = cls.source(module, function_name)
+            return "lambda" in source and all(callee in source for callee in callees)
+        if not info.lambda_count:
+            return False
+        index = cls.index(module)
+        return all(index.uses_lambda_with(function_name, callee) for callee in callees)
+
+    @classmethod
+    def clear(cls):
+        """Forget the cached module, indexes and sources."""
+        cls._module = None
+        cls._module_loaded = False
+        cls._indexes.clear()
+        cls._sources.clear()
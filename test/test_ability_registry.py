@@ -0,0 +1,51 @@
+"""
+Tests for the ability registry and its compiled scaling tables.
+"""
+
+import unittest
+from ability_registry import AbilityRegistry
+
+
+class TestAbilityRegistry(unittest.TestCase):
+    def setUp(self):
+        self.registry = AbilityRegistry(max_level=30)
+        self.scaling = lambda level: 20 + level * 4.5
+        self.registry.register("Fireball", self.scaling, mana_cost=30, cooldown=3)
+
+    def test_power_table_matches_scaling_lambda(self):
+        for level in range(1, 31):
+            self.assertEqual(self.registry.power("Fireball", level), self.scaling(level))
+        self.assertEqual(list(self.registry.power_batch("Fireball", [1, 30, 7])),
+                         [self.scaling(1), self.scaling(30), self.scaling(7)])
+        with self.assertRaises(ValueError):
+            self.registry.power("Fireball", 31)
+        with self.assertRaises(ValueError):
+            self.registry.power_batch("Fireball", [0, 5])
+        for level in (2.5, 3.0, "3", None):
+            with self.assertRaises(ValueError):
+                self.registry.power("Fireball", level)
+        for levels in ([1, 2.5, 3], [1, "3"], [None, 2]):
+            with self.assertRaises(ValueError):
+                self.registry.power_batch("Fireball", levels)
+
+    def test_usable_mask(self):
+        players = [
+            {"name": "A", "mana": 100},
+            {"name": "B", "mana": 10},
+            {"name": "C", "mana": 50, "cooldowns": {"Fireball": 1.5}},
+            {"name": "D", "mana": 30, "cooldowns": {"Heal": 4}},
+        ]
+        self.assertEqual(self.registry.usable_mask(players, "Fireball"), 0b1001)
+        everyone_ready = lambda player, ability: True
+        self.assertEqual(self.registry.usable_mask(players, "Fireball", everyone_ready), 0b1101)
+        self.assertEqual(self.registry.usable_mask([], "Fireball"), 0)
+
+    def test_duplicate_registration(self):
+        with self.assertRaises(ValueError):
+            self.registry.register("Fireball", self.scaling)
+        with self.assertRaises(KeyError):
+            self.registry.get("Heal")
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,50 @@
+"""
+Tests for the benchmark suite.
+"""
+
+import json
+import os
+import tempfile
+import unittest
+from unittest import mock
+from benchmark import build_cases, run_benchmarks, find_regressions, main
+
+
+class TestBenchmark(unittest.TestCase):
+    def test_report_covers_every_demonstrate_function(self):
+        report = run_benchmarks(sizes=[20, 40], repeat=1)
+        cases = {result["case"] for result in report["results"]}
+        for name in ["demonstrate_player_transformations", "demonstrate_entity_filtering",
+                     "demonstrate_item_sorting", "demonstrate_game_calculations",
+                     "demonstrate_ability_system", "demonstrate_combat_system",
+                     "demonstrate_level_system"]:
+            self.assertIn(name, cases)
+        self.assertEqual({result["size"] for result in report["results"]}, {20, 40})
+        json.dumps(report)
+
+    def test_fixtures_built_only_for_selected_cases(self):
+        cases = dict(build_cases(50, 0))
+        with mock.patch("benchmark.iter_players", side_effect=AssertionError("players built")), \
+                mock.patch("benchmark.iter_entities", side_effect=AssertionError("entities built")):
+            self.assertEqual(len(cases["batch.path_lengths"]()()[0]), 49)
+            cases["indexed.inventory_top_20"]()()
+
+    def test_regression_detection(self):
+        baseline = {"results": [{"case": "a", "size": 10, "seconds": 1.0},
+                                {"case": "b", "size": 10, "seconds": 1.0}]}
+        current = {"results": [{"case": "a", "size": 10, "seconds": 1.1},
+                               {"case": "b", "size": 10, "seconds": 2.0},
+                               {"case": "c", "size": 10, "seconds": 9.0}]}
+        self.assertEqual(find_regressions(baseline, current, 1.25), [("b", 10, 1.0, 2.0)])
+
+    def test_cli_writes_json(self):
+        path = os.path.join(tempfile.mkdtemp(), "bench.json")
+        status = main(["--sizes", "10", "--repeat", "1", "--case", "batch.path_lengths", "--output", path])
+        self.assertEqual(status, 0)
+        with open(path) as handle:
+            report = json.load(handle)
+        self.assertEqual([r["case"] for r in report["results"]], ["batch.path_lengths"])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,56 @@
+"""
+Tests for the combat broad phase.
+"""
+
+import random
+import unittest
+from broad_phase import candidate_pairs, player_position
+from spatial_index import SpatialGrid
+
+
+class TestCandidatePairs(unittest.TestCase):
+    def setUp(self):
+        rng = random.Random(5)
+        self.players = [{"name": f"P{n}", "level": 1, "health": 1, "mana": 1,
+                         "position_x": rng.uniform(0, 1000), "position_y": rng.uniform(0, 1000)}
+                        for n in range(40)]
+        self.players.append({"name": "Unplaced", "level": 1, "health": 1, "mana": 1})
+        self.entities = [{"id": f"E{n}", "type": "enemy", "active": True,
+                          "position_x": rng.uniform(0, 1000), "position_y": rng.uniform(0, 1000)}
+                         for n in range(300)]
+
+    def brute_force(self, combat_range):
+        pairs = []
+        for player in self.players:
+            px, py = player_position(player)
+            for entity in self.entities:
+                if (entity["position_x"] - px) ** 2 + (entity["position_y"] - py) ** 2 <= combat_range ** 2:
+                    pairs.append((player["name"], entity["id"]))
+        return pairs
+
+    def test_matches_all_pairs_check(self):
+        for combat_range in (25, 120, 400):
+            pairs = candidate_pairs(self.players, self.entities, combat_range)
+            self.assertEqual([(p["name"], e["id"]) for p, e, _ in pairs], self.brute_force(combat_range))
+        self.assertEqual(candidate_pairs(self.players, self.entities, 0), [])
+
+    def test_reuses_caller_grid(self):
+        grid = SpatialGrid(cell_size=50)
+        for row, entity in enumerate(self.entities):
+            grid.insert(row, entity["position_x"], entity["position_y"])
+        pairs = candidate_pairs(self.players, self.entities, 120, grid=grid)
+        self.assertEqual([(p["name"], e["id"]) for p, e, _ in pairs], self.brute_force(120))
+        for _, entity, distance in pairs:
+            self.assertLessEqual(distance, 120)
+
+    def test_shared_and_missing_ids(self):
+        entities = [{"id": None, "position_x": 110, "position_y": 100},
+                    {"id": "E1", "position_x": 100, "position_y": 120},
+                    {"id": "E1", "position_x": 90, "position_y": 100}]
+        pairs = candidate_pairs([{"name": "P"}], entities, 50)
+        self.assertEqual([entity for _, entity, _ in pairs], entities)
+        self.assertEqual([distance for _, _, distance in pairs], [10, 20, 10])
+
+
+if __name__ == '__main__':
+    unittest.main()
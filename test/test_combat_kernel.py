@@ -0,0 +1,54 @@
+"""
+Tests for the batched combat kernel against the reference lambdas.
+"""
+
+import random
+import unittest
+from combat_kernel import draw_uniform, resolve_encounters
+from combat_simulation import ROUNDS_PER_ENCOUNTER, simulate_encounter
+
+
+class TestCombatKernel(unittest.TestCase):
+    def setUp(self):
+        rng = random.Random(21)
+        self.count = 400
+        self.levels = [rng.randint(1, 30) for _ in range(self.count)]
+        self.manas = [rng.randint(0, 300) for _ in range(self.count)]
+        self.enemy_levels = [rng.randint(1, 30) for _ in range(self.count)]
+        self.enemy_healths = [rng.choice([50, 100, 160.0, 400]) for _ in range(self.count)]
+
+    def test_matches_reference_encounters(self):
+        rolls = draw_uniform(random.Random(4), self.count * ROUNDS_PER_ENCOUNTER)
+        result = resolve_encounters(self.levels, self.manas, self.enemy_levels, self.enemy_healths, rolls=rolls)
+        total = 0
+        for i in range(self.count):
+            window = rolls[i * ROUNDS_PER_ENCOUNTER:(i + 1) * ROUNDS_PER_ENCOUNTER]
+            hits, attacks, damage, defeated, xp = simulate_encounter(
+                (self.levels[i], self.manas[i]), (self.enemy_levels[i], self.enemy_healths[i]), window)
+            self.assertEqual((result["hits"][i], result["attacks"][i], result["damage"][i]), (hits, attacks, damage))
+            self.assertEqual(bool(result["defeated_mask"] >> i & 1), defeated)
+            self.assertEqual(result["rewards"][i], xp)
+            self.assertEqual(sum(result["hit_masks"][r] >> i & 1 for r in range(ROUNDS_PER_ENCOUNTER)), hits)
+            total += xp
+        self.assertEqual(result["total_reward"], total)
+
+    def test_seeded_batches_are_reproducible(self):
+        first = resolve_encounters(self.levels, self.manas, self.enemy_levels, self.enemy_healths, rng=8)
+        second = resolve_encounters(self.levels, self.manas, self.enemy_levels, self.enemy_healths,
+                                    rng=random.Random(8))
+        self.assertEqual(first, second)
+        values = draw_uniform(random.Random(1), 10000)
+        self.assertTrue(all(0.0 <= v < 1.0 for v in values))
+        self.assertAlmostEqual(sum(values) / len(values), 0.5, delta=0.02)
+
+    def test_input_validation(self):
+        with self.assertRaises(ValueError):
+            resolve_encounters([1], [1, 2], [1], [1], rng=0)
+        with self.assertRaises(ValueError):
+            resolve_encounters([1], [1], [1], [1], rolls=[0.5])
+        empty = resolve_encounters([], [], [], [], rng=0)
+        self.assertEqual((empty["total_reward"], empty["defeated_mask"]), (0, 0))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,67 @@
+"""
+Tests for the sharded combat simulation.
+"""
+
+import random
+import unittest
+import skeleton
+from combat_simulation import CombatSummary, combat_rosters, simulate_battles, simulate_encounter
+
+
+class TestCombatSimulation(unittest.TestCase):
+    def setUp(self):
+        self.players = skeleton.prepare_player_data()
+        self.entities = skeleton.prepare_entity_data()
+
+    def test_reproducible_across_worker_counts(self):
+        serial = simulate_battles(self.players, self.entities, 5000, seed=9, workers=1, shard_size=700)
+        parallel = simulate_battles(self.players, self.entities, 5000, seed=9, workers=3, shard_size=700)
+        self.assertEqual(serial.as_dict(), parallel.as_dict())
+        self.assertEqual(serial.encounters, 5000)
+        other_seed = simulate_battles(self.players, self.entities, 5000, seed=10, workers=1, shard_size=700)
+        self.assertNotEqual(serial.as_dict(), other_seed.as_dict())
+
+    def test_summary_merge_matches_single_pass(self):
+        rng = random.Random(1)
+        outcomes = [simulate_encounter((rng.randint(1, 20), 100), (5, 100), [rng.random() for _ in range(3)])
+                    for _ in range(500)]
+        whole = CombatSummary()
+        left, right = CombatSummary(), CombatSummary()
+        for i, outcome in enumerate(outcomes):
+            whole.add(*outcome)
+            (left if i < 200 else right).add(*outcome)
+        merged = left.merge(right).as_dict()
+        for key, value in whole.as_dict().items():
+            self.assertAlmostEqual(merged[key], value)
+
+    def test_encounter_reference(self):
+        self.assertEqual(simulate_encounter((20, 300), (5, 100), [0.1, 0.9, 0.9]), (1, 1, 160.0, True, 110))
+        self.assertEqual(simulate_encounter((1, 0), (5, 100), [0.99, 0.99, 0.99]), (0, 3, 0, False, 0))
+
+    def test_encounters_match_demonstration(self):
+        demo = skeleton.demonstrate_combat_system(self.players, self.entities, quiet=True)
+        self.assertTrue(demo["attackers"])
+        players = {p["name"]: p for p in self.players}
+        enemies = {e["id"]: e for e in self.entities}
+        rng = random.Random(42)
+        rolls = iter(rng.random, None)
+        for row, (name, target_id) in enumerate(zip(demo["attackers"], demo["target_ids"])):
+            player, enemy = players[name], enemies[target_id]
+            hits, _, dealt, defeated, xp = simulate_encounter(
+                (player["level"], player["mana"]), (enemy.get("level", 5), enemy.get("health", 100)), rolls)
+            self.assertEqual((hits, dealt, defeated, xp),
+                             (demo["hits"][row], demo["damage"][row], bool(demo["defeated"][row]), demo["rewards"][row]))
+
+    def test_rosters_skip_inactive_enemies(self):
+        _, defenders = combat_rosters(self.players, self.entities)
+        active = [e for e in self.entities if e["type"] == "enemy" and e["active"]]
+        self.assertEqual(len(defenders), len(active))
+        self.assertLess(len(active), sum(e["type"] == "enemy" for e in self.entities))
+
+    def test_requires_enemies(self):
+        with self.assertRaises(ValueError):
+            simulate_battles(self.players, [e for e in self.entities if e["type"] != "enemy"], 10)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,57 @@
+"""
+Tests for the timing-wheel cooldown scheduler.
+"""
+
+import unittest
+from ability_registry import AbilityRegistry
+from cooldown_scheduler import CooldownScheduler
+
+
+class TestCooldownScheduler(unittest.TestCase):
+    def setUp(self):
+        self.scheduler = CooldownScheduler(tick=0.5, slots=8)
+
+    def test_expiry_order_and_queries(self):
+        self.scheduler.start("Aria", "Fireball", 3)
+        self.scheduler.start("Borin", "Heal", 1)
+        self.scheduler.start("Aria", "Heal", 1.2)
+        self.assertFalse(self.scheduler.is_ready("Aria", "Fireball"))
+        self.assertEqual(self.scheduler.remaining("Aria", "Fireball"), 3.0)
+        self.assertEqual(self.scheduler.advance(1.0), [("Borin", "Heal")])
+        self.assertEqual(self.scheduler.advance(1.4), [])
+        self.assertEqual(self.scheduler.advance(1.5), [("Aria", "Heal")])
+        self.assertEqual(self.scheduler.remaining("Aria", "Fireball"), 1.5)
+        self.assertEqual(self.scheduler.advance(3.0), [("Aria", "Fireball")])
+        self.assertEqual(len(self.scheduler), 0)
+        with self.assertRaises(ValueError):
+            self.scheduler.advance(2.0)
+
+    def test_restart_cancel_and_long_cooldowns(self):
+        self.scheduler.start("Aria", "Shield", 10)
+        self.scheduler.start("Aria", "Fireball", 1)
+        self.scheduler.start("Aria", "Fireball", 2)
+        self.assertEqual(self.scheduler.advance(1.5), [])
+        self.assertEqual(self.scheduler.advance(6.0), [("Aria", "Fireball")])
+        self.assertTrue(self.scheduler.cancel("Aria", "Shield"))
+        self.assertFalse(self.scheduler.cancel("Aria", "Shield"))
+        self.scheduler.start("Borin", "Shield", 10)
+        self.assertEqual(self.scheduler.advance(15.0), [])
+        self.assertEqual(self.scheduler.advance(16.0), [("Borin", "Shield")])
+
+    def test_large_jump_sweeps_every_slot(self):
+        for n in range(20):
+            self.scheduler.start(f"P{n}", "Fireball", n + 1)
+        expired = self.scheduler.advance(100.0)
+        self.assertEqual(expired, [(f"P{n}", "Fireball") for n in range(20)])
+
+    def test_ready_check_plugs_into_usable_mask(self):
+        registry = AbilityRegistry()
+        registry.register("Fireball", lambda level: level, mana_cost=30, cooldown=3)
+        players = [{"name": "Aria", "mana": 100}, {"name": "Borin", "mana": 100}]
+        self.scheduler.start("Borin", "Fireball", registry.get("Fireball").cooldown)
+        mask = registry.usable_mask(players, "Fireball", self.scheduler.ready_check())
+        self.assertEqual(mask, 0b01)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,91 @@
+"""
+Tests for the synthetic game data generators.
+"""
+
+import io
+import contextlib
+import types
+import unittest
+from collections import Counter
+import data_generators as gen
+import skeleton
+from validation import validate_records, PLAYER_SCHEMA, ENTITY_SCHEMA, ITEM_SCHEMA
+
+
+class TestDataGenerators(unittest.TestCase):
+    def test_same_seed_same_records(self):
+        self.assertEqual(list(gen.iter_players(50, seed=3)), list(gen.iter_players(50, seed=3)))
+        self.assertEqual(list(gen.iter_items(50, seed=3)), list(gen.iter_items(50, seed=3)))
+        self.assertNotEqual(list(gen.iter_entities(50, seed=3)), list(gen.iter_entities(50, seed=4)))
+
+    def test_records_match_schemas(self):
+        for records, schema in ((list(gen.iter_players(200)), PLAYER_SCHEMA),
+                                (list(gen.iter_entities(200)), ENTITY_SCHEMA),
+                                (list(gen.iter_items(200)), ITEM_SCHEMA)):
+            result = validate_records(records, schema, use_cache=False)
+            self.assertEqual(len(result.valid), 200)
+
+    def test_generators_are_lazy(self):
+        players = gen.iter_players(10 ** 9)
+        self.assertIsInstance(players, types.GeneratorType)
+        self.assertEqual(next(players)["name"], "Player0")
+
+    def test_type_weights(self):
+        counts = Counter(e["type"] for e in gen.iter_entities(
+            2000, type_weights={"enemy": 3, "npc": 1, "obstacle": 0}))
+        self.assertEqual(set(counts), {"enemy", "npc"})
+        self.assertGreater(counts["enemy"], 2 * counts["npc"])
+
+    def test_rarity_skew(self):
+        flat = Counter(i["rarity"] for i in gen.iter_items(3000, rarity_skew=0))
+        skewed = Counter(i["rarity"] for i in gen.iter_items(3000, rarity_skew=3))
+        self.assertGreater(flat["legendary"], 400)
+        self.assertLess(skewed["legendary"], 50)
+        self.assertGreater(skewed["common"], flat["common"])
+
+    def test_clustered_positions_stay_in_bounds(self):
+        bounds = (0.0, 0.0, 200.0, 200.0)
+        points = list(gen.iter_coordinates(1000, spatial="clustered", bounds=bounds, clusters=2,
+                                           cluster_spread=5.0))
+        self.assertTrue(all(0 <= x <= 200 and 0 <= y <= 200 for x, y in points))
+        # Two tight clusters cover only a handful of 10x10 cells.
+        self.assertLess(len({(int(x // 10), int(y // 10)) for x, y in points}), 40)
+        with self.assertRaises(ValueError):
+            next(gen.iter_coordinates(1, spatial="spiral"))
+
+    def test_columnar_builders_match_lazy_records(self):
+        table = gen.entity_table(300, seed=5, spatial="clustered")
+        self.assertEqual([dict(row) for row in table],
+                         list(gen.iter_entities(300, seed=5, spatial="clustered")))
+
+        columns = gen.player_column_buffers(300, seed=5, level_range=(10, 20))
+        players = list(gen.iter_players(300, seed=5, level_range=(10, 20)))
+        for name in ("level", "health", "mana", "score"):
+            self.assertEqual(list(columns[name]), [float(p[name]) for p in players])
+
+        buffer = gen.coordinate_buffer(100, seed=5)
+        points = list(gen.iter_coordinates(100, seed=5))
+        self.assertEqual(list(zip(buffer[0::2], buffer[1::2])), points)
+
+    def test_prepare_functions_generate_synthetic_data(self):
+        players = skeleton.prepare_player_data(count=500, seed=1)
+        self.assertEqual(players, list(gen.iter_players(500, 1)))
+        self.assertEqual(len(skeleton.prepare_entity_data(count=40)), 40)
+        self.assertEqual(len(skeleton.prepare_inventory_data(count=40)), 40)
+        self.assertEqual(len(skeleton.prepare_coordinate_data(count=40)), 40)
+        lazy = skeleton.prepare_player_data(count=3, seed=1, lazy=True)
+        self.assertNotIsInstance(lazy, list)
+        self.assertEqual(list(lazy), players[:3])
+        self.assertEqual(len(skeleton.prepare_player_data()), 6)
+
+    def test_demonstrations_accept_synthetic_data(self):
+        output = io.StringIO()
+        with contextlib.redirect_stdout(output):
+            skeleton.demonstrate_player_transformations(skeleton.prepare_player_data(count=1000, seed=2))
+            skeleton.demonstrate_item_sorting(skeleton.prepare_inventory_data(count=1000, seed=2), limit=10)
+        self.assertIn("Player", output.getvalue())
+        self.assertIn("Item", output.getvalue())
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,104 @@
+"""
+Tests for the typed values returned by the demonstrate functions.
+"""
+
+import unittest
+from array import array
+from unittest import mock
+import skeleton
+from inventory_index import RARITY_RANKS
+from spatial_index import SpatialGrid
+from validation import Schema
+
+
+class TestDemoResults(unittest.TestCase):
+    def setUp(self):
+        self.players = skeleton.prepare_player_data()
+        self.entities = skeleton.prepare_entity_data()
+        self.inventory = skeleton.prepare_inventory_data()
+        self.coordinates = skeleton.prepare_coordinate_data()
+
+    def test_player_stats_are_aligned_arrays(self):
+        result = skeleton.demonstrate_player_transformations(self.players, quiet=True)
+        self.assertEqual(result["names"], [p["name"] for p in self.players])
+        for name in ("effective_health", "mana_regen", "normalized_score", "power_index"):
+            self.assertIsInstance(result[name], array)
+            self.assertEqual(len(result[name]), len(self.players))
+        self.assertEqual(list(result["mana_regen"]), [p["mana"] * 0.1 + p["level"] * 0.5 for p in self.players])
+
+    def test_entity_ids(self):
+        result = skeleton.demonstrate_entity_filtering(self.entities, quiet=True)
+        expected = [e["id"] for e in self.entities if e["type"] == "enemy" and e["active"]]
+        self.assertEqual(result["active_enemy_ids"], expected)
+        self.assertEqual(result["collectible_ids"], ["E2", "E9"])
+        self.assertEqual(result["northeast_target_ids"], ["E1", "E4", "E10"])
+        self.assertEqual(list(result["nearby_distances"]), sorted(result["nearby_distances"]))
+        self.assertEqual(len(result["nearby_distances"]), len(result["nearby_ids"]))
+
+    def test_entities_with_shared_or_missing_ids(self):
+        entities = [{"id": "E1", "type": "enemy", "position_x": 120, "position_y": 110, "active": True},
+                    {"type": "enemy"},
+                    {"id": "E1", "type": "enemy", "position_x": 130, "position_y": 140, "active": True},
+                    {"id": None, "type": "enemy", "position_x": 150, "position_y": 150, "active": True},
+                    {"id": ["unhashable"], "type": "item", "position_x": 90, "position_y": 90, "active": True}]
+        result = skeleton.demonstrate_entity_filtering(entities, quiet=True)
+        self.assertEqual(result["active_enemy_ids"], ["E1", "E1", None])
+        self.assertEqual(result["nearby_ids"], [["unhashable"], "E1", "E1", None])
+        self.assertEqual(result["northeast_target_ids"], ["E1", "E1", None])
+        grid = SpatialGrid.from_entities(entities, rows=[0, 2, 3, 4])
+        for _ in range(2):
+            indexed = skeleton.demonstrate_entity_filtering(entities, spatial_index=grid, quiet=True, use_cache=True)
+            self.assertEqual(indexed.data, result.data)
+
+    def test_item_orderings_are_permutations(self):
+        result = skeleton.demonstrate_item_sorting(self.inventory, quiet=True)
+        items = result["items"]
+        self.assertEqual(sorted(result["by_value"]), list(range(len(items))))
+        self.assertEqual([items[k] for k in result["by_value"]], sorted(items, key=lambda i: i["value"]))
+        self.assertEqual([items[k] for k in result["by_rarity"]],
+                         sorted(items, key=lambda i: RARITY_RANKS[i["rarity"]]))
+        self.assertTrue(all(items[k]["equipped"] for k in result["equipped"]))
+        limited = skeleton.demonstrate_item_sorting(self.inventory, limit=3, quiet=True)
+        self.assertEqual(list(limited["by_type_value"]), list(result["by_type_value"][:3]))
+
+    def test_calculation_arrays(self):
+        result = skeleton.demonstrate_game_calculations(self.coordinates, self.players, quiet=True)
+        self.assertEqual(list(result["segments"]), [50.0, 50.0, 60.0, 50.0, 80.0])
+        self.assertEqual(result["total_length"], 290.0)
+        self.assertEqual(result["damage"][result["names"].index("Cyra")], 160.0)
+
+    def test_ability_values(self):
+        result = skeleton.demonstrate_ability_system(quiet=True)
+        self.assertEqual(result["ability_names"], ["Fireball", "Heal", "Lightning Strike", "Stone Shield"])
+        self.assertEqual(result["scaling"][10][0], 65.0)
+        self.assertEqual(result["usable_mask"], 0b1001)
+
+    def test_combat_columns(self):
+        result = skeleton.demonstrate_combat_system(self.players, self.entities, quiet=True)
+        count = len(result["attackers"])
+        self.assertEqual(count, 15)
+        for name in ("target_ids", "distances", "hits", "damage", "defeated", "rewards"):
+            self.assertEqual(len(result[name]), count)
+        self.assertEqual(sum(result["rewards"]), sum(result["total_rewards"].values()))
+        empty = skeleton.demonstrate_combat_system([], [], quiet=True)
+        self.assertEqual(len(empty["hits"]), 0)
+
+    def test_level_columns(self):
+        result = skeleton.demonstrate_level_system(self.players, quiet=True)
+        self.assertEqual(list(result["levels"]), sorted(p["level"] for p in self.players))
+        self.assertEqual(result["xp_to_next"][0], 519)
+        self.assertEqual(list(result["stats"]["health"]), [120.0, 300.0, 600.0, 1100.0])
+        capped = skeleton.demonstrate_level_system([{"name": "Max", "level": 50, "health": 1, "mana": 1}], quiet=True)
+        self.assertEqual(capped["xp_to_next"][0], 0)
+        self.assertIsNone(skeleton.demonstrate_level_system([], quiet=True)["curve"])
+
+
+    def test_main_validates_each_record_once(self):
+        with mock.patch.object(Schema, "check", autospec=True, side_effect=Schema.check) as check:
+            results = skeleton.main(quiet=True)
+        self.assertEqual(len(results), 7)
+        self.assertEqual(check.call_count, len(self.players) + len(self.entities) + len(self.inventory))
+
+
+if __name__ == '__main__':
+    unittest.main()
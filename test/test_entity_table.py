@@ -0,0 +1,105 @@
+"""
+Tests for the columnar entity store.
+"""
+
+import io
+import contextlib
+import unittest
+from unittest import mock
+from entity_table import EntityTable, EntityRow
+import skeleton
+
+ENTITIES = [
+    {"id": "E1", "type": "enemy", "position_x": 150, "position_y": 120, "active": True},
+    {"id": "E2", "type": "item", "position_x": 90, "position_y": 95, "active": True},
+    {"id": "E3", "type": "enemy", "position_x": 300, "position_y": 50, "active": False},
+    {"id": "E4", "type": "enemy", "position_x": 130, "position_y": 190, "active": True},
+    {"id": "E5", "type": "npc", "position_x": 10, "position_y": 10, "active": True},
+    {"id": "E6", "type": "item", "position_x": 400, "position_y": 400, "active": False},
+    {"id": "E7", "type": "enemy", "position_x": 60, "position_y": 140, "active": True},
+    {"id": "E8", "type": "obstacle", "position_x": 220, "position_y": 210, "active": True},
+    {"id": "E9", "type": "enemy", "position_x": 105, "position_y": 101, "active": True},
+]
+
+
+class TestEntityTable(unittest.TestCase):
+    def setUp(self):
+        self.table = EntityTable.from_entities(ENTITIES)
+
+    def test_row_view_matches_source(self):
+        self.assertEqual(len(self.table), len(ENTITIES))
+        for row, entity in zip(self.table, ENTITIES):
+            self.assertEqual(dict(row), entity)
+            self.assertIs(type(row["position_x"]), int)
+
+    def test_masks_match_lambda_filters(self):
+        mask = self.table.type_mask("enemy") & self.table.active_mask()
+        expected = [e["id"] for e in filter(lambda e: e["type"] == "enemy" and e["active"], ENTITIES)]
+        self.assertEqual([self.table.ids[r] for r in self.table.select(mask)], expected)
+        self.assertEqual(self.table.count(mask), len(expected))
+        inactive = ~self.table.active_mask()
+        self.assertEqual([self.table.ids[r] for r in self.table.select(inactive)], ["E3", "E6"])
+        near = self.table.within_mask(100, 100, 100, candidates=mask)
+        self.assertEqual([self.table.ids[r] for r in self.table.select(near)], ["E1", "E4", "E7", "E9"])
+
+    def test_spatial_masks_match_row_checks(self):
+        for x, y, radius in [(100, 100, 100), (0, 0, 50), (220, 210, 0), (150.5, 99.5, 500)]:
+            expected = [r for r, e in enumerate(ENTITIES)
+                        if (e["position_x"] - x) ** 2 + (e["position_y"] - y) ** 2 <= radius ** 2]
+            self.assertEqual(self.table.select(self.table.within_mask(x, y, radius)), expected)
+        for sign_x, sign_y in [(1, 1), (1, -1), (-1, 1), (-1, -1)]:
+            expected = [r for r, e in enumerate(ENTITIES)
+                        if (e["position_x"] - 100) * sign_x > 0 and (e["position_y"] - 100) * sign_y > 0]
+            self.assertEqual(self.table.select(self.table.quadrant_mask(100, 100, sign_x, sign_y)), expected)
+        self.assertEqual(EntityTable().within_mask(0, 0, 10), 0)
+
+    def test_float_positions_widen_the_column(self):
+        self.table[0]["position_x"] = 150.5
+        self.assertEqual(self.table.position_x.typecode, "d")
+        self.assertEqual(self.table[0]["position_x"], 150.5)
+        self.assertEqual(self.table.position_y.typecode, "q")
+        self.assertEqual(self.table.select(self.table.within_mask(150.5, 120, 0)), [0])
+
+    def test_row_writes_update_masks(self):
+        row = self.table[self.table.row_of("E3")]
+        row["active"] = True
+        row["type"] = "item"
+        self.assertEqual(self.table.select(self.table.type_mask("item")), [1, 2, 5])
+        self.assertTrue(self.table.get_field(2, "active"))
+        with self.assertRaises(ValueError):
+            self.table.append("E1", "enemy", 0, 0)
+
+    def test_demonstrate_entity_filtering_accepts_table(self):
+        with contextlib.redirect_stdout(io.StringIO()) as from_table:
+            skeleton.demonstrate_entity_filtering(self.table)
+        with contextlib.redirect_stdout(io.StringIO()) as from_dicts:
+            skeleton.demonstrate_entity_filtering(ENTITIES)
+        self.assertEqual(from_table.getvalue(), from_dicts.getvalue())
+
+    def test_select_rows_is_lazy(self):
+        selection = self.table.select_rows(self.table.type_mask("enemy") & self.table.active_mask())
+        self.assertEqual(selection.ids(), ["E1", "E4", "E7", "E9"])
+        self.assertEqual(len(selection), 4)
+        self.assertEqual(dict(selection[1]), ENTITIES[3])
+        self.assertEqual(selection[2:].ids(), ["E7", "E9"])
+        self.assertEqual(self.table.select(self.table.all_mask() << 3), [3, 4, 5, 6, 7, 8])
+        self.assertEqual(self.table.select(0), [])
+
+    def test_demonstrations_use_table_masks(self):
+        players = skeleton.prepare_player_data()
+        with mock.patch.object(EntityRow, "__getitem__", autospec=True, side_effect=EntityRow.__getitem__) as read:
+            filtering = skeleton.demonstrate_entity_filtering(self.table, quiet=True)
+        self.assertEqual(filtering.data, skeleton.demonstrate_entity_filtering(ENTITIES, quiet=True).data)
+        # Only the nearby rows are read through row views, for their distances and report lines.
+        self.assertEqual(read.call_count, 4 * len(filtering["nearby_ids"]))
+        combat = skeleton.demonstrate_combat_system(players, self.table, quiet=True)
+        self.assertEqual(combat.data, skeleton.demonstrate_combat_system(players, ENTITIES, quiet=True).data)
+        with contextlib.redirect_stdout(io.StringIO()) as from_table:
+            skeleton.demonstrate_combat_system(players, self.table)
+        with contextlib.redirect_stdout(io.StringIO()) as from_dicts:
+            skeleton.demonstrate_combat_system(players, ENTITIES)
+        self.assertEqual(from_table.getvalue(), from_dicts.getvalue())
+
+
+if __name__ == '__main__':
+    unittest.main()
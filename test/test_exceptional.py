@@ -4,23 +4,16 @@ Exception handling tests for the Game Development Utility System.
 
 import unittest
 import os
-import importlib
 import sys
 import io
 import contextlib
 from test.TestUtils import TestUtils
+from test.SourceCache import SourceCache
 
 def check_file_exists(filename):
     """Check if a file exists in the current directory."""
     return os.path.exists(filename)
 
-def safely_import_module(module_name):
-    """Safely import a module, returning None if import fails."""
-    try:
-        return importlib.import_module(module_name)
-    except ImportError:
-        return None
-
 def check_function_exists(module, function_name):
     """Check if a function exists in a module."""
     return hasattr(module, function_name) and callable(getattr(module, function_name))
@@ -48,11 +41,8 @@ def check_raises(func, args, expected_exception=Exception):
         return False
 
 def load_module_dynamically():
-    """Load the student's module for testing"""
-    module_obj = safely_import_module("skeleton")
-    if module_obj is None:
-        module_obj = safely_import_module("solution")
-    return module_obj
+    """Load the student's module for testing, once per session"""
+    return SourceCache.module()
 
 class TestAssignment(unittest.TestCase):
     def setUp(self):
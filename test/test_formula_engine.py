@@ -0,0 +1,42 @@
+"""
+Tests for the memoized formula engine.
+"""
+
+import unittest
+import skeleton
+from formula_engine import FormulaEngine
+
+
+class TestFormulaEngine(unittest.TestCase):
+    def setUp(self):
+        self.engine = FormulaEngine.with_game_formulas(cache_size=4)
+        self.players = skeleton.prepare_player_data()
+
+    def test_batch_matches_demonstration(self):
+        demo = skeleton.demonstrate_game_calculations(skeleton.prepare_coordinate_data(), self.players, quiet=True)
+        results = self.engine.evaluate_all(self.players)
+        self.assertEqual(results["damage"], list(demo["damage"]))
+        self.assertEqual(results["movement_speed"], list(demo["speed"]))
+
+    def test_hit_and_miss_counters(self):
+        repeated = [self.players[0], self.players[1]] * 5
+        self.engine.evaluate_batch("damage", repeated)
+        info = self.engine.cache_info("damage")
+        self.assertEqual((info.hits, info.misses, info.currsize), (8, 2, 2))
+        self.engine.evaluate_batch("damage", self.players)
+        self.assertEqual(self.engine.cache_info("damage").currsize, 4)
+        self.engine.clear_cache()
+        self.assertEqual(self.engine.cache_info("damage").hits, 0)
+
+    def test_registration(self):
+        self.engine.register("crit", lambda level: min(5 + level, 50), ["level"])
+        self.assertEqual(self.engine.evaluate_batch("crit", [{"level": 10}, {"level": 80}]), [15, 50])
+        self.assertEqual(self.engine.evaluate("crit", 10), 15)
+        with self.assertRaises(ValueError):
+            self.engine.register("crit", abs, ["level"])
+        with self.assertRaises(ValueError):
+            self.engine.register("empty", abs, [])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -3,25 +3,17 @@ Functional tests for the Game Development Utility System.
 """
 
 import unittest
-import inspect
 import os
-import importlib
 import sys
 import io
 import contextlib
 from test.TestUtils import TestUtils
+from test.SourceCache import SourceCache
 
 def check_file_exists(filename):
     """Check if a file exists in the current directory."""
     return os.path.exists(filename)
 
-def safely_import_module(module_name):
-    """Safely import a module, returning None if import fails."""
-    try:
-        return importlib.import_module(module_name)
-    except ImportError:
-        return None
-
 def check_function_exists(module, function_name):
     """Check if a function exists in a module."""
     return hasattr(module, function_name) and callable(getattr(module, function_name))
@@ -37,26 +29,21 @@ def safely_call_function(module, function_name, *args, **kwargs):
     except Exception:
         return None
 
-def safely_get_source(module, function_name):
-    """Safely get the source code of a function, returning empty string if it fails."""
-    if not check_function_exists(module, function_name):
-        return ""
-    try:
-        return inspect.getsource(getattr(module, function_name))
-    except Exception:
-        return ""
-
 def check_for_implementation(module, function_name):
     """Check if a function has a real implementation and not just 'pass'."""
-    source = safely_get_source(module, function_name)
-    return source and "pass" not in source.strip() and len(source.strip().split('\n')) > 3
+    if not check_function_exists(module, function_name):
+        return False
+    return SourceCache.is_implemented(module, function_name)
+
+def check_lambda_usage(module, function_name, *names):
+    """Check that a function uses lambda and calls the given builtins with lambda arguments."""
+    if not check_function_exists(module, function_name):
+        return False
+    return SourceCache.uses_lambda_with(module, function_name, *names)
 
 def load_module_dynamically():
-    """Load the student's module for testing"""
-    module_obj = safely_import_module("skeleton")
-    if module_obj is None:
-        module_obj = safely_import_module("solution")
-    return module_obj
+    """Load the student's module for testing, once per session"""
+    return SourceCache.module()
 
 class TestAssignment(unittest.TestCase):
     def setUp(self):
@@ -279,39 +266,20 @@ class TestAssignment(unittest.TestCase):
                     print("TestLambdaUsage = Failed")
                     return
             
-            # Check for lambda usage in each function
-            player_transform_code = safely_get_source(self.module_obj, "demonstrate_player_transformations")
-            entity_filter_code = safely_get_source(self.module_obj, "demonstrate_entity_filtering")
-            item_sort_code = safely_get_source(self.module_obj, "demonstrate_item_sorting")
-            game_calc_code = safely_get_source(self.module_obj, "demonstrate_game_calculations")
-            ability_code = safely_get_source(self.module_obj, "demonstrate_ability_system")
-            
-            # Check for lambda usage in each function
-            if "lambda" not in player_transform_code or "map" not in player_transform_code:
-                self.test_obj.yakshaAssert("TestLambdaUsage", False, "functional")
-                print("TestLambdaUsage = Failed")
-                return
-            
-            if "lambda" not in entity_filter_code or "filter" not in entity_filter_code:
-                self.test_obj.yakshaAssert("TestLambdaUsage", False, "functional")
-                print("TestLambdaUsage = Failed")
-                return
-            
-            if "lambda" not in item_sort_code or "sorted" not in item_sort_code:
-                self.test_obj.yakshaAssert("TestLambdaUsage", False, "functional")
-                print("TestLambdaUsage = Failed")
-                return
-            
-            if "lambda" not in game_calc_code:
-                self.test_obj.yakshaAssert("TestLambdaUsage", False, "functional")
-                print("TestLambdaUsage = Failed")
-                return
-            
-            # Check advanced lambda usage
-            if "lambda" not in ability_code:
-                self.test_obj.yakshaAssert("TestLambdaUsage", False, "functional")
-                print("TestLambdaUsage = Failed")
-                return
+            # Check for lambda usage in each function, from the call-site index
+            lambda_checks = [
+                ("demonstrate_player_transformations", ("map",)),
+                ("demonstrate_entity_filtering", ("filter",)),
+                ("demonstrate_item_sorting", ("sorted",)),
+                ("demonstrate_game_calculations", ()),
+                # Check advanced lambda usage
+                ("demonstrate_ability_system", ()),
+            ]
+            for func_name, builtin_names in lambda_checks:
+                if not check_lambda_usage(self.module_obj, func_name, *builtin_names):
+                    self.test_obj.yakshaAssert("TestLambdaUsage", False, "functional")
+                    print("TestLambdaUsage = Failed")
+                    return
             
             # All tests passed
             self.test_obj.yakshaAssert("TestLambdaUsage", True, "functional")
@@ -0,0 +1,78 @@
+"""
+Tests for top-K selection and incrementally sorted inventory views.
+"""
+
+import random
+import unittest
+import skeleton
+from inventory_index import top_k, SortedView, InventoryIndex, INVENTORY_ORDERINGS
+
+
+class TestInventoryIndex(unittest.TestCase):
+    def setUp(self):
+        self.inventory = skeleton.prepare_inventory_data()
+
+    def test_top_k_matches_sorted_prefix(self):
+        rng = random.Random(7)
+        values = [{"value": rng.randint(0, 20), "n": n} for n in range(200)]
+        for reverse in (False, True):
+            expected = sorted(values, key=lambda v: v["value"], reverse=reverse)[:15]
+            self.assertEqual(top_k(values, 15, key=lambda v: v["value"], reverse=reverse), expected)
+        self.assertEqual(top_k(values, 0), [])
+
+    def test_sorted_view_tracks_inserts_and_removals(self):
+        for reverse in (False, True):
+            view = SortedView(lambda i: i["value"] // 100, reverse=reverse)
+            for item in self.inventory:
+                view.insert(item)
+            view.remove(self.inventory[1])
+            remaining = [i for i in self.inventory if i is not self.inventory[1]]
+            expected = sorted(remaining, key=lambda i: i["value"] // 100, reverse=reverse)
+            self.assertEqual(list(view), expected)
+            self.assertEqual(view.head(3), expected[:3])
+            self.assertFalse(view.remove(self.inventory[1]))
+
+    def test_bulk_extend_matches_incremental_inserts(self):
+        rng = random.Random(3)
+        items = [{"value": rng.randint(0, 9), "n": n} for n in range(300)]
+        for reverse in (False, True):
+            bulk = SortedView(lambda i: i["value"], reverse=reverse)
+            self.assertEqual(bulk.extend(items[:200]), 200)
+            bulk.extend(items[200:])
+            incremental = SortedView(lambda i: i["value"], reverse=reverse)
+            for item in items:
+                incremental.insert(item)
+            self.assertEqual(list(bulk), list(incremental))
+            self.assertEqual(list(bulk), sorted(items, key=lambda i: i["value"], reverse=reverse))
+            bulk.remove(items[5])
+            self.assertEqual(len(bulk), 299)
+        view = SortedView(lambda i: i["value"])
+        view.extend(items[:3])
+        with self.assertRaises(ValueError):
+            view.extend([items[3], items[0]])
+        with self.assertRaises(ValueError):
+            view.extend([items[4], items[4]])
+        self.assertEqual(list(view), sorted(items[:3], key=lambda i: i["value"]))
+
+    def test_inventory_index_orderings(self):
+        index = InventoryIndex(self.inventory)
+        for name, (key, reverse, predicate) in INVENTORY_ORDERINGS.items():
+            items = [i for i in self.inventory if predicate is None or predicate(i)]
+            self.assertEqual(index.top(name, 20), sorted(items, key=key, reverse=reverse)[:20])
+        sword = self.inventory[0]
+        sword["value"] = 5000
+        index.update(sword)
+        self.assertIs(index.top("value", 20)[-1], sword)
+        index.remove(sword)
+        self.assertEqual(len(index), len(self.inventory) - 1)
+        with self.assertRaises(KeyError):
+            index.remove(sword)
+        with self.assertRaises(KeyError):
+            index.update(sword)
+        self.assertNotIn(sword, index.top("value", 20))
+        with self.assertRaises(ValueError):
+            InventoryIndex([sword, sword])
+
+
+if __name__ == '__main__':
+    unittest.main()
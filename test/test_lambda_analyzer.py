@@ -0,0 +1,97 @@
+"""
+Tests for the lambda call-site analyzer.
+"""
+
+import io
+import json
+import os
+import contextlib
+import textwrap
+import unittest
+from lambda_analyzer import LambdaIndex, main
+
+SKELETON_PATH = os.path.join(os.path.dirname(__file__), "..", "skeleton.py")
+
+SAMPLE = textwrap.dedent('''
+    import functools
+
+    def inline(items):
+        return list(map(lambda item: item + 1, items))
+
+    def bound(items):
+        by_value = lambda item: item["value"]
+        return sorted(items, key=by_value)
+
+    def forwarded(items, limit):
+        order = lambda values, key: sorted(values, key=key)
+        first = order(items, lambda item: item["value"])
+        return order(first, key=lambda item: item["name"])
+
+    def plain(items):
+        """Mentions map(lambda x: x) only in a docstring."""
+        total = functools.reduce(int.__add__, items)
+        return sorted(items), total
+
+    def reduced(items):
+        return functools.reduce(lambda a, b: a + b, filter(None, items))
+
+    def methods(executor, frame, items):
+        mapped = executor.map(lambda item: item * 2, items)
+        return frame.filter(lambda row: row), sorted(mapped)
+
+    def stub():
+        pass
+''')
+
+
+class TestLambdaAnalyzer(unittest.TestCase):
+    def setUp(self):
+        self.index = LambdaIndex.from_source(SAMPLE)
+
+    def test_inline_bound_and_forwarded_lambdas(self):
+        self.assertTrue(self.index.uses_lambda_with("inline", "map"))
+        self.assertTrue(self.index.uses_lambda_with("bound", "sorted"))
+        self.assertEqual(self.index.sites("bound", "sorted")[0].lambda_arguments, ("key",))
+        self.assertTrue(self.index.uses_lambda_with("forwarded", "sorted"))
+
+    def test_calls_without_lambdas(self):
+        self.assertFalse(self.index.uses_lambda_with("plain", "map"))
+        self.assertEqual(self.index.sites("plain", "map"), ())
+        self.assertEqual(len(self.index.sites("plain", "sorted")), 1)
+        self.assertFalse(self.index.uses_lambda_with("plain", "sorted"))
+        self.assertFalse(self.index.uses_lambda_with("plain", "reduce"))
+        self.assertEqual(self.index.function("plain").lambda_count, 0)
+
+    def test_reduce_and_nested_calls(self):
+        self.assertTrue(self.index.uses_lambda_with("reduced", "reduce"))
+        self.assertEqual(self.index.sites("reduced", "reduce")[0].lambda_arguments, (0,))
+        self.assertFalse(self.index.uses_lambda_with("reduced", "filter"))
+
+    def test_method_calls_are_not_builtins(self):
+        self.assertEqual(self.index.sites("methods", "map"), ())
+        self.assertEqual(self.index.sites("methods", "filter"), ())
+        self.assertFalse(self.index.uses_lambda_with("methods", "sorted"))
+        self.assertEqual(self.index.function("methods").lambda_count, 2)
+
+    def test_implementation_flags(self):
+        self.assertTrue(self.index.function("stub").has_pass)
+        self.assertFalse(self.index.function("stub").is_implemented)
+        self.assertIsNone(self.index.function("absent"))
+
+    def test_skeleton_report(self):
+        report = LambdaIndex.from_file(SKELETON_PATH).report("demonstrate_")
+        self.assertEqual(len(report), 7)
+        self.assertEqual(report["demonstrate_item_sorting"]["calls"]["sorted"]["with_lambda"], 1)
+        self.assertGreater(report["demonstrate_player_transformations"]["calls"]["map"]["with_lambda"], 0)
+        self.assertTrue(all(entry["implemented"] for entry in report.values()))
+
+    def test_command_line_json(self):
+        output = io.StringIO()
+        with contextlib.redirect_stdout(output):
+            self.assertEqual(main([SKELETON_PATH, "--json"]), 0)
+        report = json.loads(output.getvalue())
+        self.assertIn("filter", report["demonstrate_entity_filtering"]["calls"])
+
+
+if __name__ == '__main__':
+    unittest.main()
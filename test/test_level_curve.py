@@ -0,0 +1,59 @@
+"""
+Tests for the precomputed level curve.
+"""
+
+import random
+import unittest
+from game_rules import xp_for_level, stats_at_level
+from level_curve import LevelCurve
+
+
+def level_by_summing(xp, max_level):
+    """Reference XP-to-level conversion that sums the per-level lambda."""
+    level, needed = 1, 0
+    while level < max_level:
+        needed += xp_for_level(level)
+        if xp < needed:
+            break
+        level += 1
+    return level
+
+
+class TestLevelCurve(unittest.TestCase):
+    def setUp(self):
+        self.curve = LevelCurve(xp_for_level, stats_at_level, max_level=40)
+
+    def test_level_for_xp_matches_summing_loop(self):
+        rng = random.Random(2)
+        samples = [0, 99, 100, 382, 10 ** 9] + [rng.randint(0, 600000) for _ in range(300)]
+        for xp in samples:
+            self.assertEqual(self.curve.level_for_xp(xp), level_by_summing(xp, 40))
+        self.assertEqual(list(self.curve.levels_for_xp(samples)),
+                         [level_by_summing(xp, 40) for xp in samples])
+        with self.assertRaises(ValueError):
+            self.curve.level_for_xp(-1)
+
+    def test_thresholds_and_next_level(self):
+        self.assertEqual(self.curve.total_xp_for(1), 0)
+        self.assertEqual(self.curve.total_xp_for(3), xp_for_level(1) + xp_for_level(2))
+        self.assertEqual(self.curve.xp_to_next(150), xp_for_level(1) + xp_for_level(2) - 150)
+        self.assertEqual(self.curve.xp_to_next(10 ** 9), 0)
+        for level in (0, 41, 2.5, "3"):
+            with self.assertRaises(ValueError):
+                self.curve.total_xp_for(level)
+
+    def test_stat_table(self):
+        for level in (1, 17, 40):
+            self.assertEqual(self.curve.stats(level), stats_at_level(level))
+        self.assertEqual(list(self.curve.stat_column("mana", [1, 2, 40])), [60, 70, 450])
+        with self.assertRaises(ValueError):
+            self.curve.stats(41)
+        for levels in ([0], [-1], [2, 41], [2.5], ["3"]):
+            with self.assertRaises(ValueError):
+                self.curve.stat_column("health", levels)
+        with self.assertRaises(ValueError):
+            LevelCurve(lambda level: 0, stats_at_level)
+
+
+if __name__ == '__main__':
+    unittest.main()
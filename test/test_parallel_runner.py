@@ -0,0 +1,69 @@
+"""
+Tests for the parallel runner of the graded suites.
+"""
+
+import io
+import json
+import os
+import contextlib
+import tempfile
+import unittest
+from test.ParallelRunner import (DEFAULT_MODULES, LocalResults, collect_test_ids, main,
+                                 merge_results, run_parallel, worker_output)
+
+
+class TestParallelRunner(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.test_ids = collect_test_ids(DEFAULT_MODULES)
+        cls.outcomes = run_parallel(cls.test_ids, workers=2)
+
+    def test_collects_every_graded_test(self):
+        self.assertEqual(len(self.test_ids), 7)
+        self.assertTrue(self.test_ids[0].startswith("test.test_functional."))
+        self.assertTrue(self.test_ids[-1].startswith("test.test_exceptional."))
+
+    def test_outcomes_keep_test_order(self):
+        self.assertEqual([outcome["test"] for outcome in self.outcomes], self.test_ids)
+        self.assertTrue(all(outcome["ok"] for outcome in self.outcomes))
+        self.assertNotIn(os.getpid(), {outcome["worker"] for outcome in self.outcomes})
+
+    def test_merged_results(self):
+        results = merge_results(self.outcomes)
+        self.assertEqual(len(results), 7)
+        self.assertEqual(results[0]["methodName"], "TestDataStructures")
+        self.assertEqual({result["methodType"] for result in results}, {"functional", "boundary", "exception"})
+        self.assertTrue(all(result["status"] == "Passed" for result in results))
+
+    def test_stdout_is_captured_per_worker(self):
+        output = worker_output(self.outcomes)
+        self.assertLessEqual(len(output), 2)
+        combined = "".join(output.values())
+        self.assertIn("TestBoundaryScenarios = Passed", combined)
+        self.assertIn("TestErrorHandling = Passed", combined)
+        self.assertNotIn("Ran 1 test", combined)
+        self.assertTrue(all("Ran 1 test" in outcome["report"] for outcome in self.outcomes))
+
+    def test_local_results(self):
+        results = LocalResults()
+        results.add("TestSample", False, "boundary")
+        self.assertEqual(results.results[0]["status"], "Failed")
+        self.assertEqual(results.results[0]["earnedScore"], 0)
+
+    def test_command_line_report(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "report.json")
+            output = io.StringIO()
+            with contextlib.redirect_stdout(output):
+                code = main(["--workers", "2", "--no-submit", "--report", path,
+                             "--module", "test.test_boundary"])
+            self.assertEqual(code, 0)
+            self.assertIn("TestBoundaryScenarios (boundary) = Passed", output.getvalue())
+            with open(path, encoding="utf-8") as handle:
+                report = json.load(handle)
+        self.assertEqual(len(report["testCaseResults"]), 1)
+        self.assertEqual(len(report["tests"]), 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,44 @@
+"""
+Tests for packed-buffer path lengths and distance matrices.
+"""
+
+import math
+import random
+import unittest
+import skeleton
+from path_math import pack_coordinates, path_lengths, distance_matrix_blocks, distance_matrix
+
+
+class TestPathMath(unittest.TestCase):
+    def setUp(self):
+        self.coordinates = skeleton.prepare_coordinate_data()
+        self.buffer = pack_coordinates(self.coordinates)
+
+    def test_path_lengths_match_pairwise_lambda(self):
+        distance = lambda a, b: math.hypot(b[0] - a[0], b[1] - a[1])
+        expected = [distance(a, b) for a, b in zip(self.coordinates, self.coordinates[1:])]
+        segments, cumulative, total = path_lengths(self.buffer)
+        self.assertEqual(list(segments), expected)
+        self.assertAlmostEqual(cumulative[2], sum(expected[:3]))
+        self.assertAlmostEqual(total, 290.0)
+
+    def test_short_and_malformed_paths(self):
+        self.assertEqual(path_lengths(pack_coordinates([(1, 2)]))[2], 0.0)
+        with self.assertRaises(ValueError):
+            path_lengths(self.buffer[:-1])
+
+    def test_blocked_matrix_matches_direct(self):
+        rng = random.Random(3)
+        points = [(rng.uniform(-50, 50), rng.uniform(-50, 50)) for _ in range(23)]
+        buffer = pack_coordinates(points)
+        matrix = distance_matrix(buffer, block_size=5)
+        for i, a in enumerate(points):
+            for j, b in enumerate(points):
+                self.assertAlmostEqual(matrix[i * len(points) + j], math.dist(a, b))
+        blocks = list(distance_matrix_blocks(buffer, block_size=10))
+        self.assertEqual(len(blocks), 9)
+        self.assertTrue(all(len(block) <= 100 for _, _, block in blocks))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,32 @@
+"""
+Tests for the batch player statistics path.
+"""
+
+import unittest
+import skeleton
+from player_batch import player_columns, compute_player_stats
+
+PLAYERS = skeleton.prepare_player_data()
+
+
+class TestComputePlayerStats(unittest.TestCase):
+    def test_matches_demonstration(self):
+        columns = player_columns(PLAYERS)
+        stats = compute_player_stats(columns["level"], columns["health"], columns["mana"], columns["score"])
+        demo = skeleton.demonstrate_player_transformations(PLAYERS, quiet=True)
+        for key in ("effective_health", "mana_regen", "normalized_score", "power_index"):
+            self.assertEqual(stats[key], demo[key], key)
+
+    def test_equal_scores_and_empty_input(self):
+        stats = compute_player_stats([1, 2], [10, 20], [5, 5], [300, 300])
+        self.assertEqual(list(stats["normalized_score"]), [1.0, 1.0])
+        empty = compute_player_stats([], [], [], [])
+        self.assertTrue(all(len(values) == 0 for values in empty.values()))
+
+    def test_mismatched_columns(self):
+        with self.assertRaises(ValueError):
+            compute_player_stats([1], [10, 20], [5], [300])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,46 @@
+"""
+Tests for bulk XP grants on the columnar progression table.
+"""
+
+import unittest
+import skeleton
+from progression import ProgressionTable, apply_xp, sync_players, default_curve, stats_at_level
+
+
+class TestApplyXp(unittest.TestCase):
+    def setUp(self):
+        self.players = skeleton.prepare_player_data()
+        self.curve = default_curve()
+        self.table = ProgressionTable.from_players(self.players, self.curve)
+
+    def test_only_crossing_players_level_up(self):
+        needed = [self.curve.total_xp_for(p["level"] + 1) - self.table.xp[i] for i, p in enumerate(self.players)]
+        deltas = [needed[0] - 1, needed[1], needed[2] + 10 ** 6, 0, 0, 0]
+        health_before = list(self.table.health)
+        events = apply_xp(self.table, deltas)
+        self.assertEqual(events[0], (1, 7, 8))
+        self.assertEqual(events[1][:2], (2, 20))
+        self.assertGreater(events[1][2], 21)
+        self.assertEqual(len(events), 2)
+        self.assertEqual(self.table.health[0], health_before[0])
+        self.assertEqual(self.table.health[1], stats_at_level(8)["health"])
+        self.assertEqual(self.table.levels[2], self.curve.level_for_xp(self.table.xp[2]))
+
+    def test_sparse_grants_and_sync(self):
+        events = apply_xp(self.table, {3: 10 ** 7})
+        self.assertEqual(events, [(3, 3, self.curve.max_level)])
+        self.assertEqual(apply_xp(self.table, {3: 10 ** 7}), [])
+        sync_players(self.table, self.players, events)
+        self.assertEqual(self.players[3]["level"], self.curve.max_level)
+        self.assertEqual(self.players[3]["mana"], stats_at_level(self.curve.max_level)["mana"])
+        with self.assertRaises(ValueError):
+            apply_xp(self.table, [1, 2])
+
+    def test_default_curve_matches_demonstration(self):
+        demo = skeleton.demonstrate_level_system(self.players, quiet=True)
+        self.assertEqual(self.curve.thresholds, demo["curve"].thresholds)
+        self.assertEqual(self.curve.stat_table, demo["curve"].stat_table)
+
+
+if __name__ == '__main__':
+    unittest.main()
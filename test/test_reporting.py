@@ -0,0 +1,83 @@
+"""
+Tests for demonstration results and buffered rendering.
+"""
+
+import io
+import contextlib
+import unittest
+import skeleton
+from reporting import DemoResult, Section, format_report, render
+
+
+class CountingStream(io.StringIO):
+    def __init__(self):
+        super().__init__()
+        self.writes = 0
+
+    def write(self, text):
+        self.writes += 1
+        return super().write(text)
+
+
+class TestReporting(unittest.TestCase):
+    def setUp(self):
+        self.players = skeleton.prepare_player_data()
+        self.entities = skeleton.prepare_entity_data()
+        self.inventory = skeleton.prepare_inventory_data()
+
+    def test_quiet_mode_prints_nothing(self):
+        output = io.StringIO()
+        with contextlib.redirect_stdout(output):
+            results = skeleton.main(quiet=True)
+            skeleton.demonstrate_combat_system("not a list", [], quiet=True)
+        self.assertEqual(output.getvalue(), "")
+        self.assertEqual(len(results), 7)
+        self.assertTrue(all(isinstance(result, DemoResult) for result in results))
+
+    def test_results_hold_computed_values(self):
+        result = skeleton.demonstrate_player_transformations(self.players, quiet=True)
+        self.assertEqual(result["effective_health"][0], 460)
+        self.assertEqual(result["normalized_score"][result["names"].index("Cyra")], 1.0)
+        result = skeleton.demonstrate_entity_filtering(self.entities, quiet=True)
+        self.assertEqual(result["nearby_ids"], ["E2", "E1", "E7", "E9", "E4"])
+        result = skeleton.demonstrate_combat_system(self.players, self.entities, quiet=True)
+        self.assertEqual(result["total_rewards"]["Aria"], 330)
+        self.assertTrue(skeleton.demonstrate_item_sorting([], quiet=True))
+
+    def test_render_matches_printed_report(self):
+        printed = io.StringIO()
+        with contextlib.redirect_stdout(printed):
+            skeleton.demonstrate_item_sorting(self.inventory)
+        result = skeleton.demonstrate_item_sorting(self.inventory, quiet=True)
+        stream = CountingStream()
+        result.render(stream)
+        self.assertEqual(stream.getvalue(), printed.getvalue())
+        self.assertEqual(stream.writes, 1)
+
+    def test_main_writes_once(self):
+        stream = CountingStream()
+        with contextlib.redirect_stdout(stream):
+            results = skeleton.main()
+        self.assertEqual(stream.writes, 1)
+        text = stream.getvalue()
+        self.assertTrue(text.startswith("===== GAME DEVELOPMENT UTILITY SYSTEM =====\n"))
+        self.assertTrue(text.endswith("\n===== DEMONSTRATION COMPLETED =====\n"))
+        self.assertIn(format_report(results), text)
+
+    def test_invalid_input_still_raises(self):
+        with self.assertRaises(TypeError):
+            skeleton.demonstrate_player_transformations("not a list", quiet=True)
+        with self.assertRaises(TypeError):
+            skeleton.demonstrate_entity_filtering(None, quiet=True)
+
+    def test_sections_format_lazily(self):
+        section = Section("Rows:", [("a", 1.5), {"name": "b", "value": 2}], None)
+        self.assertEqual(list(section.lines()), ["Rows:"])
+        section.template = lambda row: f"  {row}"
+        result = DemoResult("DEMO", [Section("Values:", [("a", 1.25)], "  {0}: {1:.1f}"), section])
+        self.assertEqual(format_report([result]).splitlines()[:3], ["", "===== DEMO =====", "Values:"])
+        self.assertEqual(render(result, io.StringIO()).splitlines()[3], "  a: 1.2")
+
+
+if __name__ == '__main__':
+    unittest.main()
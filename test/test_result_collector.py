@@ -0,0 +1,130 @@
+"""
+Tests for the queued result collector, against a local HTTP server.
+"""
+
+import contextlib
+import io
+import json
+import os
+import tempfile
+import threading
+import unittest
+from types import SimpleNamespace
+from unittest import mock
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from test.ResultCollector import ResultCollector
+
+
+class RecordingHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def do_POST(self):
+        body = self.rfile.read(int(self.headers["Content-Length"]))
+        self.server.bodies.append(json.loads(body))
+        self.server.clients.add(self.client_address)
+        status = self.server.status
+        self.send_response(status)
+        self.send_header("Content-Length", "0")
+        self.end_headers()
+
+    def log_message(self, format, *args):
+        return
+
+
+class ScriptedSession:
+    """Session stand-in that raises or blocks on chosen posts."""
+
+    def __init__(self, errors=(), gate=None):
+        self.errors = list(errors)
+        self.gate = gate
+        self.posts = 0
+
+    def post(self, url, data, headers=None, timeout=None):
+        self.posts += 1
+        if self.gate is not None:
+            self.gate.wait()
+        if self.errors:
+            raise self.errors.pop(0)
+        return SimpleNamespace(status_code=200)
+
+
+class TestResultCollector(unittest.TestCase):
+    def setUp(self):
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), RecordingHandler)
+        self.server.bodies = []
+        self.server.clients = set()
+        self.server.status = 200
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+        self.url = f"http://127.0.0.1:{self.server.server_port}/push"
+        handle = tempfile.NamedTemporaryFile("w", suffix=".ih", delete=False)
+        with handle:
+            handle.write("custom-data")
+        self.custom_path = handle.name
+
+    def tearDown(self):
+        self.server.shutdown()
+        self.server.server_close()
+        if os.path.exists(self.custom_path):
+            os.remove(self.custom_path)
+
+    def test_results_are_posted_over_one_connection(self):
+        collector = ResultCollector(self.url, "guid", custom_path=self.custom_path)
+        collector.add("TestOne", True, "functional")
+        # custom.ih is read once, so later results do not need the file.
+        os.remove(self.custom_path)
+        collector.add("TestTwo", False, "boundary")
+        collector.add("TestThree", 1, "exceptional")
+        collector.close()
+
+        self.assertEqual(collector.sent, 3)
+        self.assertEqual(collector.failed, [])
+        self.assertEqual(len(self.server.clients), 1)
+        results = [json.loads(body["testCaseResults"])["guid"] for body in self.server.bodies]
+        self.assertEqual([r["methodName"] for r in results], ["TestOne", "TestTwo", "TestThree"])
+        self.assertEqual([r["status"] for r in results], ["Passed", "Failed", "Passed"])
+        self.assertEqual([r["earnedScore"] for r in results], [1, 0, 1])
+        self.assertTrue(all(body["customData"] == "custom-data" for body in self.server.bodies))
+
+    def test_rejected_results_are_kept(self):
+        self.server.status = 500
+        collector = ResultCollector(self.url, "guid", custom_path=self.custom_path)
+        collector.add("TestOne", True, "functional")
+        collector.flush()
+        self.assertEqual(collector.sent, 0)
+        self.assertEqual(len(collector.failed), 1)
+        collector.close()
+
+    def test_sender_survives_unexpected_errors(self):
+        session = ScriptedSession(errors=[ValueError("broken response")])
+        spool = SimpleNamespace(append=mock.Mock(side_effect=OSError("disk full")), close=lambda: None)
+        collector = ResultCollector(self.url, "guid", custom_path=self.custom_path, session=session, spool=spool)
+        with contextlib.redirect_stdout(io.StringIO()):
+            collector.add("TestOne", True, "functional")
+            collector.add("TestTwo", True, "functional")
+            self.assertTrue(collector.flush(timeout=5))
+        self.assertEqual(session.posts, 2)
+        self.assertEqual(collector.sent, 1)
+        self.assertEqual(len(collector.failed), 1)
+        spool.append.assert_called_once()
+        collector.close()
+
+    def test_flush_timeout(self):
+        gate = threading.Event()
+        collector = ResultCollector(self.url, "guid", custom_path=self.custom_path,
+                                    session=ScriptedSession(gate=gate))
+        collector.add("TestOne", True, "functional")
+        self.assertFalse(collector.flush(timeout=0.05))
+        gate.set()
+        self.assertTrue(collector.flush(timeout=5))
+        self.assertEqual(collector.sent, 1)
+        collector.close()
+
+    def test_missing_custom_file_raises_on_add(self):
+        collector = ResultCollector(self.url, "guid", custom_path=self.custom_path + ".missing")
+        with self.assertRaises(FileNotFoundError):
+            collector.add("TestOne", True, "functional")
+        collector.close()
+
+
+if __name__ == '__main__':
+    unittest.main()
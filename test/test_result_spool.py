@@ -0,0 +1,131 @@
+"""
+Tests for the offline result spool and its replay command.
+"""
+
+import json
+import os
+import tempfile
+import threading
+import unittest
+from unittest import mock
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from test.ResultCollector import ResultCollector
+from test.ResultSpool import ResultSpool, read_spool, replay, result_key, main
+
+
+class FlakyHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def do_POST(self):
+        body = self.rfile.read(int(self.headers["Content-Length"]))
+        if self.server.failures:
+            self.server.failures -= 1
+            status = 503
+        else:
+            self.server.bodies.append(json.loads(body))
+            status = 200
+        self.send_response(status)
+        self.send_header("Content-Length", "0")
+        self.end_headers()
+
+    def log_message(self, format, *args):
+        return
+
+
+class TestResultSpool(unittest.TestCase):
+    def setUp(self):
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), FlakyHandler)
+        self.server.bodies = []
+        self.server.failures = 0
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+        self.url = f"http://127.0.0.1:{self.server.server_port}/push"
+        self.directory = tempfile.TemporaryDirectory()
+        self.spool_path = os.path.join(self.directory.name, "results.jsonl")
+        self.custom_path = os.path.join(self.directory.name, "custom.ih")
+        with open(self.custom_path, "w") as handle:
+            handle.write("custom-data")
+
+    def tearDown(self):
+        self.server.shutdown()
+        self.server.server_close()
+        self.directory.cleanup()
+
+    def spool_results(self, *results, attempt_id=None):
+        with mock.patch.dict(os.environ):
+            os.environ.pop("ATTEMPT_ID", None)
+            if attempt_id is not None:
+                os.environ["ATTEMPT_ID"] = attempt_id
+            collector = ResultCollector("http://unused.invalid/", "guid", custom_path=self.custom_path,
+                                        spool=ResultSpool(self.spool_path), offline=True)
+            for name, result in results:
+                collector.add(name, result, "functional")
+            collector.close()
+
+    def sent_names(self):
+        return [json.loads(body["testCaseResults"])["guid"]["methodName"] for body in self.server.bodies]
+
+    def test_offline_collector_only_writes_spool(self):
+        self.spool_results(("TestOne", True), ("TestTwo", False))
+        payloads = read_spool(self.spool_path)
+        self.assertEqual([result_key(p)[1] for p in payloads], ["TestOne", "TestTwo"])
+        self.assertEqual(self.server.bodies, [])
+
+    def test_replay_dedups_and_records_delivery(self):
+        self.spool_results(("TestOne", False), ("TestTwo", True), ("TestOne", True), attempt_id="attempt-1")
+        with open(self.spool_path, "a") as handle:
+            handle.write('{"truncated": \n')
+        summary = replay(self.spool_path, self.url, sleep=lambda seconds: None)
+        self.assertEqual(summary, {"sent": 2, "skipped": 1, "failed": 0})
+        self.assertEqual(self.sent_names(), ["TestTwo", "TestOne"])
+        statuses = [json.loads(body["testCaseResults"])["guid"]["status"] for body in self.server.bodies]
+        self.assertEqual(statuses, ["Passed", "Passed"])
+
+        again = replay(self.spool_path, self.url, sleep=lambda seconds: None)
+        self.assertEqual(again, {"sent": 0, "skipped": 3, "failed": 0})
+        self.assertEqual(len(self.server.bodies), 2)
+
+    def test_rerun_in_same_attempt_is_resent(self):
+        self.spool_results(("TestOne", False), attempt_id="attempt-1")
+        self.assertEqual(replay(self.spool_path, self.url)["sent"], 1)
+        self.spool_results(("TestOne", True), attempt_id="attempt-1")
+        self.assertEqual(replay(self.spool_path, self.url), {"sent": 1, "skipped": 1, "failed": 0})
+        self.assertEqual(replay(self.spool_path, self.url), {"sent": 0, "skipped": 2, "failed": 0})
+        statuses = [json.loads(body["testCaseResults"])["guid"]["status"] for body in self.server.bodies]
+        self.assertEqual(statuses, ["Failed", "Passed"])
+
+    def test_reruns_without_attempt_id_are_sent(self):
+        self.spool_results(("TestOne", False))
+        self.assertEqual(replay(self.spool_path, self.url)["sent"], 1)
+        self.spool_results(("TestOne", True))
+        summary = replay(self.spool_path, self.url)
+        self.assertEqual(summary, {"sent": 1, "skipped": 1, "failed": 0})
+        statuses = [json.loads(body["testCaseResults"])["guid"]["status"] for body in self.server.bodies]
+        self.assertEqual(statuses, ["Failed", "Passed"])
+
+    def test_replay_retries_transient_errors(self):
+        self.spool_results(("TestOne", True))
+        self.server.failures = 2
+        delays = []
+        summary = replay(self.spool_path, self.url, retries=3, backoff=0.5, sleep=delays.append)
+        self.assertEqual(summary["sent"], 1)
+        self.assertEqual(delays, [0.5, 1.0])
+
+        self.spool_results(("TestTwo", True))
+        self.server.failures = 5
+        self.assertEqual(replay(self.spool_path, self.url, retries=1, sleep=lambda seconds: None)["failed"], 1)
+        self.server.failures = 0
+        self.assertEqual(main([self.spool_path, "--url", self.url, "--backoff", "0"]), 0)
+        self.assertEqual(self.sent_names(), ["TestOne", "TestTwo"])
+
+    def test_failed_posts_are_spooled(self):
+        self.server.failures = 1
+        collector = ResultCollector(self.url, "guid", custom_path=self.custom_path,
+                                    spool=ResultSpool(self.spool_path))
+        collector.add("TestOne", True, "functional")
+        collector.close()
+        self.assertEqual(len(collector.failed), 1)
+        self.assertEqual([result_key(p)[1] for p in read_spool(self.spool_path)], ["TestOne"])
+
+
+if __name__ == '__main__':
+    unittest.main()
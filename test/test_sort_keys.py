@@ -0,0 +1,62 @@
+"""
+Tests for compiled composite sort keys.
+"""
+
+import random
+import unittest
+import skeleton
+from inventory_index import RARITY_RANKS
+from sort_keys import SortSpec, ASC, DESC, ITEM_SORT_SPECS
+
+
+class TestSortSpec(unittest.TestCase):
+    def setUp(self):
+        rng = random.Random(11)
+        self.items = skeleton.prepare_inventory_data() + [
+            {"name": f"Item {n}", "type": rng.choice(["weapon", "armor", "ring"]),
+             "value": rng.randint(0, 50) * 1.5, "rarity": rng.choice(list(RARITY_RANKS) + ["mythic"]),
+             "equipped": False}
+            for n in range(300)
+        ]
+
+    def test_matches_lambda_orderings(self):
+        self.assertEqual(ITEM_SORT_SPECS["value"].sort(self.items),
+                         sorted(self.items, key=lambda i: i["value"]))
+        self.assertEqual(ITEM_SORT_SPECS["rarity"].sort(self.items),
+                         sorted(self.items, key=lambda i: RARITY_RANKS.get(i["rarity"], len(RARITY_RANKS))))
+        self.assertEqual(ITEM_SORT_SPECS["type_value_desc"].sort(self.items),
+                         sorted(self.items, key=lambda i: (i["type"], -i["value"])))
+
+    def test_three_fields_and_descending_strings(self):
+        spec = SortSpec([("rarity", DESC), ("type", DESC), ("name", ASC)], {"rarity": RARITY_RANKS})
+        expected = sorted(self.items, key=lambda i: i["name"])
+        expected = sorted(expected, key=lambda i: i["type"], reverse=True)
+        expected = sorted(expected, key=lambda i: RARITY_RANKS.get(i["rarity"], len(RARITY_RANKS)), reverse=True)
+        self.assertEqual(spec.sort(self.items), expected)
+        self.assertEqual(spec.key_column(self.items).typecode, "Q")
+
+    def test_sparse_rank_tables_are_compacted(self):
+        items = [{"tier": tier, "n": n} for n, tier in enumerate(["b", "x", "a", "c", "b", "a"])]
+        spec = SortSpec([("tier", ASC)], {"tier": {"a": 10, "b": 10, "c": -5}})
+        self.assertEqual([i["n"] for i in spec.sort(items)], [3, 0, 2, 4, 5, 1])
+        spec = SortSpec([("tier", DESC)], {"tier": {"a": 10 ** 30, "c": -(10 ** 30)}})
+        self.assertEqual([i["n"] for i in spec.sort(items)], [0, 1, 4, 2, 5, 3])
+        with self.assertRaises(ValueError):
+            SortSpec([("tier", ASC)], {"tier": {"a": 1, "b": "high"}})
+
+    def test_demonstration_uses_packed_keys(self):
+        result = skeleton.demonstrate_item_sorting(self.items, quiet=True)
+        expected = sorted(range(len(self.items)), key=lambda k: (self.items[k]["type"], -self.items[k]["value"]))
+        self.assertEqual(list(result["by_type_value"]), expected)
+        limited = skeleton.demonstrate_item_sorting(self.items, limit=5, quiet=True)
+        self.assertEqual(list(limited["by_type_value"]), expected[:5])
+
+    def test_invalid_specs(self):
+        with self.assertRaises(ValueError):
+            SortSpec([])
+        with self.assertRaises(ValueError):
+            SortSpec([("value", "up")])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,88 @@
+"""
+Tests for the session-wide module and source cache.
+"""
+
+import os
+import sys
+import tempfile
+import textwrap
+import unittest
+from test.SourceCache import SourceCache
+
+SAMPLE = textwrap.dedent('''
+    def stub(items):
+        """Placeholder."""
+        pass
+
+    def mapped(items):
+        """Compass headings; no map call here."""
+        scale = 2
+        return [item * scale for item in items]
+
+    def transformed(items):
+        """Uses map with a lambda."""
+        doubled = map(lambda item: item * 2, items)
+        return sorted(doubled, key=lambda item: -item)
+
+    assigned = transformed
+''')
+
+
+class TestSourceCache(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.directory = tempfile.TemporaryDirectory()
+        with open(os.path.join(cls.directory.name, "cache_sample.py"), "w") as handle:
+            handle.write(SAMPLE)
+        sys.path.insert(0, cls.directory.name)
+        import cache_sample
+        cls.sample = cache_sample
+
+    @classmethod
+    def tearDownClass(cls):
+        sys.path.remove(cls.directory.name)
+        sys.modules.pop("cache_sample", None)
+        cls.directory.cleanup()
+
+    def test_module_is_loaded_once(self):
+        module = SourceCache.module()
+        self.assertEqual(module.__name__, "skeleton")
+        self.assertIs(SourceCache.module(), module)
+
+    def test_index_and_sources_are_cached(self):
+        index = SourceCache.index(self.sample)
+        self.assertIs(SourceCache.index(self.sample), index)
+        source = SourceCache.source(self.sample, "transformed")
+        self.assertTrue(source.startswith("def transformed"))
+        self.assertIs(SourceCache.source(self.sample, "transformed"), source)
+
+    def test_checks_use_the_syntax_tree(self):
+        self.assertFalse(SourceCache.is_implemented(self.sample, "stub"))
+        # Words inside docstrings are not code.
+        self.assertTrue(SourceCache.is_implemented(self.sample, "mapped"))
+        self.assertFalse(SourceCache.uses_lambda_with(self.sample, "mapped", "map"))
+        self.assertTrue(SourceCache.uses_lambda_with(self.sample, "transformed", "map", "sorted"))
+        self.assertFalse(SourceCache.uses_lambda_with(self.sample, "transformed", "filter"))
+
+    def test_functions_outside_the_index_use_their_source(self):
+        self.assertIsNone(SourceCache.function(self.sample, "assigned"))
+        self.assertTrue(SourceCache.is_implemented(self.sample, "assigned"))
+        self.assertTrue(SourceCache.uses_lambda_with(self.sample, "assigned", "map", "sorted"))
+        self.assertFalse(SourceCache.uses_lambda_with(self.sample, "assigned", "filter"))
+
+    def test_missing_function(self):
+        self.assertEqual(SourceCache.source(self.sample, "absent"), "")
+        self.assertFalse(SourceCache.is_implemented(self.sample, "absent"))
+        self.assertFalse(SourceCache.uses_lambda_with(self.sample, "absent"))
+
+    def test_skeleton_demonstrations_use_lambdas(self):
+        module = SourceCache.module()
+        for name, builtin in (("demonstrate_player_transformations", "map"),
+                              ("demonstrate_entity_filtering", "filter"),
+                              ("demonstrate_item_sorting", "sorted")):
+            self.assertTrue(SourceCache.is_implemented(module, name))
+            self.assertTrue(SourceCache.uses_lambda_with(module, name, builtin))
+
+
+if __name__ == '__main__':
+    unittest.main()
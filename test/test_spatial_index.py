@@ -0,0 +1,65 @@
+"""
+Tests for the spatial grid used by entity filtering.
+"""
+
+import unittest
+from spatial_index import SpatialGrid
+
+
+def brute_force_radius(points, x, y, radius):
+    """Reference radius query over a dict of id -> (x, y)."""
+    return sorted(i for i, (px, py) in points.items() if (px - x) ** 2 + (py - y) ** 2 <= radius ** 2)
+
+
+class TestSpatialGrid(unittest.TestCase):
+    def setUp(self):
+        self.points = {
+            "E1": (120, 80), "E2": (300, 300), "E3": (90, 150),
+            "E4": (-40, -10), "E5": (100, 100), "E6": (199, 101),
+        }
+        self.grid = SpatialGrid(cell_size=50)
+        for entity_id, (x, y) in self.points.items():
+            self.grid.insert(entity_id, x, y)
+
+    def test_radius_matches_brute_force(self):
+        for x, y, radius in [(100, 100, 100), (0, 0, 50), (300, 300, 0), (150, 150, 500)]:
+            self.assertEqual(sorted(self.grid.query_radius(x, y, radius)),
+                             brute_force_radius(self.points, x, y, radius))
+
+    def test_quadrant_query(self):
+        self.assertEqual(sorted(self.grid.query_quadrant(100, 100, "northeast")), ["E2", "E6"])
+        self.assertEqual(sorted(self.grid.query_quadrant(100, 100, "southwest")), ["E4"])
+        with self.assertRaises(ValueError):
+            self.grid.query_quadrant(0, 0, "up")
+
+    def test_incremental_move_and_remove(self):
+        self.grid.move("E2", 110, 110)
+        self.points["E2"] = (110, 110)
+        self.assertEqual(sorted(self.grid.query_radius(100, 100, 20)), ["E2", "E5"])
+        self.grid.remove("E5")
+        del self.points["E5"]
+        self.assertEqual(sorted(self.grid.query_radius(100, 100, 20)), ["E2"])
+        self.assertEqual(len(self.grid), len(self.points))
+        with self.assertRaises(KeyError):
+            self.grid.move("E5", 0, 0)
+
+    def test_from_entities(self):
+        entities = [{"id": k, "type": "enemy", "position_x": x, "position_y": y, "active": True}
+                    for k, (x, y) in self.points.items()]
+        grid = SpatialGrid.from_entities(entities, cell_size=25)
+        found = sorted(entities[row]["id"] for row in grid.query_radius(100, 100, 100))
+        self.assertEqual(found, brute_force_radius(self.points, 100, 100, 100))
+
+    def test_from_entities_keys_rows(self):
+        entities = [{"id": "E1", "position_x": 10, "position_y": 10},
+                    {"id": "E1", "position_x": 12, "position_y": 12},
+                    {"id": None, "position_x": 500, "position_y": 500}]
+        grid = SpatialGrid.from_entities(entities)
+        self.assertEqual(sorted(grid.query_radius(10, 10, 5)), [0, 1])
+        self.assertEqual(len(grid), 3)
+        grid = SpatialGrid.from_entities(entities, rows=[1, 2])
+        self.assertEqual(grid.query_radius(10, 10, 5), [1])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,90 @@
+"""
+Tests for the lazy streaming pipeline stages.
+"""
+
+import json
+import os
+import tempfile
+import unittest
+import skeleton
+from streaming import (
+    RejectionLog, iter_valid, player_transformation_stream, score_range,
+    normalized_score_stream, entity_filter_stream, sorted_stage
+)
+from validation import PLAYER_SCHEMA
+
+
+def write_jsonl(records):
+    handle = tempfile.NamedTemporaryFile("w", suffix=".jsonl", delete=False)
+    with handle:
+        for record in records:
+            handle.write(json.dumps(record) + "\n")
+    return handle.name
+
+
+class TestStreaming(unittest.TestCase):
+    def setUp(self):
+        self.players = skeleton.prepare_player_data()
+        self.entities = skeleton.prepare_entity_data()
+        self.player_path = write_jsonl(self.players + [{"name": "Broken"}])
+        self.coordinate_path = write_jsonl(skeleton.prepare_coordinate_data())
+
+    def tearDown(self):
+        os.remove(self.player_path)
+        os.remove(self.coordinate_path)
+
+    def test_prepare_functions_stream_from_source(self):
+        stream = skeleton.prepare_player_data(self.player_path, lazy=True)
+        self.assertNotIsInstance(stream, list)
+        self.assertEqual(next(stream), self.players[0])
+        stream.close()
+        self.assertEqual(skeleton.prepare_player_data(self.player_path)[:-1], self.players)
+        self.assertEqual(skeleton.prepare_coordinate_data(self.coordinate_path),
+                         skeleton.prepare_coordinate_data())
+
+    def test_validation_is_lazy_and_logged(self):
+        def source():
+            yield self.players[0]
+            yield "bad"
+            raise AssertionError("stream read too far")
+        rejections = RejectionLog(limit=1)
+        stream = iter_valid(source(), PLAYER_SCHEMA, rejections)
+        self.assertEqual(next(stream), self.players[0])
+        stats = player_transformation_stream(skeleton.prepare_player_data(self.player_path, lazy=True), rejections)
+        self.assertEqual(next(stats), ("Aria", 460, 18.0, 326.0))
+        list(stats)
+        self.assertEqual(rejections.count, 1)
+
+    def test_streams_match_demonstration(self):
+        demo = skeleton.demonstrate_player_transformations(self.players, quiet=True)
+        names, health, regen, power = zip(*player_transformation_stream(iter(self.players)))
+        self.assertEqual(list(names), demo["names"])
+        self.assertEqual(list(health), list(demo["effective_health"]))
+        self.assertEqual(list(regen), list(demo["mana_regen"]))
+        self.assertEqual(list(power), list(demo["power_index"]))
+        scores = dict(normalized_score_stream(iter(self.players), *score_range(iter(self.players))))
+        self.assertEqual(list(scores.values()), list(demo["normalized_score"]))
+
+    def test_normalized_scores_use_two_passes(self):
+        low, high = score_range(skeleton.prepare_player_data(self.player_path, lazy=True))
+        self.assertEqual((low, high), (600, 9100))
+        scores = dict(normalized_score_stream(skeleton.prepare_player_data(self.player_path, lazy=True), low, high))
+        self.assertEqual(scores["Cyra"], 1.0)
+        self.assertEqual(scores["Dax"], 0.0)
+
+    def test_entity_filter_categories(self):
+        categories = {}
+        for category, entity in entity_filter_stream(iter(self.entities)):
+            categories.setdefault(category, []).append(entity["id"])
+        self.assertEqual(categories["active_enemy"], ["E1", "E4", "E7", "E10"])
+        self.assertEqual(categories["collectible"], ["E2", "E9"])
+        self.assertEqual(categories["nearby"], ["E1", "E2", "E4", "E7", "E9"])
+        self.assertEqual(categories["northeast_target"], ["E1", "E4", "E10"])
+
+    def test_sorted_stage_with_limit(self):
+        top = sorted_stage(iter(self.players), key=lambda p: p["score"], reverse=True, limit=2)
+        self.assertEqual([p["name"] for p in top], ["Cyra", "Elowen"])
+
+
+if __name__ == '__main__':
+    unittest.main()
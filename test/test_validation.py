@@ -0,0 +1,79 @@
+"""
+Tests for schema validation and its per-collection cache.
+"""
+
+import unittest
+from unittest import mock
+import validation
+from validation import Schema, validate_records, clear_validation_cache, PLAYER_SCHEMA, PLAYER_STATS_SCHEMA
+
+
+class TestValidateRecords(unittest.TestCase):
+    def setUp(self):
+        clear_validation_cache()
+        self.players = [
+            {"name": "Valid", "level": 5, "health": 100, "mana": 50, "score": 1000},
+            {"name": "Invalid"},
+            "not a dict",
+            {"name": "Another Valid", "level": 3, "health": 80, "mana": 40, "score": 800},
+        ]
+
+    def test_valid_records_and_report(self):
+        result = validate_records(self.players, PLAYER_SCHEMA)
+        self.assertEqual([p["name"] for p in result.valid], ["Valid", "Another Valid"])
+        self.assertEqual([index for index, _ in result.rejected], [1, 2])
+        self.assertIn("missing keys: level, health, mana, score", result.rejected[0][1])
+        self.assertEqual(result.report()[1], "player[2]: expected a mapping, got str")
+
+    def test_cache_is_opt_in(self):
+        validate_records(self.players, PLAYER_SCHEMA)
+        self.assertEqual(len(validation._cache), 0)
+
+    def test_cached_per_collection_and_schema(self):
+        first = validate_records(self.players, PLAYER_SCHEMA, use_cache=True)
+        with mock.patch.object(Schema, "check", side_effect=AssertionError("rescanned")):
+            second = validate_records(self.players, PLAYER_SCHEMA, use_cache=True)
+        self.assertEqual(second.valid, first.valid)
+        self.assertEqual(second.rejected, first.rejected)
+        validate_records(list(self.players), PLAYER_SCHEMA, use_cache=True)
+        self.assertEqual(len(validation._cache), 2)
+
+    def test_cached_results_are_shared_and_frozen(self):
+        first = validate_records(self.players, PLAYER_SCHEMA, use_cache=True)
+        self.assertIs(validate_records(self.players, PLAYER_SCHEMA, use_cache=True), first)
+        self.assertIsInstance(first.valid, tuple)
+        self.assertIsInstance(first.rejected, tuple)
+        self.assertIsInstance(validate_records(self.players, PLAYER_SCHEMA).valid, list)
+
+    def test_cache_invalidated_by_length_and_clear(self):
+        first = validate_records(self.players, PLAYER_SCHEMA, use_cache=True)
+        self.players.append({"name": "New", "level": 1, "health": 10, "mana": 5, "score": 1})
+        second = validate_records(self.players, PLAYER_SCHEMA, use_cache=True)
+        self.assertEqual(len(second.valid), 3)
+        # Replacing a record keeps the length, so the cache must be cleared.
+        self.players[1] = {"name": "Fixed", "level": 2, "health": 20, "mana": 10, "score": 2}
+        self.assertIs(validate_records(self.players, PLAYER_SCHEMA, use_cache=True), second)
+        clear_validation_cache()
+        third = validate_records(self.players, PLAYER_SCHEMA, use_cache=True)
+        self.assertEqual([p["name"] for p in third.valid], ["Valid", "Fixed", "Another Valid", "New"])
+        self.assertEqual(len(first.valid), 2)
+
+    def test_subset_schema_rechecks_only_rejected(self):
+        self.players.append({"name": "No Score", "level": 1, "health": 10, "mana": 5})
+        validate_records(self.players, PLAYER_SCHEMA, use_cache=True)
+        with mock.patch.object(Schema, "check", autospec=True, side_effect=Schema.check) as check:
+            stats = validate_records(self.players, PLAYER_STATS_SCHEMA, use_cache=True)
+        self.assertEqual(check.call_count, 3)
+        self.assertEqual([p["name"] for p in stats.valid], ["Valid", "Another Valid", "No Score"])
+        self.assertEqual([index for index, _ in stats.rejected], [1, 2])
+        self.assertEqual(stats.schema, PLAYER_STATS_SCHEMA)
+        self.assertEqual(stats.valid, tuple(validate_records(self.players, PLAYER_STATS_SCHEMA).valid))
+
+    def test_cache_is_bounded(self):
+        for _ in range(validation.CACHE_SIZE + 10):
+            validate_records([{}], PLAYER_SCHEMA, use_cache=True)
+        self.assertLessEqual(len(validation._cache), validation.CACHE_SIZE)
+
+
+if __name__ == '__main__':
+    unittest.main()
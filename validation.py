@@ -0,0 +1,188 @@
+"""
+Record Validation
+
+This module checks game records against compiled schemas. Callers that feed
+the same list to several systems can opt in to a per-collection cache so the
+list is not rescanned, and a check against a schema whose keys are a subset
+of an already cached one only rechecks the records that one rejected. Every
+result also reports which records were rejected and why.
+"""
+
+from collections import OrderedDict
+from collections.abc import Mapping
+
+CACHE_SIZE = 64
+
+
+class Schema:
+    """
+    Compiled description of the keys a record must provide.
+
+    Schemas are immutable and hashable so they can key the validation cache.
+    """
+
+    __slots__ = ("name", "required_keys", "_required")
+
+    def __init__(self, name, required_keys):
+        """
+        Compile a schema.
+
+        Args:
+            name (str): Name used in rejection reports
+            required_keys (iterable): Keys every valid record must contain
+        """
+        self.name = name
+        self.required_keys = tuple(required_keys)
+        self._required = frozenset(self.required_keys)
+
+    def __repr__(self):
+        return f"Schema({self.name!r}, {list(self.required_keys)!r})"
+
+    def check(self, record):
+        """
+        Check one record.
+
+        Returns:
+            str: None if the record is valid, otherwise the rejection reason
+        """
+        if not isinstance(record, Mapping):
+            return f"expected a mapping, got {type(record).__name__}"
+        if isinstance(record, dict):
+            if self._required <= record.keys():
+                return None
+        elif all(key in record for key in self.required_keys):
+            return None
+        missing = [key for key in self.required_keys if key not in record]
+        return "missing keys: " + ", ".join(missing)
+
+
+PLAYER_SCHEMA = Schema("player", ["name", "level", "health", "mana", "score"])
+PLAYER_STATS_SCHEMA = Schema("player_stats", ["name", "level", "health", "mana"])
+ENTITY_SCHEMA = Schema("entity", ["id", "type", "position_x", "position_y", "active"])
+ITEM_SCHEMA = Schema("item", ["name", "type", "value", "rarity", "equipped"])
+
+
+class ValidationResult:
+    """
+    Outcome of validating a collection against a schema.
+
+    Attributes:
+        schema (Schema): Schema the records were checked against
+        valid (list): Records that passed, in input order
+        rejected (list): (index, reason) tuples for records that failed
+    """
+
+    __slots__ = ("schema", "valid", "rejected")
+
+    def __init__(self, schema, valid, rejected):
+        self.schema = schema
+        self.valid = valid
+        self.rejected = rejected
+
+    def __repr__(self):
+        return (f"ValidationResult({self.schema.name!r}, valid={len(self.valid)}, "
+                f"rejected={len(self.rejected)})")
+
+    def report(self):
+        """Return one human-readable line per rejected record."""
+        return [f"{self.schema.name}[{index}]: {reason}" for index, reason in self.rejected]
+
+    def frozen(self):
+        """Return a result whose valid and rejected sequences are tuples."""
+        if isinstance(self.valid, tuple) and isinstance(self.rejected, tuple):
+            return self
+        return ValidationResult(self.schema, tuple(self.valid), tuple(self.rejected))
+
+
+_cache = OrderedDict()
+
+
+def _check_all(records, schema):
+    valid = []
+    rejected = []
+    check = schema.check
+    for index, record in enumerate(records):
+        reason = check(record)
+        if reason is None:
+            valid.append(record)
+        else:
+            rejected.append((index, reason))
+    return ValidationResult(schema, valid, rejected)
+
+
+def _derive(records, schema, base):
+    """
+    Validate records against schema given their result for a stricter schema.
+
+    Every record valid under base.schema is valid under schema, so only the
+    records base rejected are checked again.
+    """
+    check = schema.check
+    rejected = []
+    for index, _ in base.rejected:
+        reason = check(records[index])
+        if reason is not None:
+            rejected.append((index, reason))
+    if len(rejected) == len(base.rejected):
+        return ValidationResult(schema, base.valid, tuple(rejected))
+    skip = {index for index, _ in rejected}
+    valid = tuple(record for index, record in enumerate(records) if index not in skip)
+    return ValidationResult(schema, valid, tuple(rejected))
+
+
+def _cached(records, schema):
+    """Return the cached entry for records and schema, or a stricter schema's."""
+    entry = _cache.get((id(records), schema))
+    if entry is not None:
+        return entry
+    for (records_id, cached_schema), entry in _cache.items():
+        if records_id == id(records) and schema._required <= cached_schema._required:
+            return entry
+    return None
+
+
+def validate_records(records, schema, use_cache=False):
+    """
+    Validate a list of records, optionally reusing a cached result when the
+    same list was already checked against the same schema.
+
+    A cached result is reused, in constant time, while the same list object
+    has the same length. Replacing records or editing their keys in place is
+    not detected, so call clear_validation_cache() after doing that. A list
+    cached against a schema whose required keys include all of this schema's
+    only has its rejected records checked again. Cached results are shared,
+    so their valid and rejected sequences are tuples.
+
+    Args:
+        records (list): Records to validate
+        schema (Schema): Schema to check each record against
+        use_cache (bool): Whether to consult and populate the cache, which
+            keeps references to up to CACHE_SIZE lists
+
+    Returns:
+        ValidationResult: Valid records and rejection report
+    """
+    if not use_cache:
+        return _check_all(records, schema)
+
+    key = (id(records), schema)
+    entry = _cached(records, schema)
+    if entry is not None and entry[0] is records and entry[1] == len(records):
+        if entry[2].schema is schema:
+            _cache.move_to_end(key)
+            return entry[2]
+        result = _derive(records, schema, entry[2])
+    else:
+        result = _check_all(records, schema).frozen()
+
+    # The entry holds a reference to the list so its id cannot be reused.
+    _cache[key] = (records, len(records), result)
+    _cache.move_to_end(key)
+    while len(_cache) > CACHE_SIZE:
+        _cache.popitem(last=False)
+    return result
+
+
+def clear_validation_cache():
+    """Drop every cached validation result."""
+    _cache.clear()